@@ -30,10 +30,43 @@ class Settings(BaseSettings):
     primary_llm_model: str = "claude-sonnet-4-6"
     fast_llm_model: str = "claude-haiku-4-5-20251001"
     gemini_model: str = "gemini-2.0-flash"
+    # Criteria extraction: sections whose prompt exceeds this many input tokens
+    # are split at criterion boundaries (keeps each response within max_tokens),
+    # and up to extraction_llm_concurrency chunks are extracted at once
+    extraction_chunk_tokens: int = 4000
+    extraction_llm_concurrency: int = 4
+    # Cleanly numbered inclusion/exclusion lists are cut into criteria locally
+    # when their structural confidence reaches extraction_parse_min_confidence
+    # (1.0 for lists parsed without doubt and numbered strictly in sequence, else
+    # 0.0); only the protocol metadata is then asked of fast_llm_model (if enabled)
+    extraction_parse_lists: bool = True
+    extraction_parse_min_confidence: float = 0.95
+    extraction_parse_metadata: bool = True
 
     # PDF / OCR
     ocr_quality_threshold: int = 100  # chars/page below which OCR is triggered
     tesseract_cmd: str = ""
+    ocr_backend: str = "pytesseract"  # "pytesseract" | "tesserocr" (persistent in-process engine)
+    ocr_language: str = "eng"
+    ocr_workers: int = 4  # concurrent Tesseract calls per process; 0 = one per CPU core
+    ocr_max_inflight_pages: int = 8  # rendered pages allowed to wait for OCR at once
+    # OCR render resolutions, tried lowest first; a page moves to the next tier
+    # while its mean Tesseract confidence is below ocr_escalation_confidence.
+    ocr_dpi_tiers: list[int] = [200, 300]
+    ocr_escalation_confidence: float = 0.80
+    # Pre-OCR triage on a thumbnail: skip pages whose ink coverage (share of
+    # pixels clearly darker than the page background) says blank or figure
+    ocr_triage_enabled: bool = True
+    ocr_triage_dpi: int = 36
+    ocr_triage_blank_ink: float = 0.0015
+    ocr_triage_figure_ink: float = 0.45
+    # Page extraction processes; 1 = in-process, 0 = one per CPU core
+    extraction_workers: int = 1
+    extraction_parallel_min_pages: int = 50  # smaller documents always run in-process
+    # Locate-first: extract the TOC pages + outline, locate the eligibility
+    # section, then extract only that window (widened on failure) instead of
+    # every page.
+    locate_first: bool = True
 
     # API
     api_host: str = "0.0.0.0"
@@ -48,6 +81,15 @@ class Settings(BaseSettings):
     # Storage
     upload_dir: Path = Path("/tmp/docu-flow/uploads")
     results_dir: Path = Path("/tmp/docu-flow/results")
+    # ParsedDocument cache under results_dir, keyed by PDF hash + extractor version
+    parsed_cache_enabled: bool = True
+    parsed_cache_max_mb: int = 512
+    # OCR results per rendered page (shared across documents), under results_dir
+    ocr_cache_enabled: bool = True
+    ocr_cache_max_mb: int = 256
+    # LLM section-location answers, keyed by PDF hash, under results_dir
+    locate_cache_enabled: bool = True
+    locate_cache_max_mb: int = 16
 
     # Logging
     log_level: str = "INFO"
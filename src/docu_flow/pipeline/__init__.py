@@ -5,6 +5,7 @@ from docu_flow.pipeline.criteria_extractor import extract_criteria
 from docu_flow.pipeline.ranker import rank_disqualifiers
 from docu_flow.pipeline.screener import screen_patient
 from docu_flow.pipeline.orchestrator import run_protocol_pipeline
+from docu_flow.pipeline.session import DocumentSession
 
 __all__ = [
     "classify_pdf",
@@ -14,4 +15,5 @@ __all__ = [
     "rank_disqualifiers",
     "screen_patient",
     "run_protocol_pipeline",
+    "DocumentSession",
 ]
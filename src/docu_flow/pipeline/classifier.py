@@ -3,11 +3,16 @@ Step 1 — Classify the PDF type (text / scanned / hybrid / encrypted).
 
 Decision logic:
   - Try to open with PyMuPDF.
-  - For each page sample the text character count.
+  - For each sampled page, read its structural kind from the page resources:
+    a page without fonts is image-only and counts as bad with no text
+    extraction at all. Other pages are judged on their native char count.
   - If avg chars/page < OCR_QUALITY_THRESHOLD  → scanned
-  - If some pages are good and some are bad     → hybrid
+  - If some pages are good and some are bad     → hybrid (stop sampling)
   - If all pages have good text                 → text
   - If PyMuPDF raises a permissions error       → encrypted
+
+When a DocumentSession is supplied the sampled page text and page kinds are
+memoised on it, so the extractor does not pull those pages a second time.
 """
 
 from pathlib import Path
@@ -16,38 +21,54 @@ import fitz  # PyMuPDF
 
 from docu_flow.config import settings
 from docu_flow.logging import log
-from docu_flow.schemas.pdf import PDFType
+from docu_flow.pipeline.session import DocumentSession
+from docu_flow.schemas.pdf import PDFType, PageKind
+
 
+def classify_pdf(pdf_path: Path, session: DocumentSession | None = None) -> PDFType:
+    """Return the PDFType for *pdf_path*, reusing *session* if one is open."""
+    owns_session = session is None
+    if session is None:
+        try:
+            doc = fitz.open(str(pdf_path))
+        except fitz.FileDataError:
+            log.warning("classify_pdf.open_failed", path=str(pdf_path))
+            return PDFType.UNKNOWN
+        session = DocumentSession(pdf_path, doc)
 
-def classify_pdf(pdf_path: Path) -> PDFType:
-    """Return the PDFType for *pdf_path*."""
     try:
-        doc = fitz.open(str(pdf_path))
-    except fitz.FileDataError:
-        log.warning("classify_pdf.open_failed", path=str(pdf_path))
-        return PDFType.UNKNOWN
+        return _classify(session)
+    finally:
+        if owns_session:
+            session.close()
 
-    if doc.is_encrypted:
+
+def _classify(session: DocumentSession) -> PDFType:
+    pdf_path = session.pdf_path
+    if session.doc.is_encrypted:
         log.info("classify_pdf.encrypted", path=str(pdf_path))
         return PDFType.ENCRYPTED
 
-    total_pages = len(doc)
+    total_pages = session.page_count
     if total_pages == 0:
         return PDFType.UNKNOWN
 
     # Sample up to 10 evenly-spaced pages to keep this fast.
     sample_indices = _sample_indices(total_pages, n=10)
-    char_counts = []
-    for i in sample_indices:
-        page = doc[i]
-        text = page.get_text("text")
-        char_counts.append(len(text))
-
-    doc.close()
-
     threshold = settings.ocr_quality_threshold
-    good = sum(1 for c in char_counts if c >= threshold)
-    bad = sum(1 for c in char_counts if c < threshold)
+    good = bad = image_pages = sampled = 0
+
+    for i in sample_indices:
+        sampled += 1
+        if session.page_kind(i) == PageKind.IMAGE:
+            image_pages += 1
+            bad += 1
+        elif len(session.page_text(i)) >= threshold:
+            good += 1
+        else:
+            bad += 1
+        if good and bad:
+            break  # already known to be HYBRID
 
     if bad == 0:
         pdf_type = PDFType.TEXT
@@ -60,9 +81,10 @@ def classify_pdf(pdf_path: Path) -> PDFType:
         "classify_pdf.result",
         path=str(pdf_path),
         pdf_type=pdf_type,
-        sampled_pages=len(sample_indices),
+        sampled_pages=sampled,
         good_pages=good,
         bad_pages=bad,
+        image_pages=image_pages,
     )
     return pdf_type
 
@@ -1,24 +1,53 @@
 """
-Step 4 — LLM-based extraction of eligibility criteria.
+Step 4 — Extraction of eligibility criteria.
 
 Sends the targeted section text to the primary LLM and returns a structured
-ExtractedCriteria object grounded in source page references.
+ExtractedCriteria object grounded in source page references. Every section
+line is numbered locally; the model answers with line spans and criterion
+types instead of retyping each criterion, and the criterion text and source
+page are rebuilt here from the cited lines. The temporal/numeric/conditional/
+ambiguous flags are set locally by pipeline.flagger, not by the model.
+
+Running headers, footers and page stamps — lines that recur at the top or
+bottom of most pages — are stripped before prompting; the characters and
+prompt tokens (counted with and without them) saved are recorded in
+ExtractionMetadata.
+
+Inclusion and exclusion lists are extracted by separate concurrent calls.
+Lists whose prompt exceeds settings.extraction_chunk_tokens (counted with the
+token-counting endpoint) are further split at criterion boundaries; every
+chunk is extracted concurrently and the results merged with duplicates removed.
+
+Well-structured sections skip the primary model: when both lists are plain
+"1. 2. 3." sequences that can be cut without doubt (structural confidence at
+least settings.extraction_parse_min_confidence), criteria are cut locally at
+their numbers and only the protocol metadata is asked of the fast model,
+from the first two pages.
 
 Hallucination mitigation:
-  - System prompt instructs the model to cite the source page for every criterion.
-  - Any criterion without a source page is flagged as unverified.
+  - Criterion text is copied from the cited lines, so quotes are exact, and the
+    source page is that of the first cited line.
+  - Spans outside the section are skipped with a warning; a criterion returned
+    as text without a source page is flagged as unverified.
   - Output is validated by Pydantic; schema mismatches raise ExtractionError.
 """
 
 from __future__ import annotations
 
 import json
+import re
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
 
 from anthropic import BadRequestError
 from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 
 from docu_flow.config import settings
 from docu_flow.logging import log
+from docu_flow.pipeline.flagger import flag_criteria
+from docu_flow.pipeline.section_locator import split_criteria_lists
 from docu_flow.schemas.criteria import (
     CriterionType,
     EligibilityCriterion,
@@ -37,36 +66,80 @@ class ExtractionError(RuntimeError):
 # Public API
 # ---------------------------------------------------------------------------
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_not_exception_type(BadRequestError),
-)
 def extract_criteria(
     document: ParsedDocument,
     section_pages: list[PageText],
 ) -> ExtractedCriteria:
-    """Call the LLM to extract structured eligibility criteria from *section_pages*."""
+    """
+    Call the LLM to extract structured eligibility criteria from *section_pages*.
 
-    section_text = _build_section_text(section_pages)
-    prompt = _build_extraction_prompt(section_text)
+    The section is split at the exclusion-criteria heading and the two lists
+    are extracted by concurrent calls — latency is dominated by output
+    tokens, which one response generates serially. A token-count pre-flight
+    further splits lists over settings.extraction_chunk_tokens at criterion
+    boundaries; all chunks run concurrently and are merged in reading order.
+
+    Cleanly numbered inclusion and exclusion lists are parsed without the
+    primary model (see _parse_numbered_list).
+    """
+
+    # Detect repeats over every extracted page — a short section alone is too few
+    boilerplate = _boilerplate_lines(document.pages or section_pages)
+    split = split_criteria_lists(section_pages)
+    lists = split or (section_pages,)
+    texts, tables, chars_removed = _number_lists(lists, boilerplate)
+    lines = [line for table in tables for line in table]  # one table, so chunks share it
+    section_text = "\n".join(texts)
+
+    if settings.extraction_parse_lists and split is not None:
+        parsed = [_parse_numbered_list(table) for table in tables]
+        confidence = _structural_confidence([items for _, items in parsed])
+        if confidence >= settings.extraction_parse_min_confidence:
+            extracted = _extract_parsed(document, parsed, lines, confidence)
+            extracted.metadata.boilerplate_chars_removed = chars_removed
+            return extracted  # nothing was prompted, so no prompt tokens were saved
+        log.info("criteria_extractor.parse_low_confidence", confidence=round(confidence, 3))
 
     client = get_client()
-    log.info("criteria_extractor.calling_llm", model=settings.primary_llm_model, chars=len(section_text))
+    if chars_removed:
+        # Count the prompt as it would have been with boilerplate kept, alongside the real one
+        raw_text = "\n".join(_number_lists(lists, frozenset())[0])
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="count") as pool:
+            raw_count = pool.submit(_count_prompt_tokens, client, raw_text)
+            prompt_tokens = _count_prompt_tokens(client, section_text)
+            tokens_saved = max(0, raw_count.result() - prompt_tokens)
+    else:
+        prompt_tokens = _count_prompt_tokens(client, section_text)
+        tokens_saved = 0
+    chunks = texts or [section_text]
+    if prompt_tokens > settings.extraction_chunk_tokens:
+        # Measured chars/token of this prompt; the instructions and schema repeat per chunk
+        chars_per_token = len(_build_extraction_prompt(section_text)) / prompt_tokens
+        overhead = len(_build_extraction_prompt(""))
+        budget = int(settings.extraction_chunk_tokens * chars_per_token) - overhead
+        chunks = [chunk for text in chunks for chunk in _split_section(text, max(budget, overhead))]
+    log.info(
+        "criteria_extractor.calling_llm",
+        model=settings.primary_llm_model,
+        chars=len(section_text),
+        boilerplate_chars_removed=chars_removed,
+        prompt_tokens=prompt_tokens,
+        lists=len(texts),
+        chunks=len(chunks),
+    )
 
-    try:
-        response = client.messages.create(
-            model=settings.primary_llm_model,
-            max_tokens=8192,
-            system=_SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": prompt}],
-        )
-    except BadRequestError as exc:
-        log.error("criteria_extractor.bad_request", error=str(exc), model=settings.primary_llm_model)
-        raise
+    if len(chunks) == 1:
+        responses = [_request_extraction(client, chunks[0])]
+    else:
+        workers = min(len(chunks), max(1, settings.extraction_llm_concurrency))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract") as pool:
+            responses = list(pool.map(lambda chunk: _request_extraction(client, chunk), chunks))
 
-    raw_text = response.content[0].text.strip()
-    return _parse_llm_response(raw_text, document)
+    extracted = _merge_responses(responses, {line.number: line for line in lines})
+    extracted.metadata.boilerplate_chars_removed = chars_removed
+    extracted.metadata.tokens_saved = tokens_saved
+    extracted.metadata.chunk_count = len(chunks)
+    return extracted
 
 
 # ---------------------------------------------------------------------------
@@ -78,21 +151,128 @@ You are a clinical trial protocol analyst. Extract eligibility criteria from the
 provided protocol section.
 
 Rules:
-1. Extract EVERY inclusion and exclusion criterion verbatim.
-2. For each criterion, cite the page number from which it was extracted.
-3. Flag criteria with temporal conditions, numeric thresholds, or conditional logic.
-4. Flag criteria with ambiguous language (e.g. "clinically significant").
-5. Do NOT invent, infer, or paraphrase. Only extract what is explicitly stated.
-6. Output ONLY valid JSON matching the schema. No prose outside the JSON.
+1. Extract EVERY inclusion and exclusion criterion.
+2. Each section line starts with its number in brackets, e.g. "[12]". Give each
+   criterion as "lines": [first, last] — the numbers of the first and last lines
+   of its full text, including wrapped lines and sub-items. Do NOT retype the text.
+3. Do NOT invent or infer criteria. Only cite lines that explicitly state one.
+4. Output ONLY valid JSON matching the schema. No prose outside the JSON.
 """
 
 
-def _build_section_text(pages: list[PageText]) -> str:
-    parts = []
+# Boilerplate: lines among the first/last _EDGE_LINES non-blank lines of a
+# page that recur, digits ignored, in the same zone on at least
+# _BOILERPLATE_MIN_SHARE of the pages (and never fewer than _BOILERPLATE_MIN_PAGES)
+_EDGE_LINES = 3
+_BOILERPLATE_MIN_PAGES = 3
+_BOILERPLATE_MIN_SHARE = 0.5
+_DIGITS = re.compile(r"\d+")
+
+# Rough average for English prose; used only when token counting fails
+_CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class _SectionLine:
+    """One numbered line of the section text sent to the model."""
+    number: int
+    page_number: int
+    text: str
+
+
+def _build_section_text(
+    pages: list[PageText],
+    boilerplate: frozenset[tuple[str, str]] = frozenset(),
+    first_line: int = 1,
+) -> tuple[str, list[_SectionLine], int]:
+    """
+    Render *pages* for the prompt, minus *boilerplate* and blank lines.
+
+    Each page opens with a "--- PAGE n ---" marker and every remaining line
+    is prefixed "[k] ", numbered from *first_line*. Returns (text, the
+    numbered lines, chars of boilerplate removed).
+    """
+    parts: list[str] = []
+    lines: list[_SectionLine] = []
+    removed = 0
     for page in pages:
-        if page.text.strip():
-            parts.append(f"--- PAGE {page.page_number} ---\n{page.text}")
-    return "\n\n".join(parts)
+        text, page_removed = _strip_boilerplate(page.text, boilerplate)
+        removed += page_removed
+        # Newlines only: splitlines() also breaks at form feeds and other
+        # control characters, which garbled text layers contain mid-line
+        page_lines = [line for line in text.split("\n") if line.strip()]
+        if not page_lines:
+            continue
+        parts.append(f"--- PAGE {page.page_number} ---")
+        for line in page_lines:
+            number = first_line + len(lines)
+            lines.append(_SectionLine(number, page.page_number, line))  # as in the source
+            parts.append(f"[{number}] {line.rstrip()}")
+    return "\n".join(parts), lines, removed
+
+
+def _number_lists(
+    lists: Sequence[list[PageText]],
+    boilerplate: frozenset[tuple[str, str]],
+) -> tuple[list[str], list[list[_SectionLine]], int]:
+    """
+    Render each of *lists* with _build_section_text, numbering lines across all.
+
+    Returns (the non-empty texts, each list's numbered lines, chars of
+    boilerplate removed).
+    """
+    texts: list[str] = []
+    tables: list[list[_SectionLine]] = []
+    numbered = 0
+    removed = 0
+    for pages in lists:
+        text, lines, list_removed = _build_section_text(pages, boilerplate, numbered + 1)
+        if text:
+            texts.append(text)
+        tables.append(lines)
+        numbered += len(lines)
+        removed += list_removed
+    return texts, tables, removed
+
+
+def _edge_zones(text: str) -> tuple[list[str], dict[int, str]]:
+    """Return the page's lines and {line index: "top" | "bottom"} for its edge lines."""
+    lines = text.split("\n")
+    content = [i for i, line in enumerate(lines) if line.strip()]
+    zones = {i: "bottom" for i in content[-_EDGE_LINES:]}
+    zones.update({i: "top" for i in content[:_EDGE_LINES]})
+    return lines, zones
+
+
+def _boilerplate_key(line: str) -> str:
+    """Normalise a line so page stamps match across pages ("Page 3 of 80" → "page # of #")."""
+    return " ".join(_DIGITS.sub("#", line.lower()).split())
+
+
+def _boilerplate_lines(pages: list[PageText]) -> frozenset[tuple[str, str]]:
+    """(zone, normalised line) pairs that repeat at the same edge across *pages*."""
+    texts = [p.text for p in pages if p.text.strip()]
+    threshold = max(_BOILERPLATE_MIN_PAGES, int(len(texts) * _BOILERPLATE_MIN_SHARE + 0.5))
+    if len(texts) < threshold:
+        return frozenset()
+    counts: dict[tuple[str, str], int] = {}
+    for text in texts:
+        lines, zones = _edge_zones(text)
+        for key in {(zone, _boilerplate_key(lines[i])) for i, zone in zones.items()}:
+            counts[key] = counts.get(key, 0) + 1
+    return frozenset(key for key, count in counts.items() if count >= threshold)
+
+
+def _strip_boilerplate(text: str, boilerplate: frozenset[tuple[str, str]]) -> tuple[str, int]:
+    """Drop *boilerplate* edge lines from *text*; return (text, chars removed)."""
+    if not boilerplate:
+        return text, 0
+    lines, zones = _edge_zones(text)
+    drop = {i for i, zone in zones.items() if (zone, _boilerplate_key(lines[i])) in boilerplate}
+    if not drop:
+        return text, 0
+    kept = "\n".join(line for i, line in enumerate(lines) if i not in drop)
+    return kept, len(text) - len(kept)
 
 
 def _build_extraction_prompt(section_text: str) -> str:
@@ -102,15 +282,9 @@ def _build_extraction_prompt(section_text: str) -> str:
         "phase": "string or null",
         "therapeutic_area": "string or null",
         "criteria": [{
-            "id": "inc_001",
             "criterion_type": "inclusion",
-            "text": "verbatim criterion text",
-            "source_page": 46,
+            "lines": [14, 16],
             "source_section": "5.1 Inclusion Criteria",
-            "has_temporal_condition": False,
-            "has_numeric_threshold": False,
-            "has_conditional_logic": False,
-            "is_ambiguous": False,
             "notes": "",
         }],
     }, indent=2)
@@ -121,7 +295,316 @@ def _build_extraction_prompt(section_text: str) -> str:
     )
 
 
-def _parse_llm_response(raw: str, document: ParsedDocument) -> ExtractedCriteria:
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    retry=retry_if_not_exception_type(BadRequestError),
+)
+def _request_extraction(client: Any, section_text: str) -> dict[str, Any]:
+    """One extraction call for *section_text*; returns the parsed JSON object."""
+    try:
+        response = client.messages.create(
+            model=settings.primary_llm_model,
+            max_tokens=8192,
+            system=_SYSTEM_PROMPT,
+            messages=[{"role": "user", "content": _build_extraction_prompt(section_text)}],
+        )
+    except BadRequestError as exc:
+        log.error("criteria_extractor.bad_request", error=str(exc), model=settings.primary_llm_model)
+        raise
+    return _parse_json(response.content[0].text.strip())
+
+
+def _count_prompt_tokens(client: Any, section_text: str) -> int:
+    """Input tokens of the extraction prompt for *section_text*, estimated if counting fails."""
+    try:
+        result = client.messages.count_tokens(
+            model=settings.primary_llm_model,
+            system=_SYSTEM_PROMPT,
+            messages=[{"role": "user", "content": _build_extraction_prompt(section_text)}],
+        )
+        return int(result.input_tokens)
+    except Exception as exc:  # noqa: BLE001
+        log.warning("criteria_extractor.count_tokens_failed", error=str(exc))
+        return len(_build_extraction_prompt(section_text)) // _CHARS_PER_TOKEN
+
+
+# Chunk boundaries: numbered criteria (same shape the section locator counts)
+# and inclusion/exclusion list headings. Page markers are not boundaries — a
+# criterion often continues over a page break — but every chunk opens with
+# the marker of its first page, and one that begins inside a list repeats
+# the list heading so the model still knows the criterion type.
+_CRITERION_START = re.compile(r"^\s*\d{1,3}[.)]\s")
+_PAGE_MARKER = re.compile(r"^--- PAGE (\d+) ---$")
+_LINE_NUMBER = re.compile(r"^\[\d+\] ")
+_LIST_HEADING = re.compile(r"\b(?:inclusion|exclusion)\b", re.IGNORECASE)
+_LIST_HEADING_MAX_WORDS = 8
+
+
+def _split_section(section_text: str, max_chars: int) -> list[str]:
+    """
+    Split *section_text* into chunks of about *max_chars* at criterion boundaries.
+
+    A criterion is cut only when it alone exceeds *max_chars*, and then at
+    line boundaries; a heading stays with the first criterion after it.
+    """
+    blocks: list[tuple[int | None, str | None, list[str]]] = []  # (page, list heading, lines)
+    page: int | None = None
+    heading: str | None = None
+    has_item = False
+    body_size = 0  # chars of the block so far, page markers and list headings aside
+    for line in section_text.split("\n"):
+        marker = _PAGE_MARKER.match(line)
+        content = _LINE_NUMBER.sub("", line)
+        is_item = _CRITERION_START.match(content) is not None
+        is_heading = (
+            not is_item
+            and marker is None
+            and _LIST_HEADING.search(content) is not None
+            and len(content.split()) <= _LIST_HEADING_MAX_WORDS
+        )
+        starts = not blocks or ((is_item or is_heading) and has_item)
+        if starts or (body_size and body_size + len(line) + 1 > max_chars):
+            blocks.append((page, None if is_heading else heading, []))
+            has_item = has_item and not starts  # an oversized criterion runs on
+            body_size = 0
+        if marker:
+            page = int(marker.group(1))
+        if is_heading:
+            heading = content.strip()
+        has_item = has_item or is_item
+        blocks[-1][2].append(line)
+        if not (marker or is_heading):
+            body_size += len(line) + 1
+
+    chunks: list[list[str]] = []
+    size = 0
+    for block_page, block_heading, lines in blocks:
+        block_size = sum(len(line) + 1 for line in lines)
+        if not chunks or size + block_size > max_chars:
+            prefix: list[str] = []
+            if chunks:
+                while chunks[-1] and _PAGE_MARKER.match(chunks[-1][-1]):
+                    chunks[-1].pop()  # re-added below as this chunk's first line
+                if block_page is not None and not _PAGE_MARKER.match(lines[0]):
+                    prefix.append(f"--- PAGE {block_page} ---")
+                if block_heading is not None:
+                    prefix.append(f"{block_heading} (continued)")
+            chunks.append(prefix)
+            size = sum(len(line) + 1 for line in prefix)
+        chunks[-1].extend(lines)
+        size += block_size
+    return ["\n".join(lines).strip("\n") for lines in chunks]
+
+
+# ---------------------------------------------------------------------------
+# Numbered-list parsing — the LLM-free path
+# ---------------------------------------------------------------------------
+
+# A criterion's own number, followed by its text ("12. Have ...", "3) Age ...")
+_ITEM_NUMBER = re.compile(r"^\s*(\d{1,3})[.)]\s+(\S.*)$")
+# A numbered sub-section heading ("5.2.", "5.3 Lifestyle Considerations") ends a list
+_SUBSECTION_HEADING = re.compile(r"^\s*\d+(?:\.\d+)+\.?(?:\s+[A-Z]|\s*$)")
+# Category labels grouping criteria ("Age", "Medical conditions", "Hepatic"):
+# short capitalised lines without closing punctuation, directly before a criterion
+_CATEGORY_MAX_WORDS = 8
+_CATEGORY_END = re.compile(r"[.,;:)]$")
+_CONNECTIVES = frozenset({"or", "and", "and/or"})
+# A line ending like this is complete — what follows may be a label or heading
+_CLOSED_LINE = re.compile(r"[.;:!?)\]]$")
+# A line ending like this runs on — whatever follows is its continuation
+_OPEN_LINE = re.compile(
+    r"(?:[,(/\-]|\b(?:and|or|of|with|without|including|to|than|the|a|an|in|for|by|at|as"
+    r"|such|from|on|per))$",
+    re.IGNORECASE,
+)
+_PARSE_MIN_ITEMS = 2
+
+_ParsedItem = tuple[int, int, int]  # (criterion number, first line, last line)
+
+
+def _parse_numbered_list(lines: list[_SectionLine]) -> tuple[str | None, list[_ParsedItem]]:
+    """
+    Cut one criteria list into numbered items; returns (list heading, items).
+
+    Parsing starts after the first inclusion/exclusion heading (or at the
+    first number when there is none) and ends at a heading: a numbered
+    sub-section ("5.3 ..."), an all-caps line, numbered or not ("6. STUDY
+    INTERVENTION"), or a short capitalised line after a complete criterion
+    that prose, not a criterion, follows ("Lifestyle Considerations").
+    Wrapped lines, sub-items and notes belong to the criterion above them;
+    short capitalised lines between a complete criterion and the next one
+    are category labels and dropped.
+
+    Returns no items when the cut is in doubt — a short capitalised line
+    after an unfinished one may be a wrap or a label, and numbering that
+    continues past the end means the end was misread — so the list goes to
+    the model instead.
+    """
+    heading: str | None = None
+    items: list[list[int]] = []
+    pending: list[str] = []  # category-like lines after items[-1], not yet placed
+    last_text = ""  # the last line placed in items[-1]
+    ended = False
+    for line in lines:
+        content = line.text.strip()
+        number = _ITEM_NUMBER.match(line.text)
+        if number is None and heading is None and _is_list_heading(content):
+            heading = content
+            # Numbers before the heading belong to an earlier list
+            items, pending, ended = [], [], False
+        elif ended:
+            if number and int(number.group(1)) == items[-1][0] + 1:
+                return heading, _parse_doubt("numbering continues past the list end", line)
+        elif number and _is_caps_heading(number.group(2)):
+            ended = bool(items)
+        elif number:
+            if pending and not _CLOSED_LINE.search(last_text):
+                return heading, _parse_doubt("label or wrapped line before a criterion", line)
+            items.append([int(number.group(1)), line.number, line.number])
+            pending, last_text = [], content
+        elif not items:
+            continue
+        elif _SUBSECTION_HEADING.match(content):
+            ended = True
+        elif not pending and _OPEN_LINE.search(last_text):
+            items[-1][2], last_text = line.number, content
+        elif _is_caps_heading(content):
+            ended = True
+        elif _looks_like_category(content):
+            pending.append(content)
+        elif pending:
+            if not _CLOSED_LINE.search(last_text):
+                return heading, _parse_doubt("heading or wrapped line after a criterion", line)
+            ended = True  # a heading and its prose
+        else:
+            items[-1][2], last_text = line.number, content
+    if pending and not ended and not _CLOSED_LINE.search(last_text):
+        return heading, _parse_doubt("heading or wrapped line after the last criterion", None)
+    return heading, [(n, first, last) for n, first, last in items]
+
+
+def _parse_doubt(reason: str, line: _SectionLine | None) -> list[_ParsedItem]:
+    log.info(
+        "criteria_extractor.parse_doubt",
+        reason=reason,
+        line=line.number if line is not None else None,
+    )
+    return []
+
+
+def _is_list_heading(content: str) -> bool:
+    return (
+        _LIST_HEADING.search(content) is not None
+        and len(content.split()) <= _LIST_HEADING_MAX_WORDS
+    )
+
+
+def _is_caps_heading(content: str) -> bool:
+    # Garbled text layers (runs of control characters) are text, not headings
+    letters = [c for c in content if c.isalpha()]
+    return len(letters) > 1 and all(c.isupper() for c in letters) and content.isprintable()
+
+
+def _looks_like_category(content: str) -> bool:
+    return (
+        0 < len(content.split()) <= _CATEGORY_MAX_WORDS
+        and content[0].isupper()
+        and _CATEGORY_END.search(content) is None
+        and content.lower() not in _CONNECTIVES
+    )
+
+
+def _structural_confidence(lists: list[list[_ParsedItem]]) -> float:
+    """
+    How far the parsed lists can be trusted: 1.0 when numbered strictly in sequence.
+
+    0.0 unless there are exactly two lists (inclusion, exclusion) of at least
+    _PARSE_MIN_ITEMS items each, the first numbered 1, 2, 3, ... and the
+    second from 1 or continuing the first, without a gap or repeat. A
+    skipped, repeated or reset number usually means a criterion whose
+    number was lost, a nested list or a heading read as a criterion, which
+    the model handles better.
+    """
+    if len(lists) != 2:
+        return 0.0
+    previous = 0
+    for items in lists:
+        numbers = [n for n, _, _ in items]
+        if len(numbers) < _PARSE_MIN_ITEMS or numbers[0] not in (1, previous + 1):
+            return 0.0
+        if numbers != list(range(numbers[0], numbers[0] + len(numbers))):
+            return 0.0
+        previous = numbers[-1]
+    return 1.0
+
+
+def _extract_parsed(
+    document: ParsedDocument,
+    parsed: list[tuple[str | None, list[_ParsedItem]]],
+    lines: list[_SectionLine],
+    confidence: float,
+) -> ExtractedCriteria:
+    """Build ExtractedCriteria from parsed (inclusion, exclusion) lists as if the model cited them."""
+    kinds = (CriterionType.INCLUSION, CriterionType.EXCLUSION)
+    responses: list[dict[str, Any]] = [
+        {"criteria": [
+            {"criterion_type": kind.value, "lines": [first, last], "source_section": heading}
+            for _, first, last in items
+        ]}
+        for kind, (heading, items) in zip(kinds, parsed, strict=True)
+    ]
+    log.info(
+        "criteria_extractor.parsed_lists",
+        confidence=round(confidence, 3),
+        inclusion=len(parsed[0][1]),
+        exclusion=len(parsed[1][1]),
+    )
+    protocol: dict[str, Any] = {}
+    if settings.extraction_parse_metadata:
+        protocol = _request_metadata(get_client(), document)
+
+    extracted = _merge_responses([protocol, *responses], {line.number: line for line in lines})
+    extracted.metadata.model_used = settings.fast_llm_model if protocol else "none"
+    extracted.metadata.extraction_method = "parsed"
+    extracted.metadata.structural_confidence = confidence
+    extracted.metadata.chunk_count = 0
+    return extracted
+
+
+_METADATA_FIELDS = ("protocol_title", "sponsor", "phase", "therapeutic_area")
+# Pages the metadata is read from; the orchestrator extracts them under locate-first
+METADATA_PAGES = (1, 2)
+_METADATA_CHARS = 3000  # the title page is enough
+
+
+def _request_metadata(client: Any, document: ParsedDocument) -> dict[str, Any]:
+    """Protocol title, sponsor, phase and therapeutic area via the fast model; {} on failure."""
+    opening = "\n".join(
+        p.text for p in document.pages if p.page_number in METADATA_PAGES
+    ).strip()[:_METADATA_CHARS]
+    if not opening:
+        return {}
+    prompt = (
+        "Below is the opening text of a clinical trial protocol.\n\n"
+        f"{opening}\n\n"
+        'Reply ONLY with JSON: {"protocol_title": <string>, "sponsor": <string>, '
+        '"phase": <string>, "therapeutic_area": <string>}. Use null for anything not stated.'
+    )
+    try:
+        response = client.messages.create(
+            model=settings.fast_llm_model,
+            max_tokens=256,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        data = _parse_json(response.content[0].text.strip())
+    except Exception as exc:  # noqa: BLE001
+        log.warning("criteria_extractor.metadata_failed", error=str(exc))
+        return {}
+    return {field: data[field] for field in _METADATA_FIELDS if data.get(field)}
+
+
+def _parse_json(raw: str) -> dict[str, Any]:
     if raw.startswith("```"):
         raw = raw.split("```")[1]
         if raw.startswith("json"):
@@ -131,23 +614,78 @@ def _parse_llm_response(raw: str, document: ParsedDocument) -> ExtractedCriteria
         data = json.loads(raw)
     except json.JSONDecodeError as exc:
         raise ExtractionError(f"LLM returned invalid JSON: {exc}\nRaw: {raw[:500]}") from exc
+    if not isinstance(data, dict):
+        raise ExtractionError(f"LLM returned JSON that is not an object\nRaw: {raw[:500]}")
+    return data
+
 
-    criteria_raw = data.get("criteria", [])
+# List marker dropped from a criterion's first line ("3.", "b)", "•")
+_LIST_MARKER = re.compile(r"^\s*(?:\d{1,3}[.)]|[a-z][.)]|[•\-–*])\s+")
+
+
+def _resolve_span(span: Any, lines: dict[int, _SectionLine]) -> tuple[str, int] | None:
+    """Return (criterion text, source page) for a [first, last] line span, or None if invalid."""
+    if isinstance(span, int):
+        span = [span, span]
+    if not isinstance(span, list) or len(span) != 2 or not all(isinstance(n, int) for n in span):
+        return None
+    first, last = span
+    if first not in lines or last not in lines or first > last:
+        return None
+    cited = "\n".join(lines[n].text for n in range(first, last + 1))
+    return _LIST_MARKER.sub("", cited, count=1).strip(), lines[first].page_number
+
+
+def _merge_responses(
+    responses: list[dict[str, Any]],
+    lines: dict[int, _SectionLine],
+) -> ExtractedCriteria:
+    """
+    Build one ExtractedCriteria from per-chunk responses, in chunk order.
+
+    Each criterion's text and source page are rebuilt from its cited line
+    span in *lines*; a span outside the section skips the criterion with a
+    warning. A span cited twice (a chunk re-reporting a criterion) is kept
+    once; identical text at different spans is kept each time, since chunks
+    share no lines. Retyped criteria are deduplicated by type and text,
+    whitespace and case ignored. Ids are reassigned per type in reading order
+    (inc_001, exc_001, ...), so they are unique and stable however the
+    section was chunked.
+    """
     criteria: list[EligibilityCriterion] = []
     warnings: list[str] = []
+    seen: set[tuple[str, str] | tuple[int, int]] = set()
+    duplicates = 0
+    counters = {CriterionType.INCLUSION: 0, CriterionType.EXCLUSION: 0}
 
-    for i, c in enumerate(criteria_raw):
+    for i, c in enumerate(c for data in responses for c in data.get("criteria", [])):
         try:
+            criterion_type = CriterionType(c.get("criterion_type", "exclusion"))
+            if "lines" in c:
+                resolved = _resolve_span(c["lines"], lines)
+                if resolved is None:
+                    warnings.append(f"Skipped criterion #{i}: lines {c['lines']} not in section.")
+                    continue
+                text, source_page = resolved
+                span = c["lines"]
+                key: tuple[str, str] | tuple[int, int] = (
+                    (span, span) if isinstance(span, int) else (span[0], span[1])
+                )
+            else:  # retyped text, as before line numbering
+                text, source_page = c.get("text", ""), c.get("source_page")
+                key = (criterion_type.value, " ".join(text.lower().split()))
+            if key in seen:
+                duplicates += 1
+                continue
+            seen.add(key)
+            counters[criterion_type] += 1
+            prefix = "inc" if criterion_type == CriterionType.INCLUSION else "exc"
             criterion = EligibilityCriterion(
-                id=c.get("id") or f"crit_{i:03d}",
-                criterion_type=CriterionType(c.get("criterion_type", "exclusion")),
-                text=c.get("text", ""),
-                source_page=c.get("source_page"),
+                id=f"{prefix}_{counters[criterion_type]:03d}",
+                criterion_type=criterion_type,
+                text=text,
+                source_page=source_page,
                 source_section=c.get("source_section"),
-                has_temporal_condition=bool(c.get("has_temporal_condition", False)),
-                has_numeric_threshold=bool(c.get("has_numeric_threshold", False)),
-                has_conditional_logic=bool(c.get("has_conditional_logic", False)),
-                is_ambiguous=bool(c.get("is_ambiguous", False)),
                 notes=c.get("notes", ""),
             )
             if criterion.source_page is None:
@@ -156,6 +694,7 @@ def _parse_llm_response(raw: str, document: ParsedDocument) -> ExtractedCriteria
         except Exception as exc:  # noqa: BLE001
             warnings.append(f"Skipped malformed criterion #{i}: {exc}")
 
+    flag_criteria(criteria)
     metadata = ExtractionMetadata(
         model_used=settings.primary_llm_model,
         extraction_confidence=1.0 - (len(warnings) / max(len(criteria), 1)) * 0.5,
@@ -166,16 +705,20 @@ def _parse_llm_response(raw: str, document: ParsedDocument) -> ExtractedCriteria
     log.info(
         "criteria_extractor.done",
         total=len(criteria),
-        inclusion=sum(1 for c in criteria if c.criterion_type == CriterionType.INCLUSION),
-        exclusion=sum(1 for c in criteria if c.criterion_type == CriterionType.EXCLUSION),
+        inclusion=counters[CriterionType.INCLUSION],
+        exclusion=counters[CriterionType.EXCLUSION],
+        duplicates=duplicates,
         warnings=len(warnings),
     )
 
+    def first(field: str) -> Any:
+        return next((data[field] for data in responses if data.get(field)), None)
+
     return ExtractedCriteria(
-        protocol_title=data.get("protocol_title"),
-        sponsor=data.get("sponsor"),
-        phase=data.get("phase"),
-        therapeutic_area=data.get("therapeutic_area"),
+        protocol_title=first("protocol_title"),
+        sponsor=first("sponsor"),
+        phase=first("phase"),
+        therapeutic_area=first("therapeutic_area"),
         criteria=criteria,
         metadata=metadata,
     )
@@ -0,0 +1,82 @@
+"""
+Content-addressed cache of ParsedDocument results.
+
+Entries are keyed by the PDF's SHA-256 plus EXTRACTOR_VERSION, so a
+re-uploaded protocol skips classification, OCR and extraction entirely,
+and bumping the extractor version invalidates every stored result.
+
+Locate-first runs extract only some pages, so an entry may be partial
+(fewer pages than total_pages). Storing merges the new pages into the
+entry, so it grows towards the full document over successive runs.
+"""
+
+from __future__ import annotations
+
+from pydantic import ValidationError
+
+from docu_flow.config import settings
+from docu_flow.logging import log
+from docu_flow.pipeline.extractor import EXTRACTOR_VERSION
+from docu_flow.schemas.pdf import ParsedDocument
+from docu_flow.utils.disk_cache import DiskCache
+
+_cache: DiskCache | None = None
+
+
+def _get_cache() -> DiskCache:
+    global _cache  # noqa: PLW0603
+    root = settings.results_dir / "parsed_documents"
+    if _cache is None or _cache.root != root:
+        _cache = DiskCache(root, max_bytes=settings.parsed_cache_max_mb * 1024 * 1024)
+    return _cache
+
+
+def _key(sha256: str) -> str:
+    return f"{sha256}-v{EXTRACTOR_VERSION}"
+
+
+def load_cached_document(sha256: str) -> ParsedDocument | None:
+    """
+    Return the cached ParsedDocument for *sha256*, or None on a miss.
+
+    The result may be partial — compare len(pages) with total_pages.
+    """
+    if not settings.parsed_cache_enabled:
+        return None
+    document = _read(sha256)
+    if document is None:
+        log.debug("document_cache.miss", sha256=sha256)
+        return None
+    log.info(
+        "document_cache.hit",
+        sha256=sha256,
+        pages=len(document.pages),
+        total_pages=document.total_pages,
+    )
+    return document
+
+
+def store_cached_document(sha256: str, document: ParsedDocument) -> None:
+    """Persist *document* under *sha256*, merged with any pages already cached."""
+    if not settings.parsed_cache_enabled:
+        return
+    cached = _read(sha256)
+    if cached is not None and cached.total_pages == document.total_pages:
+        have = {p.page_number for p in document.pages}
+        extra = [p for p in cached.pages if p.page_number not in have]
+        if extra:
+            document = document.model_copy(update={
+                "pages": sorted([*document.pages, *extra], key=lambda p: p.page_number),
+            })
+    _get_cache().put(_key(sha256), document.model_dump_json().encode("utf-8"))
+
+
+def _read(sha256: str) -> ParsedDocument | None:
+    data = _get_cache().get(_key(sha256))
+    if data is None:
+        return None
+    try:
+        return ParsedDocument.model_validate_json(data)
+    except ValidationError as exc:
+        log.warning("document_cache.corrupt", sha256=sha256, error=str(exc))
+        return None
@@ -7,118 +7,915 @@ Strategy:
   - For HYBRID pdfs:  per-page decision — use native text if chars >= threshold,
                       else fall back to OCR for that page.
   - For ENCRYPTED:    raise ExtractionError immediately.
+  - Pages the session's structural map marks IMAGE (no fonts) skip native
+    extraction and go straight to OCR.
+  - A short-text page that also carries image blocks (e.g. a scanned table
+    under a typed heading) keeps its native text; only the image blocks are
+    rendered (clipped) and OCR'd, and the results are merged back in reading
+    order.
+
+OCR pipeline:
+  - A low-resolution thumbnail triages each candidate page first: blank
+    separators and full-page figures are skipped and listed in
+    ParsedDocument.extraction_warnings.
+  - Pages are rendered on the calling thread (fitz is not thread-safe) as
+    8-bit grayscale; the pixmap samples are wrapped for PIL without a PNG
+    round trip.
+  - Recognition runs on a bounded thread pool (settings.ocr_workers) so
+    rendering overlaps Tesseract; at most settings.ocr_max_inflight_pages
+    rendered pages wait at once.
+  - Rendering starts at the lowest of settings.ocr_dpi_tiers and escalates
+    to the next tier only when mean confidence is below the threshold.
+  - Each rendering is looked up in a page cache shared across documents,
+    keyed by a hash of its pixels, so repeated cover sheets and boilerplate
+    pages are recognised once.
+  - The engine is a pluggable OCRBackend (settings.ocr_backend):
+    "pytesseract" runs the binary per page, "tesserocr" keeps one
+    initialised engine per OCR thread.
+
+Large documents can be sharded across a process pool (settings.extraction_workers);
+each worker opens its own fitz handle on a contiguous page range and the
+PageText results are merged back in page order.
+
+Pass the job's DocumentSession to reuse its open document and any page text
+the classifier already pulled; without one the PDF is opened here.
 """
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 import fitz  # PyMuPDF
 
 from docu_flow.config import settings
 from docu_flow.logging import log
-from docu_flow.schemas.pdf import PDFType, PageText, ParsedDocument
+from docu_flow.pipeline.retrieval import page_bm25
+from docu_flow.pipeline.session import DocumentSession
+from docu_flow.schemas.pdf import OutlineEntry, PDFType, PageKind, PageText, ParsedDocument
+from docu_flow.utils.disk_cache import DiskCache
 
 
 class ExtractionError(RuntimeError):
     """Raised when a PDF cannot be extracted at all."""
 
 
-def extract_text(pdf_path: Path, pdf_type: PDFType | None = None) -> ParsedDocument:
-    """Extract text from *pdf_path*, using OCR as needed."""
+# Bump whenever extraction output changes — it keys the ParsedDocument and OCR page caches.
+EXTRACTOR_VERSION = 5
+
+_SHARDS_PER_WORKER = 4
+
+
+@dataclass
+class _OCRCacheStats:
+    """Page-cache lookups made while OCR'ing one run of pages."""
+    lookups: int = 0
+    hits: int = 0
+    seconds_saved: float = 0.0
+
+    def record(self, hit: bool, saved_seconds: float = 0.0) -> None:
+        self.lookups += 1
+        if hit:
+            self.hits += 1
+            self.seconds_saved += saved_seconds
+
+    def merge(self, other: _OCRCacheStats) -> None:
+        self.lookups += other.lookups
+        self.hits += other.hits
+        self.seconds_saved += other.seconds_saved
+
+
+@dataclass
+class _PageBatch:
+    """Extraction output for a run of pages, merged across shards in page order."""
+    pages: list[PageText] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    ocr_seconds: dict[int, float] = field(default_factory=dict)  # page_number → latency
+    ocr_cache: _OCRCacheStats = field(default_factory=_OCRCacheStats)
+
+    def extend(self, other: _PageBatch) -> None:
+        self.pages.extend(other.pages)
+        self.warnings.extend(other.warnings)
+        self.ocr_seconds.update(other.ocr_seconds)
+        self.ocr_cache.merge(other.ocr_cache)
+
+
+def extract_text(
+    pdf_path: Path,
+    pdf_type: PDFType | None = None,
+    session: DocumentSession | None = None,
+    page_numbers: Iterable[int] | None = None,
+) -> ParsedDocument:
+    """
+    Extract text from *pdf_path*, using OCR as needed.
+
+    With *page_numbers* (1-indexed) only those pages are extracted; the result
+    still reports the document's total_pages and full outline.
+    """
     if pdf_type is None:
         from docu_flow.pipeline.classifier import classify_pdf
-        pdf_type = classify_pdf(pdf_path)
+        pdf_type = classify_pdf(pdf_path, session=session)
 
     if pdf_type == PDFType.ENCRYPTED:
         raise ExtractionError(f"PDF is encrypted and cannot be read: {pdf_path}")
 
+    owns_session = session is None
+    if session is None:
+        try:
+            session = DocumentSession.open(pdf_path)
+        except fitz.FileDataError as exc:
+            raise ExtractionError(f"Cannot open PDF: {pdf_path}") from exc
+
     try:
-        doc = fitz.open(str(pdf_path))
-    except fitz.FileDataError as exc:
-        raise ExtractionError(f"Cannot open PDF: {pdf_path}") from exc
+        return _extract(session, pdf_type, page_numbers)
+    finally:
+        if owns_session:
+            session.close()
 
-    pages: list[PageText] = []
-    warnings: list[str] = []
-    threshold = settings.ocr_quality_threshold
 
-    for page_index in range(len(doc)):
-        page = doc[page_index]
-        native_text = page.get_text("text").strip()
-        page_number = page_index + 1
+def _extract(
+    session: DocumentSession,
+    pdf_type: PDFType,
+    page_numbers: Iterable[int] | None = None,
+) -> ParsedDocument:
+    pdf_path = session.pdf_path
+    total = session.page_count
 
-        if len(native_text) >= threshold:
-            pages.append(PageText(
-                page_number=page_number,
-                text=native_text,
-                char_count=len(native_text),
-                ocr_used=False,
-                confidence=1.0,
-            ))
-        else:
-            # Fall back to OCR for this page
-            log.debug("extractor.ocr_fallback", page=page_number, native_chars=len(native_text))
-            ocr_result = _ocr_page(page, page_number)
-            if ocr_result is None:
-                warnings.append(f"Page {page_number}: OCR produced no usable text.")
-                pages.append(PageText(
-                    page_number=page_number,
-                    text="",
-                    char_count=0,
-                    ocr_used=True,
-                    confidence=0.0,
-                ))
-            else:
-                pages.append(ocr_result)
-
-    doc.close()
+    if page_numbers is None:
+        indices = list(range(total))
+    else:
+        indices = sorted({n - 1 for n in page_numbers if 1 <= n <= total})
+    # Sized by the pages requested: a locate-first window stays in-process,
+    # its whole-document fallback gets the process pool.
+    workers = _worker_count(len(indices))
+    if workers > 1:
+        batch = _extract_parallel(pdf_path, indices, workers)
+    else:
+        batch = _extract_pages(session, indices, ocr_workers=settings.ocr_workers)
 
+    pages = batch.pages
     parsed = ParsedDocument(
         source_filename=pdf_path.name,
+        sha256=session.sha256,
         pdf_type=pdf_type,
-        total_pages=len(pages),
+        total_pages=total,
         pages=pages,
-        extraction_warnings=warnings,
+        outline=_read_outline(session.doc),
+        page_labels=_read_page_labels(session.doc),
+        extraction_warnings=batch.warnings,
     )
+    bm25 = page_bm25(parsed)
     log.info(
         "extractor.done",
         filename=pdf_path.name,
         total_pages=parsed.total_pages,
+        extracted_pages=len(pages),
         ocr_pages=sum(1 for p in pages if p.ocr_used),
-        warnings=len(warnings),
+        ocr_skipped_pages=sum(1 for w in batch.warnings if "OCR skipped" in w),
+        warnings=len(batch.warnings),
+        workers=workers,
+        bm25_terms=len(bm25.postings),
+        ocr_dpi_tiers=dict(Counter(p.ocr_dpi for p in pages if p.ocr_dpi)),
+        **_ocr_latency_stats(batch.ocr_seconds),
+        **_ocr_cache_stats(batch.ocr_cache),
     )
     return parsed
 
 
-def _ocr_page(page: fitz.Page, page_number: int) -> PageText | None:
-    """Render *page* to an image and run Tesseract OCR."""
+def _read_outline(doc: fitz.Document) -> list[OutlineEntry]:
+    """The document's bookmarks, minus entries that do not resolve to a page."""
+    try:
+        toc = doc.get_toc(simple=True)
+    except Exception as exc:  # noqa: BLE001
+        log.warning("extractor.outline_error", error=str(exc))
+        return []
+    return [
+        OutlineEntry(level=level, title=title.strip(), page_number=page)
+        for level, title, page, *_ in toc
+        if 1 <= page <= len(doc) and title.strip()
+    ]
+
+
+def _read_page_labels(doc: fitz.Document) -> dict[str, int]:
+    """Map each printed page label (e.g. "iv", "12") to its first physical page."""
+    labels: dict[str, int] = {}
+    try:
+        if not doc.get_page_labels():
+            return labels
+        for page_index in range(len(doc)):
+            label = doc[page_index].get_label()
+            if label:
+                labels.setdefault(label, page_index + 1)
+    except Exception as exc:  # noqa: BLE001
+        log.warning("extractor.page_labels_error", error=str(exc))
+    return labels
+
+
+def _extract_pages(
+    session: DocumentSession,
+    page_indices: Sequence[int],
+    ocr_workers: int,
+) -> _PageBatch:
+    """Extract the 0-indexed *page_indices* in order, falling back to OCR per page."""
+    threshold = settings.ocr_quality_threshold
+    native: dict[int, PageText] = {}
+    short_native: dict[int, str] = {}  # below-threshold native text, kept if OCR is skipped
+    ocr_indices: list[int] = []
+
+    for page_index in page_indices:
+        page_number = page_index + 1
+        if session.page_kind(page_index) == PageKind.IMAGE:
+            # No fonts on the page — nothing for native extraction to find.
+            ocr_indices.append(page_index)
+            continue
+
+        native_text = session.page_text(page_index).strip()
+
+        if len(native_text) >= threshold:
+            native[page_index] = PageText(
+                page_number=page_number,
+                text=native_text,
+                char_count=len(native_text),
+                ocr_used=False,
+                confidence=1.0,
+            )
+        else:
+            # Fall back to OCR for this page
+            log.debug("extractor.ocr_fallback", page=page_number, native_chars=len(native_text))
+            short_native[page_index] = native_text
+            ocr_indices.append(page_index)
+
+    # Blank separators, logos and full-page figures cannot hold criteria text.
+    skipped: dict[int, str] = {}
+    if settings.ocr_triage_enabled:
+        for page_index in ocr_indices:
+            reason = _triage_page(session.doc[page_index], page_index + 1)
+            if reason is not None:
+                skipped[page_index] = reason
+        ocr_indices = [i for i in ocr_indices if i not in skipped]
+
+    # Pages with a text layer keep it; only their image blocks are OCR'd.
+    targets: list[_OCRTarget] = []
+    page_targets: dict[int, list[int]] = {}  # page index → positions in targets
+    region_pages: set[int] = set()
+    for page_index in ocr_indices:
+        regions: list[fitz.Rect] = []
+        if session.page_kind(page_index) != PageKind.IMAGE:
+            regions = _image_regions(session.doc[page_index])
+        if regions:
+            region_pages.add(page_index)
+            log.debug("extractor.ocr_regions", page=page_index + 1, regions=len(regions))
+        page_targets[page_index] = list(range(len(targets), len(targets) + max(1, len(regions))))
+        targets.extend(_OCRTarget(page_index, clip) for clip in regions or [None])
+
+    batch = _PageBatch()
+    ocr_results = _run_ocr(session.doc, targets, ocr_workers, batch.ocr_cache)
+
+    for page_index in page_indices:
+        page_number = page_index + 1
+        if page_index in native:
+            batch.pages.append(native[page_index])
+            continue
+        if page_index in skipped:
+            batch.warnings.append(f"Page {page_number}: OCR skipped ({skipped[page_index]}).")
+            text = short_native.get(page_index, "")
+            batch.pages.append(PageText(
+                page_number=page_number,
+                text=text,
+                char_count=len(text),
+                ocr_used=False,
+                confidence=1.0 if text else 0.0,
+            ))
+            continue
+        positions = page_targets[page_index]
+        batch.ocr_seconds[page_number] = sum(ocr_results[t][1] for t in positions)
+        if page_index in region_pages:
+            ocr_result = _merge_regions(
+                session.doc[page_index],
+                page_number,
+                [(targets[t].clip, ocr_results[t][0]) for t in positions],
+            )
+            failed = sum(1 for t in positions if ocr_results[t][0] is None)
+            if failed and ocr_result is not None:
+                batch.warnings.append(
+                    f"Page {page_number}: OCR produced no usable text for "
+                    f"{failed} of {len(positions)} image regions."
+                )
+        else:
+            ocr_result = ocr_results[positions[0]][0]
+        if ocr_result is None:
+            batch.warnings.append(f"Page {page_number}: OCR produced no usable text.")
+            batch.pages.append(PageText(
+                page_number=page_number,
+                text="",
+                char_count=0,
+                ocr_used=True,
+                confidence=0.0,
+            ))
+        else:
+            batch.pages.append(ocr_result)
+
+    return batch
+
+
+# ---------------------------------------------------------------------------
+# Parallel mode — page ranges sharded across worker processes
+# ---------------------------------------------------------------------------
+
+def _worker_count(total_pages: int) -> int:
+    """Number of extraction processes to use for *total_pages* pages."""
+    workers = settings.extraction_workers or os.cpu_count() or 1
+    if total_pages < settings.extraction_parallel_min_pages:
+        return 1
+    return max(1, min(workers, total_pages))
+
+
+def _shard_ranges(total_pages: int, shards: int) -> list[range]:
+    """Split ``range(total_pages)`` into *shards* contiguous, near-equal ranges."""
+    shards = max(1, min(shards, total_pages))
+    size, extra = divmod(total_pages, shards)
+    ranges: list[range] = []
+    start = 0
+    for i in range(shards):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append(range(start, stop))
+        start = stop
+    return ranges
+
+
+def _extract_shard(pdf_path: str, page_indices: list[int]) -> _PageBatch:
+    """Process-pool entry point: open a private fitz handle and extract some pages."""
+    with DocumentSession(Path(pdf_path), fitz.open(pdf_path)) as session:
+        # One OCR thread per process — the process pool already fills the cores.
+        return _extract_pages(session, page_indices, ocr_workers=1)
+
+
+def _extract_parallel(pdf_path: Path, page_indices: list[int], workers: int) -> _PageBatch:
+    """Extract the sorted *page_indices* across *workers* processes, merged in page order."""
+    # Over-split so OCR-heavy ranges do not leave the other workers idle.
+    shards = _shard_ranges(len(page_indices), workers * _SHARDS_PER_WORKER)
+    batch = _PageBatch()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_extract_shard, str(pdf_path), page_indices[shard.start:shard.stop])
+                for shard in shards
+            ]
+            for future in futures:
+                batch.extend(future.result())
+    except (BrokenProcessPool, AssertionError, OSError) as exc:
+        # e.g. daemonic worker processes may not spawn children — degrade to serial.
+        log.warning("extractor.parallel_failed", error=str(exc), workers=workers)
+        with DocumentSession(pdf_path, fitz.open(str(pdf_path))) as session:
+            return _extract_pages(session, page_indices, ocr_workers=settings.ocr_workers)
+    return batch
+
+
+# ---------------------------------------------------------------------------
+# OCR — render on the calling thread, recognise on a bounded pool
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _OCRTarget:
+    """A page to OCR — the whole page, or only the *clip* rectangle (PDF points)."""
+    page_index: int
+    clip: fitz.Rect | None = None
+
+
+def _run_ocr(
+    doc: fitz.Document,
+    targets: list[_OCRTarget],
+    workers: int,
+    stats: _OCRCacheStats,
+) -> dict[int, tuple[PageText | None, float]]:
+    """
+    OCR each of *targets* — whole pages of *doc* or clipped regions of them.
+
+    fitz is not thread-safe, so pages are rendered here and only the Tesseract
+    call runs on the pool. Rendering continues ahead of recognition until
+    ``ocr_max_inflight_pages`` images are waiting, which keeps memory flat.
+
+    Each target starts at the lowest DPI in ``ocr_dpi_tiers`` and is re-rendered
+    at the next tier while its mean confidence is below
+    ``ocr_escalation_confidence``.
+
+    Every rendering is looked up in the shared page cache by the hash of
+    its pixels first, so pages repeated across documents are OCR'd once.
+
+    Returns a map of target position → (PageText or None, render + OCR seconds).
+    """
+    results: dict[int, tuple[PageText | None, float]] = {}
+    if not targets:
+        return results
+
+    tiers = sorted(settings.ocr_dpi_tiers) or [300]
+    workers = max(1, workers or os.cpu_count() or 1)
+    max_inflight = max(workers, settings.ocr_max_inflight_pages)
+    cache = _page_cache()
+    queue: deque[tuple[int, int]] = deque((t, 0) for t in range(len(targets)))  # (target, tier)
+    spent: dict[int, float] = dict.fromkeys(range(len(targets)), 0.0)
+    inflight: dict[Future[tuple[PageText | None, float]], tuple[int, int, _RenderedPage, str]] = {}
+
+    def finish(target: int, tier: int, page_text: PageText | None) -> None:
+        low_confidence = (
+            page_text is None
+            or page_text.confidence < settings.ocr_escalation_confidence
+        )
+        if low_confidence and tier + 1 < len(tiers):
+            log.debug(
+                "extractor.ocr_escalate",
+                page=targets[target].page_index + 1,
+                dpi=tiers[tier + 1],
+                confidence=page_text.confidence if page_text else None,
+            )
+            # Front of the queue: finish this target before starting new ones.
+            queue.appendleft((target, tier + 1))
+            return
+        if page_text is not None:
+            page_text.ocr_dpi = tiers[tier]
+        results[target] = (page_text, spent[target])
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr") as pool:
+        while queue or inflight:
+            while queue and len(inflight) < max_inflight:
+                target, tier = queue.popleft()
+                page_index = targets[target].page_index
+                started = time.perf_counter()
+                rendered = _render_page(
+                    doc[page_index], page_index + 1, tiers[tier], clip=targets[target].clip
+                )
+                if rendered is None:
+                    spent[target] += time.perf_counter() - started
+                    results[target] = (None, spent[target])
+                    continue
+
+                key = _page_cache_key(rendered.pixmap)
+                cached = _load_cached_page(cache, key, page_index + 1)
+                spent[target] += time.perf_counter() - started
+                if cached is not None:
+                    page_text, saved_seconds = cached
+                    rendered.close()
+                    stats.record(hit=True, saved_seconds=saved_seconds)
+                    finish(target, tier, page_text)
+                    continue
+
+                stats.record(hit=False)
+                future = pool.submit(_ocr_image, rendered.image, page_index + 1)
+                inflight[future] = (target, tier, rendered, key)
+
+            if not inflight:
+                continue
+            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            for future in done:
+                target, tier, rendered, key = inflight.pop(future)
+                rendered.close()
+                recognized, ocr_seconds = future.result()
+                spent[target] += ocr_seconds
+                if recognized is not None and cache is not None:
+                    _store_cached_page(cache, key, recognized, ocr_seconds)
+                finish(target, tier, recognized)
+
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Region OCR — image blocks of pages that also carry a native text layer
+# ---------------------------------------------------------------------------
+
+# Image blocks smaller than this on either side (points) are icons or rules, not text.
+_MIN_OCR_REGION_PT = 36
+# Above this share of the page, a clipped render saves nothing — OCR the whole page.
+_MAX_OCR_REGION_COVERAGE = 0.9
+
+
+def _image_regions(page: fitz.Page) -> list[fitz.Rect]:
+    """
+    Return the image blocks of *page* worth OCR'ing on their own, top to bottom.
+
+    Overlapping placements (e.g. a scan split into tiles) are merged so no
+    pixel is recognised twice. Returns [] when the page has no usable image
+    block or when the blocks cover nearly the whole page.
+    """
+    regions: list[fitz.Rect] = []
+    for info in page.get_image_info():
+        rect = fitz.Rect(info["bbox"]) & page.rect
+        if rect.width < _MIN_OCR_REGION_PT or rect.height < _MIN_OCR_REGION_PT:
+            continue
+        # Fold in every region this one touches, repeating as the union grows.
+        merged = True
+        while merged:
+            merged = False
+            for other in regions:
+                if rect.intersects(other):
+                    rect |= other
+                    regions.remove(other)
+                    merged = True
+                    break
+        regions.append(rect)
+
+    page_area = abs(page.rect) or 1.0
+    if sum(abs(r) for r in regions) / page_area >= _MAX_OCR_REGION_COVERAGE:
+        return []
+    return sorted(regions, key=lambda r: (r.y0, r.x0))
+
+
+def _merge_regions(
+    page: fitz.Page,
+    page_number: int,
+    regions: list[tuple[fitz.Rect, PageText | None]],
+) -> PageText | None:
+    """
+    Merge region OCR results with the page's native text blocks in reading order.
+
+    Native blocks lying inside an OCR'd region are dropped — the clipped render
+    already contains whatever they draw there. Blocks are ordered top to bottom,
+    then left to right. Confidence is the character-weighted mean, with native
+    text counted as 1.0. Returns None if no text came out of the page at all.
+    """
+    recognised = [(rect, result) for rect, result in regions if result is not None]
+    parts: list[tuple[float, float, str, float]] = []  # (y0, x0, text, confidence)
+
+    for x0, y0, x1, y1, text, _block_no, block_type in page.get_text("blocks"):
+        text = text.strip()
+        if block_type != 0 or not text:
+            continue
+        centre = fitz.Point((x0 + x1) / 2, (y0 + y1) / 2)
+        if any(centre in rect for rect, _ in recognised):
+            continue
+        parts.append((y0, x0, text, 1.0))
+
+    for rect, result in recognised:
+        text = result.text.strip()
+        if text:
+            parts.append((rect.y0, rect.x0, text, result.confidence))
+
+    if not parts:
+        return None
+
+    parts.sort(key=lambda part: (part[0], part[1]))
+    text = "\n".join(part[2] for part in parts)
+    chars = sum(len(part[2]) for part in parts)
+    return PageText(
+        page_number=page_number,
+        text=text,
+        char_count=len(text),
+        ocr_used=True,
+        confidence=sum(len(part[2]) * part[3] for part in parts) / chars,
+        ocr_dpi=max((r.ocr_dpi for _, r in recognised if r.ocr_dpi), default=None),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Pre-OCR triage — a cheap thumbnail decides whether a page is worth OCR
+# ---------------------------------------------------------------------------
+
+# A pixel counts as ink when it is this much darker than the page background.
+_TRIAGE_INK_DELTA = 60
+# Brightness quantile taken as the paper colour (margins are rarely < 10% of a page).
+_TRIAGE_BACKGROUND_QUANTILE = 0.9
+
+
+def _triage_page(page: fitz.Page, page_number: int) -> str | None:
+    """
+    Return why *page* should not be OCR'd ("blank page", "figure page"), or None.
+
+    Measures ink coverage relative to the page's own background level (a
+    high brightness quantile, i.e. the paper), so tinted or grey scans are
+    judged like white ones and a dark photo still reads as mostly ink.
+    """
     try:
-        import pytesseract
         from PIL import Image
-        import io
 
-        if settings.tesseract_cmd:
-            pytesseract.pytesseract.tesseract_cmd = settings.tesseract_cmd
+        zoom = settings.ocr_triage_dpi / 72
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False)
+        thumb = Image.frombuffer(
+            "L", (pix.width, pix.height), pix.samples_mv, "raw", "L", pix.stride, 1
+        )
+        try:
+            histogram = thumb.histogram()
+        finally:
+            thumb.close()  # release the borrowed samples before the pixmap is freed
+    except Exception as exc:  # noqa: BLE001
+        log.warning("extractor.triage_error", page=page_number, error=str(exc))
+        return None
 
-        # Render at 300 DPI for acceptable OCR quality
-        mat = fitz.Matrix(300 / 72, 300 / 72)
-        pix = page.get_pixmap(matrix=mat, colorspace=fitz.csRGB)
-        img_bytes = pix.tobytes("png")
-        image = Image.open(io.BytesIO(img_bytes))
+    pixels = sum(histogram) or 1
+    background = _histogram_quantile(histogram, _TRIAGE_BACKGROUND_QUANTILE)
+    ink = sum(histogram[: max(0, background - _TRIAGE_INK_DELTA)]) / pixels
+    mean = sum(level * count for level, count in enumerate(histogram)) / pixels
+    variance = sum(count * (level - mean) ** 2 for level, count in enumerate(histogram)) / pixels
 
-        data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
-        words = [w for w in data["text"] if w.strip()]
-        confidences = [c for c, w in zip(data["conf"], data["text"]) if w.strip() and c != -1]
-        text = " ".join(words)
-        avg_conf = (sum(confidences) / len(confidences) / 100.0) if confidences else 0.0
+    if ink < settings.ocr_triage_blank_ink or variance < 1.0:
+        reason = "blank page"
+    elif ink > settings.ocr_triage_figure_ink:
+        reason = "figure page"
+    else:
+        return None
+    log.debug("extractor.ocr_triage_skip", page=page_number, reason=reason, ink=round(ink, 4))
+    return reason
+
+
+def _histogram_quantile(histogram: list[int], q: float) -> int:
+    """Grey level below which a fraction *q* of the pixels fall."""
+    target = q * sum(histogram)
+    running = 0
+    for level, count in enumerate(histogram):
+        running += count
+        if running >= target:
+            return level
+    return len(histogram) - 1
+
+
+# ---------------------------------------------------------------------------
+# Page-level OCR cache — shared across documents, keyed by rendered pixels
+# ---------------------------------------------------------------------------
+
+_page_cache_instance: DiskCache | None = None
 
+
+def _page_cache() -> DiskCache | None:
+    global _page_cache_instance  # noqa: PLW0603
+    if not settings.ocr_cache_enabled:
+        return None
+    root = settings.results_dir / "ocr_pages"
+    if _page_cache_instance is None or _page_cache_instance.root != root:
+        _page_cache_instance = DiskCache(root, max_bytes=settings.ocr_cache_max_mb * 1024 * 1024)
+    return _page_cache_instance
+
+
+def _page_cache_key(pixmap: fitz.Pixmap) -> str:
+    """Hash of the rendered pixels plus everything else that shapes OCR output."""
+    digest = hashlib.sha256(pixmap.samples_mv)
+    digest.update(f"{pixmap.width}x{pixmap.height}".encode())
+    return f"{digest.hexdigest()}-{settings.ocr_backend}-{settings.ocr_language}-v{EXTRACTOR_VERSION}"
+
+
+def _load_cached_page(
+    cache: DiskCache | None,
+    key: str,
+    page_number: int,
+) -> tuple[PageText, float] | None:
+    """Return (PageText, original OCR seconds) for a cached rendering, or None."""
+    if cache is None:
+        return None
+    data = cache.get(key)
+    if data is None:
+        return None
+    try:
+        entry = json.loads(data)
+        text = entry["text"]
         return PageText(
             page_number=page_number,
             text=text,
             char_count=len(text),
             ocr_used=True,
-            confidence=avg_conf,
+            confidence=entry["confidence"],
+        ), float(entry.get("seconds", 0.0))
+    except (ValueError, KeyError, TypeError) as exc:
+        log.warning("extractor.ocr_cache_corrupt", key=key, error=str(exc))
+        return None
+
+
+def _store_cached_page(cache: DiskCache, key: str, page_text: PageText, seconds: float) -> None:
+    entry = {"text": page_text.text, "confidence": page_text.confidence, "seconds": round(seconds, 3)}
+    cache.put(key, json.dumps(entry).encode("utf-8"))
+
+
+@dataclass
+class _RenderedPage:
+    """A grayscale pixmap and the PIL image that borrows its sample buffer."""
+    pixmap: fitz.Pixmap
+    image: Any
+
+    def close(self) -> None:
+        # The image must release its view of the samples before the pixmap is freed.
+        self.image.close()
+        self.image = None
+
+
+def _render_page(
+    page: fitz.Page,
+    page_number: int,
+    dpi: int,
+    clip: fitz.Rect | None = None,
+) -> _RenderedPage | None:
+    """Render *page* (or just its *clip* rectangle) at *dpi* for Tesseract, or None on failure."""
+    try:
+        from PIL import Image
+
+        mat = fitz.Matrix(dpi / 72, dpi / 72)
+        pix = page.get_pixmap(matrix=mat, colorspace=fitz.csGRAY, alpha=False, clip=clip)
+        # Wrap the pixmap's samples in place — no PNG encode/decode round trip.
+        image = Image.frombuffer(
+            "L", (pix.width, pix.height), pix.samples_mv, "raw", "L", pix.stride, 1
         )
+        return _RenderedPage(pixmap=pix, image=image)
     except Exception as exc:  # noqa: BLE001
-        log.warning("extractor.ocr_error", page=page_number, error=str(exc))
+        log.warning("extractor.render_error", page=page_number, error=str(exc))
         return None
+
+
+def _ocr_image(image: Any, page_number: int) -> tuple[PageText | None, float]:
+    """Run the configured OCR backend on a rendered page image. Returns (result, seconds)."""
+    started = time.perf_counter()
+    try:
+        text, avg_conf = get_ocr_backend().recognize(image)
+        return PageText(
+            page_number=page_number,
+            text=text,
+            char_count=len(text),
+            ocr_used=True,
+            confidence=avg_conf,
+        ), time.perf_counter() - started
+    except Exception as exc:  # noqa: BLE001
+        log.warning("extractor.ocr_error", page=page_number, error=str(exc))
+        return None, time.perf_counter() - started
+
+
+def _ocr_cache_stats(stats: _OCRCacheStats) -> dict[str, Any]:
+    """Summarise page-cache effectiveness for the ``extractor.done`` event."""
+    if not stats.lookups:
+        return {}
+    return {
+        "ocr_cache_hits": stats.hits,
+        "ocr_cache_hit_rate": round(stats.hits / stats.lookups, 3),
+        "ocr_seconds_saved": round(stats.seconds_saved, 3),
+    }
+
+
+def _ocr_latency_stats(ocr_seconds: dict[int, float]) -> dict[str, Any]:
+    """Summarise per-page OCR latency for the ``extractor.done`` event."""
+    if not ocr_seconds:
+        return {}
+    latencies = sorted(ocr_seconds.values())
+    p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+    return {
+        "ocr_seconds": round(sum(latencies), 3),
+        "ocr_page_ms_mean": round(1000 * sum(latencies) / len(latencies), 1),
+        "ocr_page_ms_p95": round(1000 * p95, 1),
+        "ocr_page_ms_max": round(1000 * latencies[-1], 1),
+        "ocr_page_ms": {page: round(1000 * s, 1) for page, s in sorted(ocr_seconds.items())},
+    }
+
+
+# ---------------------------------------------------------------------------
+# OCR backends
+# ---------------------------------------------------------------------------
+
+class OCRBackend(ABC):
+    """A Tesseract front end. Implementations must be safe to call from OCR pool threads."""
+
+    name: str = "base"
+
+    @abstractmethod
+    def recognize(self, image: Any) -> tuple[str, float]:
+        """
+        Return (text, mean word confidence 0–1) for a grayscale page image.
+
+        The text keeps one line per recognised line, words joined by spaces.
+        """
+        ...
+
+    def close(self) -> None:
+        """Release any engines the backend holds; it stays usable afterwards."""
+        return  # subprocess backends hold nothing between pages
+
+
+class PytesseractBackend(OCRBackend):
+    """Shells out to the tesseract binary for every page (no native build required)."""
+
+    name = "pytesseract"
+
+    def recognize(self, image: Any) -> tuple[str, float]:
+        import pytesseract
+
+        if settings.tesseract_cmd:
+            pytesseract.pytesseract.tesseract_cmd = settings.tesseract_cmd
+
+        data = pytesseract.image_to_data(
+            image, lang=settings.ocr_language, output_type=pytesseract.Output.DICT
+        )
+        # Keep Tesseract's line structure — headings and list items are line-based.
+        lines: dict[tuple[int, int, int], list[str]] = {}
+        for word, block, par, line in zip(
+            data["text"], data["block_num"], data["par_num"], data["line_num"], strict=True
+        ):
+            if word.strip():
+                lines.setdefault((block, par, line), []).append(word.strip())
+        confidences = [c for c, w in zip(data["conf"], data["text"], strict=True) if w.strip() and c != -1]
+        text = "\n".join(" ".join(words) for words in lines.values())
+        avg_conf = (sum(confidences) / len(confidences) / 100.0) if confidences else 0.0
+        return text, avg_conf
+
+
+class TesserocrBackend(OCRBackend):
+    """
+    In-process Tesseract via tesserocr.
+
+    Initialised ``PyTessBaseAPI`` engines are kept in an idle pool on the
+    backend — the process-wide singleton — rather than on the OCR threads,
+    which live only as long as one document's OCR pool. Each page borrows an
+    engine and returns it, so the language model is loaded once per
+    concurrent caller for the life of the process instead of once per
+    document. Engines are ended by close(), called at interpreter exit.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self) -> None:
+        import tesserocr  # noqa: F401 — fail at selection time if not installed
+
+        self._idle: list[Any] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _engine(self) -> Iterator[Any]:
+        with self._lock:
+            api = self._idle.pop() if self._idle else None
+        if api is None:
+            import tesserocr
+
+            api = tesserocr.PyTessBaseAPI(lang=settings.ocr_language)
+        try:
+            yield api
+        finally:
+            with self._lock:
+                self._idle.append(api)
+
+    def recognize(self, image: Any) -> tuple[str, float]:
+        with self._engine() as api:
+            api.SetImage(image)
+            raw = api.GetUTF8Text()
+            confidences = [c for c in api.AllWordConfidences() if c >= 0]
+        text = "\n".join(" ".join(line.split()) for line in raw.splitlines() if line.strip())
+        avg_conf = (sum(confidences) / len(confidences) / 100.0) if confidences else 0.0
+        return text, avg_conf
+
+    def close(self) -> None:
+        with self._lock:
+            engines, self._idle = self._idle, []
+        for api in engines:
+            api.End()
+
+
+_OCR_BACKENDS: dict[str, type[OCRBackend]] = {
+    PytesseractBackend.name: PytesseractBackend,
+    TesserocrBackend.name: TesserocrBackend,
+}
+
+_backend: OCRBackend | None = None
+_backend_selected: str | None = None  # settings.ocr_backend value _backend was built for
+_backend_lock = threading.Lock()
+
+
+def get_ocr_backend() -> OCRBackend:
+    """Return the process-wide OCR backend selected by ``settings.ocr_backend``."""
+    global _backend, _backend_selected  # noqa: PLW0603
+    with _backend_lock:
+        if _backend is None or _backend_selected != settings.ocr_backend:
+            backend_cls = _OCR_BACKENDS.get(settings.ocr_backend)
+            if backend_cls is None:
+                raise ValueError(
+                    f"Unknown OCR backend {settings.ocr_backend!r}; "
+                    f"expected one of {sorted(_OCR_BACKENDS)}"
+                )
+            if _backend is not None:
+                _backend.close()
+            try:
+                _backend = backend_cls()
+            except ImportError as exc:
+                log.warning(
+                    "extractor.ocr_backend_unavailable",
+                    backend=settings.ocr_backend,
+                    fallback=PytesseractBackend.name,
+                    error=str(exc),
+                )
+                _backend = PytesseractBackend()
+            _backend_selected = settings.ocr_backend
+        return _backend
+
+
+@atexit.register
+def _close_ocr_backend() -> None:
+    with _backend_lock:
+        if _backend is not None:
+            _backend.close()
@@ -0,0 +1,103 @@
+"""
+Step 4b — Flag criteria with temporal, numeric, conditional or ambiguous language.
+
+The four EligibilityCriterion flags are pattern detections, so they are
+computed here with compiled regexes after extraction instead of being
+generated by the LLM for every criterion. The patterns cover the flag
+definitions the extraction prompts used to give the model:
+
+  - Temporal conditions: "within X weeks/months/years", "in the past 6 months"
+  - Numeric thresholds: comparisons and numbers with units (eGFR, HbA1c, ...)
+  - Conditional logic: "unless", "except when", "if", "provided that"
+  - Ambiguous language: "clinically significant", "adequate", "appropriate"
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TypedDict
+
+from docu_flow.schemas.criteria import EligibilityCriterion
+
+
+class CriterionFlags(TypedDict):
+    """The four EligibilityCriterion flags, as returned by flag_text()."""
+
+    has_temporal_condition: bool
+    has_numeric_threshold: bool
+    has_conditional_logic: bool
+    is_ambiguous: bool
+
+
+_NUMBER = r"(?:\d+(?:[.,]\d+)?|one|two|three|four|five|six|seven|eight|nine|ten|twelve)"
+_TIME_UNIT = r"(?:hours?|hrs?|days?|weeks?|wks?|months?|mos?|years?|yrs?)"
+# After a time unit: it is not an age ("at least 18 years of age"), so a duration
+_NOT_AGE = r"(?!\s+(?:of\s+age|old)\b)"
+
+_TEMPORAL_PATTERN = re.compile(
+    # "within 4 weeks", "in the past 6 months", "at least 28 days before"
+    rf"\b(?:within|in\s+the\s+(?:past|last|previous|preceding)|during\s+the\s+(?:past|last)"
+    rf"|for(?:\s+at\s+least)?|at\s+least|less\s+than|more\s+than|up\s+to)\s+"
+    rf"(?:\(?{_NUMBER}\)?\s*)+{_TIME_UNIT}\b{_NOT_AGE}"
+    # "4 weeks before/prior to/after/of", "28-day washout"
+    rf"|\b{_NUMBER}(?:\s+|-){_TIME_UNIT}\s+(?:before|prior|after|following|since|of(?!\s+age))\b"
+    rf"|\b{_NUMBER}-(?:hour|day|week|month|year)\b(?!-old)"
+    r"|\bwash-?out\b|\bprior\s+to\s+(?:screening|randomi[sz]ation|enrol?ment|the\s+first\s+dose)",
+    re.IGNORECASE,
+)
+
+# A number that is not a duration ("at least 5 years" is temporal, not a
+# threshold) — unless it is an age ("at least 18 years of age")
+_QUANTITY = rf"\d+(?:[.,]\d+)?(?![\d.,])(?!\s*-?{_TIME_UNIT}\b{_NOT_AGE})"
+
+_NUMERIC_PATTERN = re.compile(
+    # comparisons: "< 30", ">= 1.5", "≤ 2 x ULN"
+    r"(?:[<>≤≥]=?|=<|=>)\s*\d"
+    rf"|\b(?:greater|less|more|fewer|higher|lower)\s+than\s+(?:or\s+equal\s+to\s+)?{_QUANTITY}"
+    r"|\b(?:at\s+least|at\s+most|no\s+more\s+than|not\s+exceed(?:ing)?|exceeding"
+    rf"|above|below|over|under|minimum\s+of|maximum\s+of)\s+{_QUANTITY}"
+    # ranges and bounds: "between 18 and 75", "aged 18 to 75 years", "18 years of age or older"
+    r"|\bbetween\s+\d+(?:[.,]\d+)?\s+and\s+\d"
+    r"|\b\d+\s*(?:to|-|–)\s*\d+\s*(?:years?|yrs?)\b"
+    r"|\b\d+\s+years?\s+(?:of\s+age\s+)?or\s+(?:older|younger|above|below|more|less)\b"
+    # numbers with units: "1.5 mg/dL", "30 mL/min", "7%", "2.5 x ULN", "100,000/µL"
+    r"|\d(?:[\d.,]*)\s*(?:%|×\s*ULN|x\s*ULN|mg|g/dl|mmol|µmol|umol|ml/min|mmhg|kg|cells"
+    r"|/[µu]l|/mm3|iu|u/l|×\s*10|x\s*10)",
+    re.IGNORECASE,
+)
+
+_CONDITIONAL_PATTERN = re.compile(
+    r"\b(?:unless|except(?:\s+(?:when|if|for|in))?|provided\s+(?:that|the)|if|only\s+if"
+    r"|as\s+long\s+as|with\s+the\s+exception\s+of|in\s+case\s+of|otherwise|whichever"
+    r"|in\s+which\s+case)\b",
+    re.IGNORECASE,
+)
+
+_AMBIGUOUS_PATTERN = re.compile(
+    r"\bclinically\s+(?:significant|relevant|important|meaningful)\b"
+    r"|\b(?:adequate|adequately|appropriate|sufficient|acceptable|reasonable|suitable)\b"
+    r"|\b(?:in\s+the\s+(?:opinion|judge?ment)\s+of\s+the\s+(?:treating\s+)?"
+    r"(?:investigator|physician)|investigator'?s\s+(?:opinion|judge?ment|discretion))\b"
+    r"|\b(?:significant|serious|severe)\s+(?:illness|disease|condition|medical)\b",
+    re.IGNORECASE,
+)
+
+FLAG_FIELDS: tuple[str, ...] = tuple(CriterionFlags.__annotations__)
+
+
+def flag_text(text: str) -> CriterionFlags:
+    """Return every EligibilityCriterion flag for *text*."""
+    return CriterionFlags(
+        has_temporal_condition=_TEMPORAL_PATTERN.search(text) is not None,
+        has_numeric_threshold=_NUMERIC_PATTERN.search(text) is not None,
+        has_conditional_logic=_CONDITIONAL_PATTERN.search(text) is not None,
+        is_ambiguous=_AMBIGUOUS_PATTERN.search(text) is not None,
+    )
+
+
+def flag_criteria(criteria: list[EligibilityCriterion]) -> list[EligibilityCriterion]:
+    """Set the four flags on each criterion from its text, in place; returns *criteria*."""
+    for criterion in criteria:
+        for field, value in flag_text(criterion.text).items():
+            setattr(criterion, field, value)
+    return criteria
@@ -3,21 +3,47 @@ Top-level orchestrator — ties all pipeline steps together.
 
 run_protocol_pipeline:  PDF → ParsedDocument → ExtractedCriteria
 run_screening_pipeline: ExtractedCriteria + patient → ScreeningResult
+
+With settings.locate_first, extraction runs in two phases: the eligibility
+section is located from the PDF outline alone, or else from the first (TOC)
+pages; only that window is then extracted (and OCR'd). The window is
+widened when it does not contain a criteria heading, and the whole document
+is extracted as a last resort.
+
+Extracted pages are cached by PDF hash even when only part of the document
+was extracted; a later run starts from the cached pages and extracts only
+the ones it still needs.
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from pathlib import Path
 
+import fitz  # PyMuPDF
+
+from docu_flow.config import settings
 from docu_flow.logging import log
 from docu_flow.pipeline.classifier import classify_pdf
-from docu_flow.pipeline.criteria_extractor import extract_criteria
-from docu_flow.pipeline.extractor import extract_text
+from docu_flow.pipeline.criteria_extractor import METADATA_PAGES, extract_criteria
+from docu_flow.pipeline.document_cache import load_cached_document, store_cached_document
+from docu_flow.pipeline.extractor import ExtractionError, extract_text
 from docu_flow.pipeline.ranker import rank_disqualifiers
 from docu_flow.pipeline.screener import screen_patient
-from docu_flow.pipeline.section_locator import get_section_pages, locate_eligibility_section
+from docu_flow.pipeline.section_locator import (
+    TOC_SCAN_LIMIT,
+    SectionLocation,
+    confirm_section,
+    get_section_pages,
+    locate_eligibility_section,
+)
+from docu_flow.pipeline.session import DocumentSession
 from docu_flow.schemas.criteria import ExtractedCriteria, ScreeningRequest, ScreeningResult
-from docu_flow.schemas.pdf import ParsedDocument
+from docu_flow.schemas.pdf import PDFType, ParsedDocument
+
+# Locate-first: pages added on each side per widening, and how often to widen
+_WIDEN_PAGES = 4
+_MAX_WIDENINGS = 3
 
 
 def run_protocol_pipeline(pdf_path: Path, top_n_disqualifiers: int = 8) -> ExtractedCriteria:
@@ -27,19 +53,50 @@ def run_protocol_pipeline(pdf_path: Path, top_n_disqualifiers: int = 8) -> Extra
     Raises:
         ExtractionError: if the PDF cannot be read or the LLM fails after retries.
     """
-    log.info("pipeline.start", pdf=str(pdf_path))
-
-    # 1. Classify
-    pdf_type = classify_pdf(pdf_path)
-
-    # 2. Extract text (adaptive: native or OCR)
-    document: ParsedDocument = extract_text(pdf_path, pdf_type=pdf_type)
+    try:
+        session = DocumentSession.open(pdf_path)
+    except fitz.FileDataError as exc:
+        raise ExtractionError(f"Cannot open PDF: {pdf_path}") from exc
+
+    # One open document per job: classification, extraction and hashing all
+    # read from the same buffer and share memoised page text.
+    with session:
+        log.info("pipeline.start", pdf=str(pdf_path), sha256=session.sha256)
+
+        location: SectionLocation | None = None
+        cached = load_cached_document(session.sha256)
+        if cached is not None:
+            cached = cached.model_copy(update={"source_filename": pdf_path.name})
+        if cached is not None and len(cached.pages) == cached.total_pages:
+            document: ParsedDocument = cached
+        else:
+            # 1. Classify (a partial cache entry already knows the type)
+            if cached is not None:
+                pdf_type = cached.pdf_type
+            else:
+                pdf_type = classify_pdf(pdf_path, session=session)
+
+            # 2. Extract text (adaptive: native or OCR)
+            if settings.locate_first:
+                document, location = _locate_first(pdf_path, pdf_type, session, cached)
+                if settings.extraction_parse_lists and settings.extraction_parse_metadata:
+                    # Parsed lists take the protocol metadata from the opening pages
+                    opening = [n for n in METADATA_PAGES if n <= session.page_count]
+                    document = _add_pages(document, pdf_path, pdf_type, session, opening)
+            elif cached is not None:
+                document = _add_pages(
+                    cached, pdf_path, pdf_type, session, range(1, cached.total_pages + 1)
+                )
+            else:
+                document = extract_text(pdf_path, pdf_type=pdf_type, session=session)
+            store_cached_document(session.sha256, document)
 
     if document.extraction_warnings:
         log.warning("pipeline.extraction_warnings", warnings=document.extraction_warnings)
 
     # 3. Locate eligibility section
-    location = locate_eligibility_section(document)
+    if location is None:
+        location = locate_eligibility_section(document)
     section_pages = get_section_pages(document, location)
 
     if not section_pages:
@@ -61,6 +118,90 @@ def run_protocol_pipeline(pdf_path: Path, top_n_disqualifiers: int = 8) -> Extra
     return extracted
 
 
+def _locate_first(
+    pdf_path: Path,
+    pdf_type: PDFType,
+    session: DocumentSession,
+    cached: ParsedDocument | None = None,
+) -> tuple[ParsedDocument, SectionLocation | None]:
+    """
+    Extract just enough of the document to find and read the eligibility section.
+
+    Starts from *cached* — pages extracted by an earlier run — when given,
+    so pages already in it are not extracted again.
+
+    Phase 1 tries the PDF outline on its own, then extracts the first
+    TOC_SCAN_LIMIT pages and runs the locator without its LLM pass. Phase 2 extracts the located
+    window and confirms it holds a criteria heading, widening by _WIDEN_PAGES
+    on each side (doubling) up to _MAX_WIDENINGS times.
+
+    Returns (document, location). When the section cannot be found or
+    confirmed, every page is extracted and location is None, so the caller
+    locates as usual.
+    """
+    total = session.page_count
+    # Bookmarks alone may resolve the section — no page needs extracting for that.
+    document = cached or extract_text(pdf_path, pdf_type=pdf_type, session=session, page_numbers=[])
+    location = locate_eligibility_section(document, llm_fallback=False)
+    if location.method == "full_doc_fallback":
+        document = _add_pages(
+            document, pdf_path, pdf_type, session, range(1, min(TOC_SCAN_LIMIT, total) + 1)
+        )
+        location = locate_eligibility_section(document, llm_fallback=False)
+
+    if location.method != "full_doc_fallback":
+        margin = 0
+        for _ in range(_MAX_WIDENINGS + 1):
+            low = max(1, location.start_page - margin)
+            high = min(total, location.end_page + margin)
+            document = _add_pages(document, pdf_path, pdf_type, session, range(low, high + 1))
+            confirmed = confirm_section(document, location, window=(low, high))
+            if confirmed is not None:
+                # The end may now run past the window — extract it, then re-read the stop heading.
+                document = _add_pages(
+                    document,
+                    pdf_path,
+                    pdf_type,
+                    session,
+                    range(confirmed.start_page, confirmed.end_page + 1),
+                )
+                confirmed = confirm_section(document, confirmed) or confirmed
+                log.info(
+                    "pipeline.locate_first_hit",
+                    method=confirmed.method,
+                    start=confirmed.start_page,
+                    end=confirmed.end_page,
+                    extracted_pages=len(document.pages),
+                    total_pages=total,
+                )
+                return document, confirmed
+            if low == 1 and high == total:
+                break
+            margin = margin * 2 or _WIDEN_PAGES
+
+    log.info("pipeline.locate_first_miss", method=location.method, total_pages=total)
+    return _add_pages(document, pdf_path, pdf_type, session, range(1, total + 1)), None
+
+
+def _add_pages(
+    document: ParsedDocument,
+    pdf_path: Path,
+    pdf_type: PDFType,
+    session: DocumentSession,
+    page_numbers: Iterable[int],
+) -> ParsedDocument:
+    """Return *document* with any of *page_numbers* it lacks extracted and merged in."""
+    have = {p.page_number for p in document.pages}
+    missing = [n for n in page_numbers if n not in have]
+    if not missing:
+        return document
+    more = extract_text(pdf_path, pdf_type=pdf_type, session=session, page_numbers=missing)
+    return document.model_copy(update={
+        "pages": sorted([*document.pages, *more.pages], key=lambda p: p.page_number),
+        "extraction_warnings": [*document.extraction_warnings, *more.extraction_warnings],
+    })
+
+
 def run_screening_pipeline(
     request: ScreeningRequest,
     extracted: ExtractedCriteria,
@@ -0,0 +1,84 @@
+"""
+Lexical page retrieval — a pure-Python BM25 index over page text.
+
+The extractor builds one per ParsedDocument as its last step; the section
+locator queries it with criteria vocabulary to rank candidate pages offline
+before paying for an LLM call. The index is memoised on the document (not
+serialised), so documents loaded from the cache or merged from several
+extraction phases rebuild it on first use.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from docu_flow.schemas.pdf import PageText, ParsedDocument
+
+# Words of three or more letters; numbers and OCR fragments only add noise
+_TOKEN_PATTERN = re.compile(r"[a-z]{3,}")
+
+# Standard Okapi BM25 parameters
+_K1 = 1.5
+_B = 0.75
+
+
+@dataclass
+class BM25Index:
+    """Inverted index of term → per-page frequencies, with page lengths for BM25."""
+    page_numbers: list[int]
+    postings: dict[str, list[tuple[int, int]]]  # term → [(row in page_numbers, tf)]
+    lengths: list[int]
+    avg_length: float
+
+    @classmethod
+    def build(cls, pages: list[PageText]) -> BM25Index:
+        postings: dict[str, list[tuple[int, int]]] = {}
+        lengths: list[int] = []
+        for row, page in enumerate(pages):
+            tokens = tokenize(page.text)
+            lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                postings.setdefault(term, []).append((row, tf))
+        avg_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+        return cls([p.page_number for p in pages], postings, lengths, avg_length)
+
+    def search(self, terms: Iterable[str], top_k: int = 10) -> list[tuple[int, float]]:
+        """Return up to *top_k* (page_number, score) pairs, best first; zero scores omitted."""
+        n_pages = len(self.page_numbers)
+        scores = [0.0] * n_pages
+        for term in set(terms):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (n_pages - df + 0.5) / (df + 0.5))
+            for row, tf in postings:
+                norm = _K1 * (1 - _B + _B * self.lengths[row] / (self.avg_length or 1.0))
+                scores[row] += idf * tf * (_K1 + 1) / (tf + norm)
+        ranked = sorted(
+            ((self.page_numbers[row], score) for row, score in enumerate(scores) if score > 0),
+            key=lambda item: (-item[1], item[0]),
+        )
+        return ranked[:top_k]
+
+    def scores(self, terms: Iterable[str]) -> dict[int, float]:
+        """Every page's score for *terms* (page_number → score, zero scores omitted)."""
+        return dict(self.search(terms, top_k=len(self.page_numbers)))
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def page_bm25(document: ParsedDocument) -> BM25Index:
+    """Return *document*'s BM25 index, building it if missing or stale."""
+    index = document._bm25
+    page_numbers = [p.page_number for p in document.pages]
+    if not isinstance(index, BM25Index) or index.page_numbers != page_numbers:
+        index = BM25Index.build(document.pages)
+        document._bm25 = index
+    return index
@@ -2,21 +2,37 @@
 Step 3 — Locate the eligibility criteria section.
 
 Strategy (in priority order):
-  1. Parse the Table of Contents (usually first ~10 pages) and read the page
-     number for the eligibility/inclusion/exclusion criteria entry.
-  2. Fall back to a heuristic body-text scan if no TOC is found.
-  3. Fall back to the fast LLM if heuristics are ambiguous.
+  1. Resolve the section from the PDF's embedded outline (bookmarks), which
+     point at exact physical pages — no page text needed.
+  2. Parse the Table of Contents (usually first ~10 pages) and read the page
+     number for the eligibility/inclusion/exclusion criteria entry, mapped
+     through the PDF page labels and checked against the heading on the page.
+  3. Fall back to a heuristic body-text scan if no TOC is found.
+  4. Fuzzy-match short heading lines against the keyword vocabulary, which
+     survives OCR damage such as "Eligibllity Criterla".
+  5. Rank pages with the document's BM25 index against criteria vocabulary
+     and accept the best run that holds a numbered list — no heading needed.
+  6. Fall back to the fast LLM if heuristics are ambiguous. It sees page
+     snippets around the candidate pages (including the BM25 top pages)
+     only, widening on a miss, and its answer is cached by document hash.
 
 Returns the slice of pages most likely to contain eligibility criteria.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from dataclasses import asdict, dataclass, field, replace
 
+from docu_flow.config import settings
 from docu_flow.logging import log
-from docu_flow.schemas.pdf import PageText, ParsedDocument
+from docu_flow.pipeline.extractor import EXTRACTOR_VERSION
+from docu_flow.pipeline.retrieval import page_bm25, tokenize
+from docu_flow.schemas.pdf import OutlineEntry, PageText, ParsedDocument
+from docu_flow.utils.disk_cache import DiskCache
 
 
 # ---------------------------------------------------------------------------
@@ -62,8 +78,81 @@ _STOP_PATTERNS: list[re.Pattern[str]] = [
     re.compile(r"(?:^|\n)\s*\d*\.?\d*\.?\s*(?:study\s+(?:procedures?|design|objectives?|endpoints?)|treatment\s+(?:plan|regimen|administration)|statistical\s+(?:analysis|considerations)|pharmacokinetics)", re.IGNORECASE),
 ]
 
-# Max pages to scan for TOC
-_TOC_SCAN_LIMIT = 12
+# All locator patterns in one alternation, so each page is traversed once
+# (see _PageIndex). It runs case-insensitively on "\n" + the page text:
+# every line-start construct can then begin with "\n", and the leading
+# lookahead lets the engine skip any position that is not a newline, a dot
+# or the start of a word beginning with one of the keyword/stop/TOC
+# letters. The text is not lowercased, since that can change its length
+# ("İ") and so the offsets used to slice keywords out of it. Order matters
+# where alternatives start at the same offset: a "6. Study Design" line is
+# a stop heading, not a list item. An item only looks ahead at the space
+# after its number, leaving the next line's "\n" to the next item.
+_SCANNER = re.compile(
+    r"(?=[\n.]|\b[eipst])(?:"
+    + "|".join([
+        *(f"(?P<stop{i}>{p.pattern})" for i, p in enumerate(_STOP_PATTERNS)),
+        r"(?P<item>\n\s*\d+[\.\)](?=\s))",
+        *(f"(?P<kw{i}>{p.pattern})" for i, p in enumerate(_CRITERIA_KEYWORDS)),
+        f"(?P<leader>{_TOC_DOT_LEADER_PATTERN.pattern})",
+        f"(?P<toc>{_TOC_HEADER_PATTERN.pattern})",
+    ])
+    + ")",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# Canonical section headings for the fuzzy pass (see _fuzzy_locate)
+_HEADING_VOCABULARY: list[str] = [
+    "inclusion criteria",
+    "exclusion criteria",
+    "inclusion and exclusion criteria",
+    "eligibility criteria",
+    "enrollment criteria",
+    "study population",
+    "patient selection",
+    "subject selection",
+]
+_FUZZY_MIN_SCORE = 85       # rapidfuzz ratio, 0–100
+_FUZZY_MIN_ITEMS = 3        # OCR mangles list numbering too, so fewer than the heuristic's 5
+_HEADING_MAX_WORDS = 6
+# Leading section numbering ("5.", "5.1 ", "12.3.") removed before matching
+_HEADING_NUMBERING = re.compile(r"^[\s\d.]*")
+
+
+def _heading_pattern(name: str) -> re.Pattern[str]:
+    """Match a line that starts, after any section numbering, with the regex *name*."""
+    return re.compile(r"^[\s\d.]*" + name, re.IGNORECASE | re.MULTILINE)
+
+
+# A criteria keyword heading a line on its own ("5.1 Inclusion Criteria:"), as
+# opposed to one mentioned in prose ("... meet all inclusion criteria.")
+_CRITERIA_HEADING = _heading_pattern(
+    "(?:" + "|".join(p.pattern for p in _CRITERIA_KEYWORDS) + r")[\s:]*$"
+)
+
+# BM25 pass: query vocabulary (criteria body text as well as headings), how
+# many top pages to try, the share of the best score a neighbouring page
+# needs to extend the run backwards, and the items the run must hold
+_BM25_QUERY = tokenize(
+    "inclusion exclusion criteria eligibility eligible enrollment enrolment "
+    "participants subjects patients must excluded included history "
+    "pregnant pregnancy breastfeeding consent contraception age years"
+)
+_BM25_TOP_K = 5
+_BM25_RUN_RATIO = 0.5
+_BM25_MIN_ITEMS = 3
+
+# Max pages to scan for TOC (also the pages locate-first extracts up front)
+TOC_SCAN_LIMIT = 12
+
+# LLM pass: pages of context on each side of a candidate, one radius per
+# attempt (then the whole document), and how many candidates to centre on
+_LLM_WINDOW_RADII = (3, 12)
+_LLM_MAX_CANDIDATES = 8
+_LLM_SNIPPET_CHARS = 200
+
+# How far (pages) from a TOC target to look for its heading when the numbers disagree
+_TOC_OFFSET_SEARCH = 20
 
 
 @dataclass
@@ -72,7 +161,9 @@ class SectionLocation:
     end_page: int             # 1-indexed, inclusive
     section_name: str | None
     confidence: float         # 0–1
-    method: str               # "toc" | "heuristic" | "llm" | "full_doc_fallback"
+    method: str               # "outline" | "toc" | "heuristic" | "fuzzy" | "bm25" | "llm" | "full_doc_fallback"
+    tokens_used: int = 0      # LLM input + output tokens spent finding it
+    end_floor: int | None = None  # last page listed for the section (TOC pass)
 
 
 def locate_eligibility_section(
@@ -81,8 +172,22 @@ def locate_eligibility_section(
 ) -> SectionLocation:
     """Return the page range most likely to contain eligibility criteria."""
 
+    # --- Pass 0: PDF bookmarks (no page text needed) ---
+    location = _outline_locate(document)
+    if location is not None:
+        log.info(
+            "section_locator.outline_success",
+            start=location.start_page,
+            end=location.end_page,
+            section=location.section_name,
+        )
+        return location
+
+    # One scan of every page; the remaining passes only query it.
+    index = _PageIndex.build(document)
+
     # --- Pass 1: Parse TOC (fast, high confidence) ---
-    location = _toc_locate(document)
+    location = _toc_locate(document, index)
     if location is not None:
         log.info(
             "section_locator.toc_success",
@@ -93,7 +198,7 @@ def locate_eligibility_section(
         return location
 
     # --- Pass 2: Heuristic body-text scan ---
-    location = _heuristic_locate(document)
+    location = _heuristic_locate(index)
     if location is not None and location.confidence >= 0.7:
         log.info(
             "section_locator.heuristic_success",
@@ -103,11 +208,34 @@ def locate_eligibility_section(
         )
         return location
 
+    # --- Pass 2b: Fuzzy heading match (OCR-damaged headings) ---
+    fuzzy = _fuzzy_locate(document, index)
+    if fuzzy is not None:
+        log.info(
+            "section_locator.fuzzy_success",
+            start=fuzzy.start_page,
+            end=fuzzy.end_page,
+            section=fuzzy.section_name,
+        )
+        return fuzzy
+
+    # --- Pass 2c: BM25 page ranking (no heading needed) ---
+    ranked = _bm25_candidates(document, index)
+    lexical = _bm25_locate(index, ranked)
+    if lexical is not None:
+        log.info(
+            "section_locator.bm25_success",
+            start=lexical.start_page,
+            end=lexical.end_page,
+            confidence=lexical.confidence,
+        )
+        return lexical
+
     # --- Pass 3: LLM fallback ---
     if llm_fallback:
         prior = location or SectionLocation(1, document.total_pages, None, 0.1, "full_doc_fallback")
         log.info("section_locator.llm_fallback", confidence=prior.confidence)
-        return _llm_locate(document, prior)
+        return _llm_locate(document, prior, index, [page for page, _ in ranked])
 
     return location or SectionLocation(1, document.total_pages, None, 0.1, "full_doc_fallback")
 
@@ -120,46 +248,188 @@ def get_section_pages(document: ParsedDocument, location: SectionLocation) -> li
     ]
 
 
+def confirm_section(
+    document: ParsedDocument,
+    location: SectionLocation,
+    window: tuple[int, int] | None = None,
+) -> SectionLocation | None:
+    """
+    Check *location* against the pages actually extracted around it.
+
+    Looks for a non-TOC page within *window* (default: the location itself)
+    with a line headed by a criteria keyword; a keyword mentioned in prose
+    does not count. The start moves to the hit nearest the located start
+    (backing up over directly preceding hits). A bookmark end is kept (or
+    extended, when the start moved); otherwise the end is recomputed from
+    the stop headings, never before the last TOC-listed page. Returns None
+    when no page in the window has such a heading.
+    """
+    low, high = window or (location.start_page, location.end_page)
+    index = _PageIndex.build(document)
+    texts = {p.page_number: p.text for p in document.pages}
+    hits = {
+        page.page_number
+        for page in index.pages
+        if low <= page.page_number <= high
+        and page.keyword
+        and not page.is_toc
+        and _CRITERIA_HEADING.search(texts[page.page_number])
+    }
+    if not hits:
+        return None
+    start = min(hits, key=lambda n: (abs(n - location.start_page), n))
+    while start - 1 in hits:  # e.g. landed on "Exclusion Criteria" after "Inclusion Criteria"
+        start -= 1
+    floor = location.end_floor
+    if location.method == "outline" and start == location.start_page:
+        end = location.end_page  # the next bookmark, which no stop heading need mark
+    elif location.method == "outline":
+        end = max(_find_end_page(index, start), location.end_page)
+    else:
+        # A TOC end was found on the TOC pages alone, often the start+15 guess;
+        # only its last listed page is kept, shifted as the start was
+        if floor is not None:
+            floor += start - location.start_page
+        end = max(_find_end_page(index, start), floor or start)
+    return replace(location, start_page=start, end_page=max(start, end), end_floor=floor)
+
+
+def split_criteria_lists(
+    pages: list[PageText],
+) -> tuple[list[PageText], list[PageText]] | None:
+    """
+    Split section *pages* at the exclusion-criteria heading.
+
+    Returns (inclusion pages, exclusion pages); the heading's page is cut at
+    the heading line, so both halves keep their page numbers. Returns None
+    when no exclusion heading follows at least one numbered inclusion item.
+    """
+    for i, page in enumerate(pages):
+        for match in _CRITERIA_KEYWORDS[0].finditer(page.text):
+            if match.group(1).lower() != "exclusion":
+                continue
+            line_start = page.text.rfind("\n", 0, match.start()) + 1
+            if _HEADING_NUMBERING.sub("", page.text[line_start:match.start()]):
+                continue  # mentioned in a sentence, not a heading
+            inclusion = [*pages[:i], _page_slice(page, page.text[:line_start])]
+            inclusion = [p for p in inclusion if p.text.strip()]
+            if not any(_scan_page(p).items for p in inclusion):
+                return None
+            exclusion = [_page_slice(page, page.text[line_start:]), *pages[i + 1:]]
+            return inclusion, exclusion
+    return None
+
+
+def _page_slice(page: PageText, text: str) -> PageText:
+    return page.model_copy(update={"text": text, "char_count": len(text)})
+
+
+# ---------------------------------------------------------------------------
+# Pass 0 — PDF outline (bookmarks)
+# ---------------------------------------------------------------------------
+
+def _outline_locate(document: ParsedDocument) -> SectionLocation | None:
+    """
+    Resolve the criteria section from the bookmark tree.
+
+    The most specific matching bookmarks win (inclusion/exclusion over
+    eligibility over study population). The section ends on the page of the
+    next bookmark at the same or a higher level — that page is kept, since
+    the criteria usually run on above the next heading.
+    """
+    outline = document.outline
+    matches = [
+        i for i, entry in enumerate(outline)
+        if any(pattern.search(entry.title) for pattern in _CRITERIA_KEYWORDS)
+    ]
+    if not matches:
+        return None
+
+    best = min(_name_specificity(outline[i].title) for i in matches)
+    chosen = [i for i in matches if _name_specificity(outline[i].title) == best]
+    start_page = min(outline[i].page_number for i in chosen)
+    # Ignore same-named bookmarks far away (e.g. a sub-study appendix).
+    chosen = [i for i in chosen if outline[i].page_number <= start_page + 15]
+    # Bookmarks need not be in page order: name the section after the one it starts at
+    first = next(outline[i] for i in chosen if outline[i].page_number == start_page)
+    last = outline[chosen[-1]]
+
+    end_page = min(start_page + 15, document.total_pages)
+    following = _next_sibling(outline, chosen[-1])
+    if following is not None:
+        end_page = following.page_number
+    end_page = max(end_page, last.page_number, start_page)
+
+    log.debug("section_locator.outline_entry", title=first.title, start=start_page, end=end_page)
+    return SectionLocation(
+        start_page=start_page,
+        end_page=end_page,
+        section_name=first.title,
+        confidence=0.97,
+        method="outline",
+    )
+
+
+def _next_sibling(outline: list[OutlineEntry], index: int) -> OutlineEntry | None:
+    """First bookmark after *index* at the same or a higher (smaller) level."""
+    level = outline[index].level
+    for entry in outline[index + 1:]:
+        if entry.level <= level and entry.page_number >= outline[index].page_number:
+            return entry
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Pass 1 — Table of Contents
 # ---------------------------------------------------------------------------
 
-def _toc_locate(document: ParsedDocument) -> SectionLocation | None:
-    """Scan the first few pages for a TOC entry pointing to eligibility criteria."""
-    toc_pages = [p for p in document.pages if p.page_number <= _TOC_SCAN_LIMIT]
+def _toc_locate(document: ParsedDocument, index: _PageIndex) -> SectionLocation | None:
+    """
+    Scan the first few pages for a TOC entry pointing to eligibility criteria.
+
+    Printed TOC numbers are mapped to physical pages through the PDF's page
+    labels when it has them. The chosen entry's heading is then looked for on
+    its target page and, failing that, on nearby pages; a hit there gives the
+    offset between printed and physical numbering (e.g. roman front matter),
+    which is applied to every entry.
+    """
+    toc_pages = [p for p in document.pages if p.page_number <= TOC_SCAN_LIMIT]
 
     # Collect all matching TOC entries across TOC pages
     entries: list[tuple[str, int]] = []  # (section_name, target_page)
 
     for page in toc_pages:
-        if not _is_toc_page(page.text):
+        if not index.hits(page.page_number).is_toc:
             continue
         for match in _TOC_ENTRY_PATTERN.finditer(page.text):
             name = match.group("name").strip()
-            target = int(match.group("page"))
+            printed = match.group("page")
+            target = document.page_labels.get(printed, int(printed))
             entries.append((name, target))
-            log.debug("section_locator.toc_entry", name=name, target_page=target)
+            log.debug("section_locator.toc_entry", name=name, printed_page=printed, target_page=target)
 
     if not entries:
         return None
 
     # Pick the earliest criteria-specific entry as start page.
     # Sort: prefer "inclusion/exclusion criteria" over "study population".
-    def _specificity(entry: tuple[str, int]) -> tuple[int, int]:
-        name_lower = entry[0].lower()
-        if "inclusion" in name_lower or "exclusion" in name_lower:
-            return (0, entry[1])  # most specific, sort by page
-        if "eligib" in name_lower or "enrollment" in name_lower:
-            return (1, entry[1])
-        return (2, entry[1])  # generic: study population, etc.
-
-    entries.sort(key=_specificity)
+    entries.sort(key=lambda entry: (_name_specificity(entry[0]), entry[1]))
     best_name, start_page = entries[0]
 
+    confidence = 0.95
+    offset = _heading_offset(document, index, best_name, start_page)
+    if offset is None:
+        confidence = 0.75  # target page was read and the heading is nowhere near it
+    elif offset:
+        log.info("section_locator.toc_offset", section=best_name, offset=offset)
+        confidence = 0.90
+        entries = [(name, target + offset) for name, target in entries]
+        start_page += offset
+
     # End page: use the latest TOC entry page number + a buffer,
     # or scan for a stop pattern from the actual pages.
-    last_entry_page = max(e[1] for e in entries)
-    end_page = _find_end_page(document.pages, start_page, document.total_pages)
+    last_entry_page = min(max(e[1] for e in entries), document.total_pages)
+    end_page = _find_end_page(index, start_page)
 
     # Make sure we include at least up to the last TOC-listed criteria page
     end_page = max(end_page, last_entry_page)
@@ -168,121 +438,456 @@ def _toc_locate(document: ParsedDocument) -> SectionLocation | None:
         start_page=start_page,
         end_page=end_page,
         section_name=best_name,
-        confidence=0.95,
+        confidence=confidence,
         method="toc",
+        end_floor=last_entry_page,
     )
 
 
+def _heading_offset(
+    document: ParsedDocument,
+    index: _PageIndex,
+    name: str,
+    target: int,
+) -> int | None:
+    """
+    Offset from *target* to the nearest page that starts a line with heading *name*.
+
+    Returns 0 when *target* has not been extracted (nothing to check against),
+    and None when it has but no page within _TOC_OFFSET_SEARCH carries the heading.
+    """
+    page_map = {p.page_number: p for p in document.pages}
+    if target not in page_map:
+        return 0
+    heading = _heading_pattern(r"\s+".join(re.escape(word) for word in name.split()))
+    # Nearest first; on a tie prefer later pages — unlabelled front matter pushes targets back.
+    deltas = sorted(range(-_TOC_OFFSET_SEARCH, _TOC_OFFSET_SEARCH + 1), key=lambda d: (abs(d), d < 0))
+    for delta in deltas:
+        page = page_map.get(target + delta)
+        if page is not None and not index.hits(page.page_number).is_toc and heading.search(page.text):
+            return delta
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Pass 2 — Heuristic body-text scan
 # ---------------------------------------------------------------------------
 
-def _heuristic_locate(document: ParsedDocument) -> SectionLocation | None:
+def _heuristic_locate(index: _PageIndex) -> SectionLocation | None:
     """Scan body pages for section headers with criteria keywords."""
-    pages = document.pages
-    page_map = {p.page_number: p for p in pages}
+    for page in index.pages:
+        if page.is_toc or page.keyword is None:
+            continue
+        start_page = page.page_number
+        end_page = _find_end_page(index, start_page)
+        item_count = _count_criteria_items(index, start_page, end_page)
+        if item_count >= 5:
+            return SectionLocation(
+                start_page=start_page,
+                end_page=end_page,
+                section_name=page.keyword,
+                confidence=0.80,
+                method="heuristic",
+            )
+        # this page didn't have enough items, keep scanning
+
+    return None
 
-    for page in pages:
-        text = page.text
-        if _is_toc_page(text):
+
+# ---------------------------------------------------------------------------
+# Pass 2b — Fuzzy heading match
+# ---------------------------------------------------------------------------
+
+def _fuzzy_locate(document: ParsedDocument, index: _PageIndex) -> SectionLocation | None:
+    """
+    Match heading-like lines against _HEADING_VOCABULARY with rapidfuzz.
+
+    Every short line (after stripping section numbering) on a non-TOC page is
+    a candidate, and all of them are scored against the vocabulary in a
+    single ``process.cdist`` call. Candidates are tried most specific term
+    first, then in page order, and the first whose section holds at least
+    _FUZZY_MIN_ITEMS numbered items wins.
+    """
+    from rapidfuzz import fuzz, process
+
+    headings: list[str] = []
+    heading_pages: list[int] = []
+    for page in document.pages:
+        if index.hits(page.page_number).is_toc:
             continue
-        for pattern in _CRITERIA_KEYWORDS:
-            match = pattern.search(text)
-            if match:
-                start_page = page.page_number
-                end_page = _find_end_page(pages, start_page, document.total_pages)
-                item_count = _count_criteria_items(page_map, start_page, end_page)
-                if item_count >= 5:
-                    return SectionLocation(
-                        start_page=start_page,
-                        end_page=end_page,
-                        section_name=match.group(0).strip(),
-                        confidence=0.80,
-                        method="heuristic",
-                    )
-                break  # this page didn't have enough items, keep scanning
+        for line in page.text.splitlines():
+            words = _HEADING_NUMBERING.sub("", line).split()
+            if 2 <= len(words) <= _HEADING_MAX_WORDS:
+                headings.append(" ".join(words))
+                heading_pages.append(page.page_number)
+    if not headings:
+        return None
+
+    scores = process.cdist(
+        headings,
+        _HEADING_VOCABULARY,
+        scorer=fuzz.ratio,
+        processor=str.lower,
+        score_cutoff=_FUZZY_MIN_SCORE,
+        workers=-1,
+    )
+    best_terms = scores.argmax(axis=1)
+    candidates = sorted(
+        (_name_specificity(_HEADING_VOCABULARY[term]), heading_pages[row], row)
+        for row, term in enumerate(best_terms)
+        if scores[row, term] > 0
+    )
+
+    for _, start_page, row in candidates:
+        end_page = _find_end_page(index, start_page)
+        if _count_criteria_items(index, start_page, end_page) >= _FUZZY_MIN_ITEMS:
+            log.debug(
+                "section_locator.fuzzy_heading",
+                heading=headings[row],
+                page=start_page,
+                score=float(scores[row, best_terms[row]]),
+            )
+            return SectionLocation(
+                start_page=start_page,
+                end_page=end_page,
+                section_name=headings[row],
+                confidence=0.70,
+                method="fuzzy",
+            )
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Pass 2c — BM25 page ranking
+# ---------------------------------------------------------------------------
+
+def _bm25_candidates(document: ParsedDocument, index: _PageIndex) -> list[tuple[int, float]]:
+    """Non-TOC pages ranked by BM25 score for _BM25_QUERY, best first."""
+    ranked = page_bm25(document).search(_BM25_QUERY, top_k=_BM25_TOP_K + TOC_SCAN_LIMIT)
+    return [(page, score) for page, score in ranked if not index.hits(page).is_toc][:_BM25_TOP_K]
 
+
+def _bm25_locate(index: _PageIndex, ranked: list[tuple[int, float]]) -> SectionLocation | None:
+    """
+    Accept the best-ranked page whose section holds a numbered list.
+
+    The start moves back over preceding pages that score at least
+    _BM25_RUN_RATIO of the best page, since criteria lists often span pages
+    and the densest one is rarely the first.
+    """
+    if not ranked:
+        return None
+    best_score = ranked[0][1]
+    scores = dict(ranked)
+    for page_number, _ in ranked:
+        start_page = page_number
+        while scores.get(start_page - 1, 0.0) >= _BM25_RUN_RATIO * best_score:
+            start_page -= 1
+        end_page = _find_end_page(index, start_page)
+        if _count_criteria_items(index, start_page, end_page) >= _BM25_MIN_ITEMS:
+            return SectionLocation(
+                start_page=start_page,
+                end_page=end_page,
+                section_name=None,
+                confidence=0.65,
+                method="bm25",
+            )
     return None
 
 
+# ---------------------------------------------------------------------------
+# Page index — every pattern, one traversal per page
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _PageHits:
+    """What the combined scanner found on one page."""
+    page_number: int
+    keyword: str | None = None   # highest-priority criteria keyword, first occurrence
+    keyword_rank: int = len(_CRITERIA_KEYWORDS)
+    stop: bool = False           # a heading that follows the criteria section
+    items: int = 0               # numbered list items
+    dot_leaders: int = 0         # TOC-style "..... 45" lines
+    toc_header: bool = False
+
+    @property
+    def is_toc(self) -> bool:
+        return self.toc_header or self.dot_leaders >= 3
+
+
+@dataclass
+class _PageIndex:
+    """
+    Per-page pattern hits for a document, built in one pass over its text.
+
+    Stop-heading pages are kept sorted and numbered items as running totals,
+    so end-page and item-count lookups are binary searches rather than
+    scans from page 1 — the heuristic pass asks once per candidate page.
+    """
+    pages: list[_PageHits]
+    total_pages: int
+    by_number: dict[int, _PageHits] = field(default_factory=dict)
+    stop_pages: list[int] = field(default_factory=list)     # ascending
+    page_numbers: list[int] = field(default_factory=list)   # ascending, extracted pages only
+    items_before: list[int] = field(default_factory=list)   # items on page_numbers[:i]
+
+    def __post_init__(self) -> None:
+        self.by_number = {hits.page_number: hits for hits in self.pages}
+        self.page_numbers = sorted(self.by_number)
+        self.stop_pages = [n for n in self.page_numbers if self.by_number[n].stop]
+        self.items_before = [0]
+        for n in self.page_numbers:
+            self.items_before.append(self.items_before[-1] + self.by_number[n].items)
+
+    @classmethod
+    def build(cls, document: ParsedDocument) -> _PageIndex:
+        return cls([_scan_page(page) for page in document.pages], document.total_pages)
+
+    def hits(self, page_number: int) -> _PageHits:
+        return self.by_number.get(page_number) or _PageHits(page_number)
+
+    def next_stop(self, after_page: int) -> int | None:
+        """First page after *after_page* with a stop heading, or None."""
+        i = bisect_right(self.stop_pages, after_page)
+        return self.stop_pages[i] if i < len(self.stop_pages) else None
+
+    def items_between(self, start_page: int, end_page: int) -> int:
+        """Numbered items on pages start_page..end_page inclusive."""
+        low = bisect_left(self.page_numbers, start_page)
+        high = bisect_right(self.page_numbers, end_page)
+        return self.items_before[high] - self.items_before[low] if high > low else 0
+
+
+def _scan_page(page: PageText) -> _PageHits:
+    hits = _PageHits(page.page_number)
+    for match in _SCANNER.finditer("\n" + page.text):
+        kind = match.lastgroup or ""
+        if kind == "item":
+            hits.items += 1
+        elif kind == "leader":
+            hits.dot_leaders += 1
+        elif kind == "toc":
+            hits.toc_header = True
+        elif kind.startswith("stop"):
+            hits.stop = True
+        elif kind.startswith("kw"):
+            rank = int(kind[2:])
+            if rank < hits.keyword_rank:
+                hits.keyword_rank = rank
+                start, end = match.span()
+                hits.keyword = page.text[start - 1:end - 1].strip()
+    return hits
+
+
 # ---------------------------------------------------------------------------
 # Shared helpers
 # ---------------------------------------------------------------------------
 
-def _find_end_page(pages: list[PageText], start_page: int, total_pages: int) -> int:
-    """Scan forward from *start_page* for a stop pattern and return end page."""
-    for page in pages:
-        if page.page_number <= start_page:
-            continue
-        for pattern in _STOP_PATTERNS:
-            if pattern.search(page.text):
-                return page.page_number - 1
-    return min(start_page + 15, total_pages)
+def _find_end_page(index: _PageIndex, start_page: int) -> int:
+    """Return the page before the next stop heading after *start_page*."""
+    stop_page = index.next_stop(start_page)
+    if stop_page is not None:
+        return stop_page - 1
+    return min(start_page + 15, index.total_pages)
 
 
-def _count_criteria_items(
-    page_map: dict[int, PageText],
-    start_page: int,
-    end_page: int,
-) -> int:
+def _count_criteria_items(index: _PageIndex, start_page: int, end_page: int) -> int:
     """Count distinct numbered-list items in the section."""
-    numbered = re.compile(r"^\s*\d+[\.\)]\s", re.MULTILINE)
-    total = 0
-    for pn in range(start_page, end_page + 1):
-        page = page_map.get(pn)
-        if page:
-            total += len(numbered.findall(page.text))
-    return total
+    return index.items_between(start_page, end_page)
 
 
-def _is_toc_page(text: str) -> bool:
-    """Return True if this page looks like a table of contents."""
-    if _TOC_HEADER_PATTERN.search(text):
-        return True
-    dot_leader_lines = len(_TOC_DOT_LEADER_PATTERN.findall(text))
-    return dot_leader_lines >= 3
+def _name_specificity(name: str) -> int:
+    """Rank a section name: 0 inclusion/exclusion, 1 eligibility/enrollment, 2 generic."""
+    name_lower = name.lower()
+    if "inclusion" in name_lower or "exclusion" in name_lower:
+        return 0
+    if "eligib" in name_lower or "enrollment" in name_lower:
+        return 1
+    return 2  # generic: study population, etc.
 
 
 # ---------------------------------------------------------------------------
 # Pass 3 — LLM fallback
 # ---------------------------------------------------------------------------
 
-def _llm_locate(document: ParsedDocument, prior: SectionLocation) -> SectionLocation:
-    """Use the fast LLM to identify which pages contain eligibility criteria."""
+def _llm_locate(
+    document: ParsedDocument,
+    prior: SectionLocation,
+    index: _PageIndex,
+    ranked_pages: list[int],
+) -> SectionLocation:
+    """
+    Use the fast LLM to identify which pages contain eligibility criteria.
+
+    The model sees page snippets only around the candidate pages (the prior
+    location, the BM25 top pages and the pages that mention a criteria
+    keyword). If it reports
+    that the section is not among them, the windows widen, and finally cover
+    the whole document. Answers are cached by document hash, so reprocessing
+    a protocol costs no tokens; tokens_used records what this call spent.
+    """
+    cached = _load_cached_location(document)
+    if cached is not None:
+        return cached
+
+    candidates = _llm_candidates(prior, index, ranked_pages)
+    tokens_used = 0
+    shown: set[int] = set()
+    radii: list[int | None] = [*_LLM_WINDOW_RADII, None] if candidates else [None]
+    for radius in radii:
+        pages = _window_pages(document, candidates, radius)
+        if {p.page_number for p in pages} <= shown:
+            continue  # widening added nothing new
+        shown = {p.page_number for p in pages}
+        answer, tokens = _ask_llm_for_section(pages)
+        tokens_used += tokens
+        if answer is None:
+            continue
+        start, end, name = answer
+        if start in shown and start <= end <= document.total_pages:
+            location = SectionLocation(
+                start_page=start,
+                end_page=end,
+                section_name=name,
+                confidence=0.75,
+                method="llm",
+                tokens_used=tokens_used,
+            )
+            log.info(
+                "section_locator.llm_success",
+                start=start,
+                end=end,
+                pages_shown=len(shown),
+                tokens_used=tokens_used,
+            )
+            _store_cached_location(document, location)
+            return location
+        log.info("section_locator.llm_window_miss", radius=radius, pages_shown=len(shown))
+
+    return replace(prior, tokens_used=tokens_used)
+
+
+def _llm_candidates(
+    prior: SectionLocation,
+    index: _PageIndex,
+    ranked_pages: list[int],
+) -> list[int]:
+    """Pages to centre the LLM's windows on — prior, BM25 top pages, then keyword hits."""
+    keyword_pages = sorted(
+        (hits for hits in index.pages if hits.keyword and not hits.is_toc),
+        key=lambda hits: (_name_specificity(hits.keyword or ""), hits.page_number),
+    )
+    ordered = [hits.page_number for hits in keyword_pages[:_LLM_MAX_CANDIDATES]]
+    ordered = ranked_pages + [page for page in ordered if page not in ranked_pages]
+    candidates = ordered[:_LLM_MAX_CANDIDATES]
+    if prior.method != "full_doc_fallback":
+        candidates.insert(0, prior.start_page)
+    return candidates
+
+
+def _window_pages(
+    document: ParsedDocument,
+    candidates: list[int],
+    radius: int | None,
+) -> list[PageText]:
+    """Pages within *radius* of any candidate (every page when radius is None)."""
+    if radius is None:
+        return list(document.pages)
+    return [
+        page for page in document.pages
+        if any(abs(page.page_number - c) <= radius for c in candidates)
+    ]
+
+
+def _ask_llm_for_section(pages: list[PageText]) -> tuple[tuple[int, int, str | None] | None, int]:
+    """Return ((start, end, section name) or None if not shown, tokens spent)."""
     from docu_flow.utils.llm_client import get_client
-    from docu_flow.config import settings
-    import json
 
     page_snippets = "\n".join(
-        f"[Page {p.page_number}]: {p.text[:200].replace(chr(10), ' ')}"
-        for p in document.pages
+        f"[Page {p.page_number}]: {p.text[:_LLM_SNIPPET_CHARS].replace(chr(10), ' ')}"
+        for p in pages
     )
 
     prompt = (
         "You are analysing a clinical trial protocol document. "
-        "Below is a snippet from the start of each page.\n\n"
+        "Below is a snippet from the start of some of its pages.\n\n"
         f"{page_snippets}\n\n"
         "Identify the START page and END page (inclusive) that contain the "
         "Inclusion and Exclusion Criteria section. "
-        'Reply ONLY with JSON: {"start_page": <int>, "end_page": <int>, "section_name": "<string>"}'
+        'Reply ONLY with JSON: {"start_page": <int>, "end_page": <int>, "section_name": "<string>"}. '
+        'If the section does not start on one of the pages shown, reply {"start_page": null}.'
     )
 
     client = get_client()
+    tokens = 0
     try:
         response = client.messages.create(
             model=settings.fast_llm_model,
             max_tokens=128,
             messages=[{"role": "user", "content": prompt}],
         )
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            tokens = int(usage.input_tokens) + int(usage.output_tokens)
         raw = response.content[0].text.strip()
         data = json.loads(raw)
-        return SectionLocation(
-            start_page=int(data["start_page"]),
-            end_page=int(data["end_page"]),
-            section_name=data.get("section_name"),
-            confidence=0.75,
-            method="llm",
-        )
+        if data.get("start_page") is None:
+            return None, tokens
+        start = int(data["start_page"])
+        end = int(data.get("end_page") or start)
+        return (start, end, data.get("section_name")), tokens
     except Exception as exc:  # noqa: BLE001
         log.warning("section_locator.llm_failed", error=str(exc))
-        return prior
+        return None, tokens
+
+
+# ---------------------------------------------------------------------------
+# LLM location cache — keyed by document hash
+# ---------------------------------------------------------------------------
+
+_location_cache: DiskCache | None = None
+
+
+def _get_location_cache() -> DiskCache:
+    global _location_cache  # noqa: PLW0603
+    root = settings.results_dir / "section_locations"
+    if _location_cache is None or _location_cache.root != root:
+        _location_cache = DiskCache(root, max_bytes=settings.locate_cache_max_mb * 1024 * 1024)
+    return _location_cache
+
+
+def _location_key(document: ParsedDocument) -> str | None:
+    if not settings.locate_cache_enabled or document.sha256 is None:
+        return None
+    model = hashlib.sha256(settings.fast_llm_model.encode("utf-8")).hexdigest()[:12]
+    return f"{document.sha256}-{model}-v{EXTRACTOR_VERSION}"
+
+
+def _load_cached_location(document: ParsedDocument) -> SectionLocation | None:
+    key = _location_key(document)
+    data = _get_location_cache().get(key) if key else None
+    if data is None:
+        return None
+    try:
+        entry = json.loads(data)
+        location = SectionLocation(
+            start_page=int(entry["start_page"]),
+            end_page=int(entry["end_page"]),
+            section_name=entry.get("section_name"),
+            confidence=float(entry["confidence"]),
+            method=entry["method"],
+        )
+    except (ValueError, KeyError, TypeError) as exc:
+        log.warning("section_locator.cache_corrupt", key=key, error=str(exc))
+        return None
+    log.info("section_locator.llm_cache_hit", start=location.start_page, end=location.end_page)
+    return location
+
+
+def _store_cached_location(document: ParsedDocument, location: SectionLocation) -> None:
+    key = _location_key(document)
+    if key is None:
+        return
+    entry = asdict(location)
+    entry.pop("tokens_used")
+    _get_location_cache().put(key, json.dumps(entry).encode("utf-8"))
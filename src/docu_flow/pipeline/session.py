@@ -0,0 +1,103 @@
+"""
+Per-job document session — one open PDF shared by every pipeline step.
+
+The session reads the file bytes once, hashes them, and opens the PyMuPDF
+document from the in-memory buffer. Native page text is memoised so that the
+classifier's sampled pages are not extracted a second time by the extractor,
+and so is each page's structural PageKind, which lets the extractor send
+image-only pages straight to OCR. Pages that mix a text layer with images
+are not a separate kind: the extractor OCRs their image blocks when their
+native text is short.
+
+Usage:
+    with DocumentSession.open(pdf_path) as session:
+        pdf_type = classify_pdf(pdf_path, session=session)
+        document = extract_text(pdf_path, pdf_type=pdf_type, session=session)
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from types import TracebackType
+
+import fitz  # PyMuPDF
+
+from docu_flow.schemas.pdf import PageKind
+from docu_flow.utils.pdf_utils import pdf_sha256
+
+
+class DocumentSession:
+    """An open ``fitz.Document`` plus memoised per-page native text and PageKind."""
+
+    def __init__(self, pdf_path: Path, doc: fitz.Document, data: bytes | None = None) -> None:
+        self.pdf_path = pdf_path
+        self.doc = doc
+        self._data = data
+        self._sha256: str | None = None
+        self._page_text: dict[int, str] = {}
+        self._page_kind: dict[int, PageKind] = {}
+
+    @classmethod
+    def open(cls, pdf_path: Path) -> DocumentSession:
+        """
+        Read *pdf_path* once and open it from memory.
+
+        Raises:
+            fitz.FileDataError: if the bytes are not a readable PDF.
+        """
+        data = pdf_path.read_bytes()
+        doc = fitz.open(stream=data, filetype="pdf")
+        return cls(pdf_path, doc, data)
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 of the file — computed from the buffer already in memory."""
+        if self._sha256 is None:
+            if self._data is not None:
+                self._sha256 = hashlib.sha256(self._data).hexdigest()
+            else:
+                self._sha256 = pdf_sha256(self.pdf_path)
+        return self._sha256
+
+    @property
+    def page_count(self) -> int:
+        return len(self.doc)
+
+    def page_text(self, page_index: int) -> str:
+        """Return the raw native text of the 0-indexed page, extracting it at most once."""
+        text = self._page_text.get(page_index)
+        if text is None:
+            text = self.doc[page_index].get_text("text")
+            self._page_text[page_index] = text
+        return text
+
+    def page_kind(self, page_index: int) -> PageKind:
+        """
+        Classify the 0-indexed page from its resources, memoised.
+
+        A page without fonts cannot carry a text layer, so it is IMAGE without
+        ever calling get_text().
+        """
+        kind = self._page_kind.get(page_index)
+        if kind is None:
+            kind = PageKind.TEXT if self.doc[page_index].get_fonts() else PageKind.IMAGE
+            self._page_kind[page_index] = kind
+        return kind
+
+    def close(self) -> None:
+        self._page_text.clear()
+        self._page_kind.clear()
+        self.doc.close()
+
+    def __enter__(self) -> DocumentSession:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
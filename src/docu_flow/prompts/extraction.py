@@ -5,6 +5,8 @@ Keeping prompts in one module makes them easy to version, A/B test,
 and iterate on without touching pipeline logic.
 """
 
+# Temporal / numeric / conditional / ambiguous flags are not requested from the
+# model; pipeline.flagger sets them from the criterion text after extraction.
 EXTRACTION_SYSTEM = """\
 You are a clinical trial protocol analyst. Your task is to extract eligibility criteria
 from the provided section of a clinical trial protocol.
@@ -12,13 +14,8 @@ from the provided section of a clinical trial protocol.
 Rules:
 1. Extract EVERY inclusion and exclusion criterion verbatim — do not paraphrase.
 2. For each criterion, cite the page number using the [PAGE N] markers in the text.
-3. Flag criteria that contain:
-   - Temporal conditions: "within X weeks/months/years"
-   - Numeric thresholds: numbers with units (eGFR, HbA1c, creatinine, etc.)
-   - Conditional logic: "unless", "except when", "if", "provided that"
-   - Ambiguous language: "clinically significant", "adequate", "appropriate"
-4. Do NOT invent or infer criteria not explicitly stated in the document.
-5. Output ONLY valid JSON. No markdown, no prose outside the JSON object.
+3. Do NOT invent or infer criteria not explicitly stated in the document.
+4. Output ONLY valid JSON. No markdown, no prose outside the JSON object.
 """
 
 SECTION_DETECTION_SYSTEM = """\
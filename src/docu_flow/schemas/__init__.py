@@ -6,7 +6,7 @@ from docu_flow.schemas.criteria import (
     ScreeningRequest,
     ScreeningResult,
 )
-from docu_flow.schemas.pdf import PDFType, ParsedDocument, PageText
+from docu_flow.schemas.pdf import OutlineEntry, PDFType, PageKind, ParsedDocument, PageText
 
 __all__ = [
     "CriterionType",
@@ -15,7 +15,9 @@ __all__ = [
     "ScreeningDecision",
     "ScreeningRequest",
     "ScreeningResult",
+    "OutlineEntry",
     "PDFType",
+    "PageKind",
     "ParsedDocument",
     "PageText",
 ]
@@ -50,6 +50,13 @@ class ExtractionMetadata(BaseModel):
     section_found: bool
     section_name: str | None = None
     warnings: list[str] = Field(default_factory=list)
+    # Running headers/footers stripped from the section text before prompting
+    boilerplate_chars_removed: int = 0
+    tokens_saved: int = 0  # prompt tokens counted with boilerplate minus without
+    chunk_count: int = 1   # extraction calls the section was split into (0 when parsed)
+    # "llm", or "parsed" when numbered lists were cut locally without the primary model
+    extraction_method: str = "llm"
+    structural_confidence: float | None = None  # 1.0 when parsed lists were numbered in sequence
 
 
 class ExtractedCriteria(BaseModel):
@@ -10,7 +10,9 @@ else:
     class StrEnum(str, Enum):  # type: ignore[no-redef]
         pass
 
-from pydantic import BaseModel, Field
+from typing import Any
+
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class PDFType(StrEnum):
@@ -21,20 +23,43 @@ class PDFType(StrEnum):
     UNKNOWN = "unknown"
 
 
+class PageKind(StrEnum):
+    """Structural page type, read from page resources without extracting text."""
+    TEXT = "text"      # fonts present — native extraction first
+    IMAGE = "image"    # no fonts — there is no text layer to extract
+
+
 class PageText(BaseModel):
     page_number: int
     text: str
     char_count: int
     ocr_used: bool = False
     confidence: float = Field(default=1.0, ge=0.0, le=1.0)
+    ocr_dpi: int | None = None  # render resolution of the OCR tier that produced the text
+
+
+class OutlineEntry(BaseModel):
+    """One bookmark from the PDF's embedded outline."""
+    level: int        # 1 = top level
+    title: str
+    page_number: int  # 1-indexed physical page the bookmark points at
 
 
 class ParsedDocument(BaseModel):
     source_filename: str
+    sha256: str | None = None  # hex digest of the source PDF bytes
     pdf_type: PDFType
     total_pages: int
+    # Extracted pages in page order — a subset of 1..total_pages when only
+    # some pages were requested (locate-first mode).
     pages: list[PageText]
+    outline: list[OutlineEntry] = Field(default_factory=list)
+    # Printed page label → 1-indexed physical page; empty when the PDF defines no labels
+    page_labels: dict[str, int] = Field(default_factory=dict)
     extraction_warnings: list[str] = Field(default_factory=list)
+    # BM25 page index (pipeline.retrieval.BM25Index) — built at extraction
+    # time, never serialised; see retrieval.page_bm25().
+    _bm25: Any = PrivateAttr(default=None)
 
     @property
     def full_text(self) -> str:
@@ -0,0 +1,90 @@
+"""Size-bounded on-disk key/value cache with least-recently-used eviction."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+from docu_flow.logging import log
+
+
+class DiskCache:
+    """
+    One file per key under *root*, evicted oldest-access-first once the
+    directory grows past *max_bytes*.
+
+    Access time is tracked with the file mtime (touched on every hit), so the
+    cache survives restarts and can be shared by several worker processes.
+    Writes are atomic (temp file + rename); concurrent writers of the same
+    key simply race to an identical result.
+    """
+
+    def __init__(self, root: Path, max_bytes: int, suffix: str = ".json") -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self._size: int | None = None  # lazily computed running total
+
+    def path_for(self, key: str) -> Path:
+        # Two-character fan-out keeps directories small for hash-like keys.
+        return self.root / key[:2] / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> bytes | None:
+        path = self.path_for(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            log.warning("disk_cache.read_failed", path=str(path), error=str(exc))
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self.path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as exc:
+            log.warning("disk_cache.write_failed", path=str(path), error=str(exc))
+            return
+
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.root.glob(f"*/*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until the cache is under 90% of its budget."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        self._size = total
+        log.debug("disk_cache.evicted", root=str(self.root), removed=removed, bytes=total)
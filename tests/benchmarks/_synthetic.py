@@ -0,0 +1,77 @@
+"""Synthetic protocol builders shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from docu_flow.schemas.pdf import ParsedDocument
+
+_FILLER = (
+    "Subjects will attend scheduled visits at which vital signs, concomitant "
+    "medications and adverse events are recorded by the site investigator. "
+)
+
+
+def make_text_pdf(path: Path, n_pages: int, lines_per_page: int = 40) -> Path:
+    """Write an *n_pages* native-text PDF to *path* (one numbered paragraph per line)."""
+    import fitz  # PyMuPDF
+
+    doc = fitz.open()
+    for page_number in range(1, n_pages + 1):
+        page = doc.new_page()
+        text = "\n".join(
+            f"{page_number}.{line} {_FILLER[: 60 + (line * 7) % 40]}"
+            for line in range(lines_per_page)
+        )
+        page.insert_textbox(fitz.Rect(50, 50, 560, 780), text, fontsize=8)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def make_protocol_document(n_pages: int, mention_every: int = 7) -> ParsedDocument:
+    """
+    An in-memory *n_pages* protocol for the section-locator benchmarks.
+
+    Page 2 is a TOC without a criteria entry, every *mention_every*-th body page
+    mentions "study population" in running text (each one a heuristic
+    candidate that fails for lack of list items), a "Study Design" heading
+    every 10 pages closes those candidates, and the real criteria section
+    sits at 80% of the document.
+    """
+    from docu_flow.schemas.pdf import PDFType, PageText, ParsedDocument
+
+    criteria_page = max(3, int(n_pages * 0.8))
+    items = "\n".join(f"{i}. Patients must meet requirement {i}." for i in range(1, 13))
+    texts: list[str] = []
+    for page_number in range(1, n_pages + 1):
+        if page_number == 2:
+            text = "Table of Contents\n" + "\n".join(
+                f"{n}. Section {n} ........ {n * 5}" for n in range(1, 30)
+            )
+        elif page_number == criteria_page:
+            text = f"5. Inclusion and Exclusion Criteria\n{items}"
+        elif page_number == criteria_page + 1:
+            text = f"5.2 Exclusion Criteria\n{items}"
+        elif page_number == criteria_page + 2:
+            text = "6. Study Procedures\n" + _FILLER * 4
+        elif page_number % 10 == 5 and page_number < criteria_page:
+            text = f"{page_number // 10}. Study Design\n" + _FILLER * 4
+        elif page_number % mention_every == 0 and not criteria_page - 10 < page_number < criteria_page:
+            text = f"The study population is described in section 5. {_FILLER * 4}"
+        else:
+            text = _FILLER * 5
+        texts.append(text)
+
+    return ParsedDocument(
+        source_filename="synthetic.pdf",
+        pdf_type=PDFType.TEXT,
+        total_pages=n_pages,
+        pages=[
+            PageText(page_number=i + 1, text=text, char_count=len(text))
+            for i, text in enumerate(texts)
+        ],
+    )
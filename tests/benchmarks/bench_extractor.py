@@ -0,0 +1,74 @@
+"""
+Benchmark extract_text throughput (pages/sec) as extraction workers scale.
+
+Usage:
+    # Synthetic 400-page native-text protocol, workers 1,2,4,8,16:
+    python tests/benchmarks/bench_extractor.py
+
+    # A real protocol, custom worker counts:
+    python tests/benchmarks/bench_extractor.py path/to/protocol.pdf --workers 1,4,16
+
+    # Larger synthetic document:
+    python tests/benchmarks/bench_extractor.py --pages 600
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).parents[2]
+sys.path.insert(0, str(_PROJECT_ROOT))
+sys.path.insert(0, str(_PROJECT_ROOT / "src"))
+
+os.environ.setdefault("ANTHROPIC_API_KEY", "benchmark")
+
+from docu_flow.config import settings  # noqa: E402
+from docu_flow.pipeline.extractor import extract_text  # noqa: E402
+from docu_flow.schemas.pdf import PDFType  # noqa: E402
+from tests.benchmarks._synthetic import make_text_pdf  # noqa: E402
+
+
+def _time_extract(pdf_path: Path, pdf_type: PDFType | None, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    pages = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        document = extract_text(pdf_path, pdf_type=pdf_type)
+        best = min(best, time.perf_counter() - start)
+        pages = document.total_pages
+    return best, pages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdf", nargs="?", type=Path, help="PDF to benchmark (default: synthetic)")
+    parser.add_argument("--pages", type=int, default=400, help="synthetic document length")
+    parser.add_argument("--workers", default="1,2,4,8,16", help="comma-separated worker counts")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per setting (best is reported)")
+    args = parser.parse_args()
+
+    worker_counts = [int(w) for w in args.workers.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = args.pdf or make_text_pdf(Path(tmp) / "synthetic.pdf", args.pages)
+        pdf_type = None if args.pdf else PDFType.TEXT
+
+        settings.extraction_parallel_min_pages = 1
+        print(f"PDF: {pdf_path}  (cpu_count={os.cpu_count()})")
+        print(f"{'workers':>8}  {'seconds':>8}  {'pages/sec':>10}  {'speedup':>8}")
+
+        baseline: float | None = None
+        for workers in worker_counts:
+            settings.extraction_workers = workers
+            seconds, pages = _time_extract(pdf_path, pdf_type, args.repeat)
+            baseline = baseline or seconds
+            print(f"{workers:>8}  {seconds:>8.2f}  {pages / seconds:>10.1f}  {baseline / seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
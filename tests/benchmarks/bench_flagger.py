@@ -0,0 +1,119 @@
+"""
+Benchmark the local flagger against LLM-set criterion flags.
+
+For each protocol, reports how often flag_text() agrees with the reference
+flags (per flag and overall), the output tokens the four flags cost when the
+model generated them, and the local flagging time.
+
+Reference flags come from ExtractedCriteria JSON files written before the
+flags moved out of the LLM schema (``docu-flow process ... --output x.json``),
+so they were set by the model. Without files, a built-in sample of criterion
+texts is flagged for timing and tokens only; no agreement is reported.
+
+Usage:
+    # Built-in sample (timing and tokens only):
+    python tests/benchmarks/bench_flagger.py
+
+    # Earlier extraction results, listing every disagreement:
+    python tests/benchmarks/bench_flagger.py results/*.json --show
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).parents[2]
+sys.path.insert(0, str(_PROJECT_ROOT))
+sys.path.insert(0, str(_PROJECT_ROOT / "src"))
+
+os.environ.setdefault("ANTHROPIC_API_KEY", "benchmark")
+
+from docu_flow.pipeline.criteria_extractor import _CHARS_PER_TOKEN  # noqa: E402
+from docu_flow.pipeline.flagger import FLAG_FIELDS, flag_text  # noqa: E402
+
+# Unlabelled criterion texts, for timing and tokens only: the flag patterns
+# were written against these, so agreement on them would prove nothing
+_SAMPLE: list[str] = [
+    "Age ≥ 18 years at the time of signing informed consent",
+    "ECOG performance status of 0 or 1",
+    "Histologically confirmed non-small cell lung cancer",
+    "Adequate bone marrow function: ANC ≥ 1.5 × 10^9/L",
+    "Creatinine clearance ≥ 60 mL/min",
+    "Life expectancy of at least 12 weeks",
+    "Women of childbearing potential must have a negative pregnancy test within 7 days "
+    "prior to the first dose",
+    "Willing to use contraception if of childbearing potential",
+    "Prior treatment with an anti-PD-1 or anti-PD-L1 antibody",
+    "Chemotherapy or radiotherapy within 4 weeks before randomisation",
+    "Active brain metastases, unless treated and stable for at least 4 weeks",
+    "Clinically significant cardiovascular disease",
+    "QTcF > 470 ms",
+    "Known HIV infection",
+    "Active hepatitis B or C infection",
+    "Pregnant or breastfeeding",
+    "Major surgery within 28 days of study entry",
+    "HbA1c greater than 10% at screening",
+    "Uncontrolled hypertension (systolic BP > 160 mmHg)",
+    "Any condition that, in the opinion of the investigator, would interfere with "
+    "study participation",
+    "Prior malignancy, except adequately treated basal cell carcinoma",
+    "Body mass index below 18.5 kg/m2",
+    "Participation in another interventional study in the past 30 days",
+    "History of severe hypersensitivity reaction to monoclonal antibodies",
+]
+
+
+def _load(paths: list[Path]) -> list[tuple[str, list[dict], bool]]:
+    """(name, criteria, whether the criteria carry reference flags) per input."""
+    if not paths:
+        return [("built-in sample", [{"text": text} for text in _SAMPLE], False)]
+    return [(path.name, json.loads(path.read_text())["criteria"], True) for path in paths]
+
+
+def _flag_tokens() -> float:
+    """Output tokens the four flags cost per criterion in the old response schema."""
+    fragment = json.dumps({field: False for field in FLAG_FIELDS}, indent=2)[1:-1] + ","
+    return len(fragment) / _CHARS_PER_TOKEN
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("results", nargs="*", type=Path, help="ExtractedCriteria JSON files")
+    parser.add_argument("--show", action="store_true", help="print every disagreement")
+    args = parser.parse_args()
+
+    per_criterion_tokens = _flag_tokens()
+    short = dict(zip(FLAG_FIELDS, ("temporal", "numeric", "condition", "ambiguous"), strict=True))
+    print(f"{'protocol':>24}  {'criteria':>8}  "
+          + "  ".join(f"{short[f]:>9}" for f in FLAG_FIELDS)
+          + f"  {'overall':>8}  {'tok saved':>9}  {'µs/crit':>7}")
+
+    for name, criteria, labelled in _load(args.results):
+        agree = dict.fromkeys(FLAG_FIELDS, 0)
+        started = time.perf_counter()
+        local = [flag_text(c["text"]) for c in criteria]
+        micros = 1e6 * (time.perf_counter() - started) / max(len(criteria), 1)
+        for criterion, flags in zip(criteria, local, strict=True):
+            for field in FLAG_FIELDS:
+                if flags[field] == bool(criterion.get(field, False)):
+                    agree[field] += 1
+                elif args.show and labelled:
+                    print(f"  {field}: reference={criterion.get(field)} local={flags[field]}"
+                          f"  {criterion['text'][:80]!r}")
+        n = max(len(criteria), 1)
+        if labelled:
+            overall = sum(agree.values()) / (n * len(FLAG_FIELDS))
+            rates = [f"{agree[f] / n:>9.1%}" for f in FLAG_FIELDS] + [f"{overall:>8.1%}"]
+        else:
+            rates = [f"{'-':>9}" for _ in FLAG_FIELDS] + [f"{'-':>8}"]
+        print(f"{name[:24]:>24}  {len(criteria):>8}  " + "  ".join(rates)
+              + f"  {per_criterion_tokens * len(criteria):>9.0f}  {micros:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
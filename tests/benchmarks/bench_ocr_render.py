@@ -0,0 +1,116 @@
+"""
+Microbenchmark the OCR render handoff: RGB → PNG → PIL decode (old) versus a
+grayscale pixmap whose samples are wrapped in place (current _render_page).
+
+Each mode runs in a fresh subprocess so peak RSS is measured independently.
+
+Usage:
+    # Synthetic 20-page protocol at 300 DPI:
+    python tests/benchmarks/bench_ocr_render.py
+
+    # A real protocol, first 10 pages, 200 DPI:
+    python tests/benchmarks/bench_ocr_render.py path/to/protocol.pdf --pages 10 --dpi 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).parents[2]
+sys.path.insert(0, str(_PROJECT_ROOT))
+sys.path.insert(0, str(_PROJECT_ROOT / "src"))
+
+os.environ.setdefault("ANTHROPIC_API_KEY", "benchmark")
+
+MODES = ("png_rgb", "gray_buffer")
+
+
+def _render_png_rgb(page, dpi: int) -> None:
+    import fitz
+    from PIL import Image
+
+    mat = fitz.Matrix(dpi / 72, dpi / 72)
+    pix = page.get_pixmap(matrix=mat, colorspace=fitz.csRGB)
+    image = Image.open(io.BytesIO(pix.tobytes("png")))
+    image.load()  # force the decode Tesseract would otherwise trigger
+    image.close()
+
+
+def _render_gray_buffer(page, dpi: int) -> None:
+    from docu_flow.pipeline.extractor import _render_page
+
+    rendered = _render_page(page, page.number + 1, dpi)
+    assert rendered is not None
+    rendered.image.load()
+    rendered.close()
+
+
+def _run_mode(mode: str, pdf_path: Path, pages: int, dpi: int) -> dict[str, float]:
+    """Child-process body: render *pages* pages with *mode* and report timings."""
+    import fitz
+
+    import docu_flow.pipeline.extractor  # noqa: F401 — same import footprint in both modes
+
+    render = _render_png_rgb if mode == "png_rgb" else _render_gray_buffer
+    doc = fitz.open(str(pdf_path))
+    count = min(pages, len(doc))
+    timings = []
+    for i in range(count):
+        start = time.perf_counter()
+        render(doc[i], dpi)
+        timings.append(time.perf_counter() - start)
+    doc.close()
+    return {
+        "pages": count,
+        "ms_per_page": 1000 * sum(timings) / count,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdf", nargs="?", type=Path, help="PDF to render (default: synthetic)")
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)  # child-process entry
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(_run_mode(args.mode, args.pdf, args.pages, args.dpi)))
+        return
+
+    from tests.benchmarks._synthetic import make_text_pdf
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = args.pdf or make_text_pdf(Path(tmp) / "synthetic.pdf", args.pages)
+        print(f"PDF: {pdf_path}  dpi={args.dpi}")
+        print(f"{'mode':>12}  {'ms/page':>8}  {'peak RSS MB':>12}")
+        results = {}
+        for mode in MODES:
+            out = subprocess.run(
+                [sys.executable, __file__, str(pdf_path), "--mode", mode,
+                 "--pages", str(args.pages), "--dpi", str(args.dpi)],
+                capture_output=True, text=True, check=True,
+            ).stdout.strip().splitlines()[-1]
+            results[mode] = json.loads(out)
+            r = results[mode]
+            print(f"{mode:>12}  {r['ms_per_page']:>8.1f}  {r['peak_rss_mb']:>12.1f}")
+
+        old, new = results["png_rgb"], results["gray_buffer"]
+        print(
+            f"\nspeedup {old['ms_per_page'] / new['ms_per_page']:.1f}x, "
+            f"peak RSS {old['peak_rss_mb'] - new['peak_rss_mb']:.1f} MB lower"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Benchmark section location on a long protocol: per-pattern scans vs the page index.
+
+"legacy" re-implements the locator passes as they were before the single-pass
+page index (each pass re-running every regex on every page); "indexed" is
+the current section_locator, which scans each page once with the combined
+alternation and answers every pass from that index.
+
+Usage:
+    # Synthetic 1,000-page protocol:
+    python tests/benchmarks/bench_section_locator.py
+
+    # A real protocol (text is extracted first, not timed):
+    python tests/benchmarks/bench_section_locator.py path/to/protocol.pdf
+
+    # Longer synthetic document, more "study population" mentions:
+    python tests/benchmarks/bench_section_locator.py --pages 3000 --mention-every 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).parents[2]
+sys.path.insert(0, str(_PROJECT_ROOT))
+sys.path.insert(0, str(_PROJECT_ROOT / "src"))
+
+os.environ.setdefault("ANTHROPIC_API_KEY", "benchmark")
+
+from docu_flow.pipeline import section_locator  # noqa: E402
+from docu_flow.pipeline.extractor import extract_text  # noqa: E402
+from docu_flow.schemas.pdf import PageText, ParsedDocument  # noqa: E402
+from tests.benchmarks._synthetic import make_protocol_document  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Legacy passes — one regex search per pattern per page, per pass
+# ---------------------------------------------------------------------------
+
+def _legacy_is_toc_page(text: str) -> bool:
+    if section_locator._TOC_HEADER_PATTERN.search(text):
+        return True
+    return len(section_locator._TOC_DOT_LEADER_PATTERN.findall(text)) >= 3
+
+
+def _legacy_find_end_page(pages: list[PageText], start_page: int, total_pages: int) -> int:
+    for page in pages:
+        if page.page_number <= start_page:
+            continue
+        for pattern in section_locator._STOP_PATTERNS:
+            if pattern.search(page.text):
+                return page.page_number - 1
+    return min(start_page + 15, total_pages)
+
+
+def _legacy_count_items(page_map: dict[int, PageText], start_page: int, end_page: int) -> int:
+    numbered = re.compile(r"^\s*\d+[\.\)]\s", re.MULTILINE)
+    return sum(
+        len(numbered.findall(page_map[pn].text))
+        for pn in range(start_page, end_page + 1)
+        if pn in page_map
+    )
+
+
+def _legacy_locate(document: ParsedDocument) -> tuple[int, int] | None:
+    # TOC pass: only decides whether the first pages are TOC pages here
+    for page in document.pages[: section_locator.TOC_SCAN_LIMIT]:
+        if _legacy_is_toc_page(page.text):
+            list(section_locator._TOC_ENTRY_PATTERN.finditer(page.text))
+
+    pages = document.pages
+    page_map = {p.page_number: p for p in pages}
+    for page in pages:
+        if _legacy_is_toc_page(page.text):
+            continue
+        for pattern in section_locator._CRITERIA_KEYWORDS:
+            if pattern.search(page.text):
+                end = _legacy_find_end_page(pages, page.page_number, document.total_pages)
+                if _legacy_count_items(page_map, page.page_number, end) >= 5:
+                    return page.page_number, end
+                break
+    return None
+
+
+def _indexed_locate(document: ParsedDocument) -> tuple[int, int] | None:
+    location = section_locator.locate_eligibility_section(document, llm_fallback=False)
+    if location.method == "full_doc_fallback":
+        return None
+    return location.start_page, location.end_page
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+def _best_of(fn: Callable[[ParsedDocument], object], document: ParsedDocument, repeat: int) -> tuple[float, object]:
+    best = float("inf")
+    result: object = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(document)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdf", nargs="?", type=Path, help="PDF to benchmark (default: synthetic)")
+    parser.add_argument("--pages", type=int, default=1000, help="synthetic document length")
+    parser.add_argument("--mention-every", type=int, default=7, help="synthetic 'study population' spacing")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per variant (best is reported)")
+    args = parser.parse_args()
+
+    if args.pdf:
+        document = extract_text(args.pdf)
+    else:
+        document = make_protocol_document(args.pages, mention_every=args.mention_every)
+
+    print(f"document: {document.source_filename}  pages={document.total_pages}")
+    print(f"{'variant':>10}  {'ms':>9}  {'speedup':>8}  result")
+
+    index_ms, _ = _best_of(section_locator._PageIndex.build, document, args.repeat)
+    legacy_s, legacy = _best_of(_legacy_locate, document, args.repeat)
+    indexed_s, indexed = _best_of(_indexed_locate, document, args.repeat)
+
+    print(f"{'legacy':>10}  {1000 * legacy_s:>9.1f}  {1.0:>7.2f}x  {legacy}")
+    print(f"{'indexed':>10}  {1000 * indexed_s:>9.1f}  {legacy_s / indexed_s:>7.2f}x  {indexed}")
+    print(f"{'(build)':>10}  {1000 * index_ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Unit-test fixtures: tiny native-text PDFs built in memory with PyMuPDF."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import fitz
+import pytest
+
+from docu_flow.config import settings
+
+
+@pytest.fixture(autouse=True)
+def _isolated_results_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep on-disk caches under results_dir private to each test."""
+    monkeypatch.setattr(settings, "results_dir", tmp_path / "results")
+
+
+@pytest.fixture
+def make_pdf(tmp_path: Path) -> Callable[[list[str]], Path]:
+    """Factory: write one page per string in *page_texts* and return the PDF path."""
+
+    def _make(page_texts: list[str], name: str = "test.pdf") -> Path:
+        doc = fitz.open()
+        for text in page_texts:
+            page = doc.new_page()
+            page.insert_textbox(fitz.Rect(50, 50, 560, 780), text, fontsize=9)
+        path = tmp_path / name
+        doc.save(str(path))
+        doc.close()
+        return path
+
+    return _make
+
+
+@pytest.fixture
+def text_pdf(make_pdf: Callable[..., Path]) -> Path:
+    """A 12-page native-text PDF with > 100 chars on every page."""
+    return make_pdf([f"Page {i + 1} " + "protocol text " * 20 for i in range(12)])
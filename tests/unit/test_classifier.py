@@ -70,6 +70,34 @@ class TestClassifyPDF:
         result = classify_pdf(Path("fake.pdf"))
         assert result == PDFType.HYBRID
 
+    @patch("docu_flow.pipeline.classifier.fitz.open")
+    def test_image_only_pages_skip_text_extraction(self, mock_open):
+        doc = MagicMock()
+        doc.is_encrypted = False
+        pages = [self._make_mock_page(0) for _ in range(4)]
+        for page in pages:
+            page.get_fonts.return_value = []  # no fonts → no text layer
+        doc.__getitem__ = lambda self, i: pages[i]
+        doc.__len__ = lambda self: 4
+        mock_open.return_value = doc
+
+        result = classify_pdf(Path("fake.pdf"))
+        assert result == PDFType.SCANNED
+        for page in pages:
+            page.get_text.assert_not_called()
+
+    @patch("docu_flow.pipeline.classifier.fitz.open")
+    def test_hybrid_stops_sampling_early(self, mock_open):
+        doc = MagicMock()
+        doc.is_encrypted = False
+        pages = [self._make_mock_page(500 if i == 0 else 0) for i in range(10)]
+        doc.__getitem__ = lambda self, i: pages[i]
+        doc.__len__ = lambda self: 10
+        mock_open.return_value = doc
+
+        assert classify_pdf(Path("fake.pdf")) == PDFType.HYBRID
+        assert pages[2].get_text.call_count == 0
+
     @patch("docu_flow.pipeline.classifier.fitz.open")
     def test_encrypted_pdf(self, mock_open):
         doc = MagicMock()
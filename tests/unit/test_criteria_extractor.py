@@ -0,0 +1,441 @@
+"""Unit tests for criteria_extractor helpers (no API calls)."""
+
+import json
+import re
+import threading
+from types import SimpleNamespace
+
+from docu_flow.config import settings
+from docu_flow.pipeline import criteria_extractor
+from docu_flow.pipeline.criteria_extractor import (
+    _boilerplate_lines,
+    _build_section_text,
+    _parse_numbered_list,
+    _split_section,
+    _structural_confidence,
+    extract_criteria,
+)
+from docu_flow.schemas.pdf import PDFType, PageText, ParsedDocument
+
+
+def _page(number: int, body: str) -> PageText:
+    text = (
+        f"Protocol ABC-123 Amendment 2\nCONFIDENTIAL\n{body}\n"
+        f"Version 4.0, 01 March 2024\nPage {number} of 60"
+    )
+    return PageText(page_number=number, text=text, char_count=len(text))
+
+
+_BODIES = [
+    "5.1 Inclusion Criteria\n1. Age 18 to 75 years",
+    "2. Histologically confirmed NSCLC\n3. ECOG 0-1",
+    "4. Adequate organ function\n5. Signed informed consent",
+    "5.2 Exclusion Criteria\n1. Prior checkpoint inhibitor",
+    "2. Active brain metastases\n3. Pregnancy or breastfeeding",
+    "6. Study Procedures\nScreening visits occur weekly.",
+]
+
+
+def _pages() -> list[PageText]:
+    return [_page(40 + i, body) for i, body in enumerate(_BODIES)]
+
+
+class TestBoilerplate:
+    def test_detects_running_headers_and_page_stamps(self):
+        boilerplate = _boilerplate_lines(_pages())
+        assert ("top", "confidential") in boilerplate
+        assert ("bottom", "page # of #") in boilerplate
+        assert ("top", "protocol abc-# amendment #") in boilerplate
+
+    def test_strips_edges_and_keeps_body(self):
+        pages = _pages()
+        text, _, removed = _build_section_text(pages[:2], _boilerplate_lines(pages))
+
+        assert "CONFIDENTIAL" not in text and "Page 40 of 60" not in text
+        assert text.splitlines()[:3] == [
+            "--- PAGE 40 ---", "[1] 5.1 Inclusion Criteria", "[2] 1. Age 18 to 75 years",
+        ]
+        per_page = len("Protocol ABC-123 Amendment 2\nCONFIDENTIAL\n\nVersion 4.0, 01 March 2024\n")
+        assert removed == 2 * (per_page + len("Page 40 of 60"))
+
+    def test_too_few_pages_strips_nothing(self):
+        pages = _pages()[:2]
+        assert _boilerplate_lines(pages) == frozenset()
+        _, _, removed = _build_section_text(pages)
+        assert removed == 0
+
+
+class TestLineNumbering:
+    def test_numbers_lines_across_pages_and_maps_them_back(self):
+        text, lines, _ = _build_section_text(
+            [PageText(page_number=7, text="a\n\nb", char_count=4),
+             PageText(page_number=8, text="c", char_count=1)],
+            first_line=10,
+        )
+        assert text == "--- PAGE 7 ---\n[10] a\n[11] b\n--- PAGE 8 ---\n[12] c"
+        assert [(line.number, line.page_number, line.text) for line in lines] == [
+            (10, 7, "a"), (11, 7, "b"), (12, 8, "c"),
+        ]
+
+    def test_control_characters_do_not_break_lines(self):
+        text = "1. Have an AHI\x00K\x0c\x00\x10 at\nscreening."
+        _, lines, _ = _build_section_text([PageText(page_number=3, text=text, char_count=len(text))])
+        assert [line.text for line in lines] == ["1. Have an AHI\x00K\x0c\x00\x10 at", "screening."]
+
+
+class _FakeClient:
+    """Stands in for the Anthropic client: *reply* maps a prompt to a response dict."""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.prompts: list[str] = []
+        self.counted: list[str] = []
+        self.messages = self
+        self._lock = threading.Lock()
+
+    def count_tokens(self, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        with self._lock:
+            self.counted.append(prompt)
+        return SimpleNamespace(input_tokens=len(prompt) // 4)
+
+    def create(self, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        with self._lock:
+            self.prompts.append(prompt)
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(self.reply(prompt)))])
+
+
+_NUMBERED = re.compile(r"^\[(\d+)\] (.*)$")
+
+
+def _cite_criteria(prompt: str) -> list[dict]:
+    """What a well-behaved model returns: one line span per numbered criterion."""
+    section = prompt.split("PROTOCOL SECTION:\n", 1)[1]
+    criteria: list[dict] = []
+    kind = "inclusion"
+    for line in section.splitlines():
+        numbered = _NUMBERED.match(line)
+        content = numbered.group(2) if numbered else line
+        if "Exclusion Criteria" in content:
+            kind = "exclusion"
+        if not numbered:
+            continue
+        if re.match(r"\d\. ", content):
+            n = int(numbered.group(1))
+            criteria.append({"criterion_type": kind, "lines": [n, n]})
+        elif criteria and "Criteria" not in content:
+            criteria[-1]["lines"][1] = int(numbered.group(1))  # continuation line
+    return criteria
+
+
+def _document(pages: list[PageText]) -> ParsedDocument:
+    return ParsedDocument(
+        source_filename="t.pdf", pdf_type=PDFType.TEXT, total_pages=60, pages=pages,
+    )
+
+
+class TestExtractCriteriaMetadata:
+    def test_records_chars_and_tokens_saved(self, monkeypatch):
+        client = _FakeClient(lambda prompt: {"criteria": _cite_criteria(prompt)})
+        monkeypatch.setattr(criteria_extractor, "get_client", lambda: client)
+        pages = _pages()
+
+        result = extract_criteria(_document(pages), pages[:3])
+
+        assert "CONFIDENTIAL" not in client.prompts[0]
+        assert result.metadata.chunk_count == 1
+        assert result.metadata.boilerplate_chars_removed > 0
+        # Counted with and without boilerplate, not estimated from chars removed
+        raw, stripped = sorted(client.counted, key=lambda prompt: "CONFIDENTIAL" not in prompt)
+        assert "CONFIDENTIAL" in raw and stripped == client.prompts[0]
+        assert result.metadata.tokens_saved == len(raw) // 4 - len(stripped) // 4 > 0
+
+
+class TestLineSpans:
+    def test_text_and_page_rebuilt_from_cited_lines(self, monkeypatch):
+        text_46 = "5.2 Exclusion Criteria\n1. Prior checkpoint inhibitor therapy within 4 weeks,\n"
+        text_47 = "   including  anti-PD-1 antibodies\n2. Pregnancy"
+        pages = [
+            PageText(page_number=46, text=text_46, char_count=len(text_46)),
+            PageText(page_number=47, text=text_47, char_count=len(text_47)),
+        ]
+        client = _FakeClient(lambda prompt: {"criteria": [
+            {"criterion_type": "exclusion", "lines": [2, 3], "is_ambiguous": True},
+            {"criterion_type": "exclusion", "lines": [4, 9]},  # past the end of the section
+            {"criterion_type": "exclusion", "lines": 4},
+        ]})
+        monkeypatch.setattr(criteria_extractor, "get_client", lambda: client)
+
+        result = extract_criteria(_document(pages), pages)
+
+        first = (
+            "Prior checkpoint inhibitor therapy within 4 weeks,\n"
+            "   including  anti-PD-1 antibodies"
+        )
+        texts = [(c.text, c.source_page) for c in result.criteria]
+        assert texts == [(first, 46), ("Pregnancy", 47)]
+        # Flags come from the local flagger; the model's is_ambiguous is ignored
+        assert result.criteria[0].has_temporal_condition
+        assert not result.criteria[0].is_ambiguous
+        assert any("not in section" in w for w in result.metadata.warnings)
+        assert '"text"' not in client.prompts[0]  # the schema asks for spans only
+        assert "is_ambiguous" not in client.prompts[0]
+
+
+class TestChunkedExtraction:
+    _SECTION = "\n".join([
+        "--- PAGE 46 ---",
+        "[1] 5.2 Exclusion Criteria",
+        "[2] 1. Prior checkpoint inhibitor therapy,",
+        "[3]    including anti-PD-1 antibodies",
+        "[4] 2. Active brain metastases",
+        "--- PAGE 47 ---",
+        "[5] 3. Pregnancy or breastfeeding",
+        "[6] 4. Known HIV infection",
+    ])
+
+    def test_split_keeps_criteria_whole_and_carries_context(self):
+        chunks = _split_section(self._SECTION, max_chars=100)
+
+        assert len(chunks) > 1
+        item = "[2] 1. Prior checkpoint inhibitor therapy,\n[3]    including anti-PD-1 antibodies"
+        assert item in chunks[0]
+        for chunk in chunks[1:]:
+            assert chunk.startswith("--- PAGE 4")
+            assert "\n5.2 Exclusion Criteria (continued)\n" in chunk
+        assert chunks[-1].startswith("--- PAGE 47 ---")
+        rejoined = "\n".join(chunks)
+        for line in self._SECTION.split("\n"):
+            assert line in rejoined
+
+    def test_oversized_criterion_is_cut_at_lines(self):
+        wrapped = [f"[{n}]    wrapped line {n} of a very long criterion" for n in range(3, 13)]
+        section = "\n".join(["--- PAGE 46 ---", "[1] 5.2 Exclusion Criteria",
+                              "[2] 1. Any of the following:", *wrapped])
+
+        chunks = _split_section(section, max_chars=150)
+
+        assert len(chunks) > 2
+        for chunk in chunks[1:]:
+            assert chunk.startswith("--- PAGE 46 ---\n5.2 Exclusion Criteria (continued)\n")
+            body = chunk.split("(continued)\n", 1)[1]
+            assert len(body) <= 150
+        rejoined = "\n".join(chunks)
+        for line in section.split("\n"):
+            assert line in rejoined
+
+    def test_small_sections_are_not_split(self):
+        assert _split_section(self._SECTION, max_chars=10_000) == [self._SECTION]
+
+    def test_chunks_run_concurrently_and_merge(self, monkeypatch):
+        monkeypatch.setattr(settings, "extraction_chunk_tokens", 10)
+        monkeypatch.setattr(
+            criteria_extractor, "_split_section", lambda text, max_chars: _split_section(text, 170)
+        )
+        barrier = threading.Barrier(2, timeout=5)
+
+        def reply(prompt: str) -> dict:
+            barrier.wait()  # both chunk calls must be in flight at once
+            criteria = _cite_criteria(prompt)
+            later = "(continued)" in prompt
+            if later:  # the later chunk re-reports the first criterion
+                criteria.insert(0, {"criterion_type": "exclusion", "lines": [2, 3]})
+            return {"protocol_title": "ABC-123" if later else None, "criteria": criteria}
+
+        client = _FakeClient(reply)
+        monkeypatch.setattr(criteria_extractor, "get_client", lambda: client)
+        page_46 = "5.2 Exclusion Criteria\n1. Prior checkpoint inhibitor therapy,\n" \
+                  "   including anti-PD-1 antibodies\n2. Active brain metastases"
+        page_47 = "3. Pregnancy or breastfeeding\n4. Known HIV infection"
+        pages = [
+            PageText(page_number=46, text=page_46, char_count=len(page_46)),
+            PageText(page_number=47, text=page_47, char_count=len(page_47)),
+        ]
+
+        result = extract_criteria(_document(pages), pages)
+
+        assert len(client.prompts) == 2
+        assert result.metadata.chunk_count == 2
+        assert [c.id for c in result.criteria] == ["exc_001", "exc_002", "exc_003", "exc_004"]
+        assert [c.source_page for c in result.criteria] == [46, 46, 47, 47]
+        assert result.criteria[0].text == (
+            "Prior checkpoint inhibitor therapy,\n   including anti-PD-1 antibodies"
+        )
+        assert result.protocol_title == "ABC-123"
+
+
+class TestDeduplication:
+    def test_identical_criteria_at_different_lines_are_both_kept(self, monkeypatch):
+        def reply(prompt: str) -> dict:
+            criteria = _cite_criteria(prompt)
+            return {"criteria": [*criteria, criteria[0]]}  # and one span reported twice
+
+        client = _FakeClient(reply)
+        monkeypatch.setattr(criteria_extractor, "get_client", lambda: client)
+        text = "5.2 Exclusion Criteria\n1. Pregnancy\n2. Known HIV infection\n3. Pregnancy"
+        pages = [PageText(page_number=46, text=text, char_count=len(text))]
+
+        result = extract_criteria(_document(pages), pages)
+
+        texts = [c.text for c in result.criteria]
+        assert texts == ["Pregnancy", "Known HIV infection", "Pregnancy"]
+
+
+class TestListExtraction:
+    def test_inclusion_and_exclusion_extracted_concurrently(self, monkeypatch):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def reply(prompt: str) -> dict:
+            barrier.wait()  # both list calls must be in flight at once
+            return {"criteria": _cite_criteria(prompt)}
+
+        client = _FakeClient(reply)
+        monkeypatch.setattr(criteria_extractor, "get_client", lambda: client)
+        text = (
+            "5.1 Inclusion Criteria\n1. Age >= 18\n2. ECOG 0-1\n"
+            "5.2 Exclusion Criteria\n1. Pregnancy"
+        )
+        pages = [PageText(page_number=46, text=text, char_count=len(text))]
+
+        result = extract_criteria(_document(pages), pages)
+
+        assert len(client.prompts) == 2
+        assert "Pregnancy" not in next(p for p in client.prompts if "Inclusion Criteria" in p)
+        assert [c.id for c in result.criteria] == ["inc_001", "inc_002", "exc_001"]
+        assert [c.text for c in result.criteria] == ["Age >= 18", "ECOG 0-1", "Pregnancy"]
+        assert result.metadata.chunk_count == 2
+
+
+class TestParsedLists:
+    _PAGE_45 = (
+        "5. Study Population\nThe criteria below apply at screening.\n"
+        "5.1 Inclusion Criteria\nParticipants are eligible only if all the following apply:\n"
+        "Age\n1. Aged 18 years or older at the time of signing consent.\n"
+        "Disease characteristics\n2. Type 2 diabetes diagnosed at least 6 months\n"
+        "   before screening.\n3. HbA1c between 7.0% and 10.5%."
+    )
+    _PAGE_46 = (
+        "5.2 Exclusion Criteria\nMedical conditions\n4. Type 1 diabetes.\n"
+        "5. eGFR < 30 mL/min/1.73 m2\nNote: measured by the central laboratory.\n"
+        "6. Pregnancy or breastfeeding.\n5.3 Lifestyle Considerations\n1. Fast overnight."
+    )
+
+    def _pages(self, page_46: str | None = None) -> list[PageText]:
+        texts = {45: self._PAGE_45, 46: page_46 or self._PAGE_46}
+        return [PageText(page_number=n, text=t, char_count=len(t)) for n, t in texts.items()]
+
+    def _opening(self) -> list[PageText]:
+        # Under locate-first the document holds TOC pages past the title page, out of order
+        texts = {30: "Body page 30.", 1: "Protocol ABC-123\nA Phase 3 Study", 2: "Synopsis"}
+        return [PageText(page_number=n, text=t, char_count=len(t)) for n, t in texts.items()]
+
+    def test_numbered_lists_skip_the_primary_model(self, monkeypatch):
+        client = _FakeClient(lambda prompt: {"protocol_title": "ABC-123", "sponsor": None})
+        monkeypatch.setattr(criteria_extractor, "get_client", lambda: client)
+        pages = self._pages()
+
+        result = extract_criteria(_document([*self._opening(), *pages]), pages)
+
+        assert len(client.prompts) == 1 and "PROTOCOL SECTION" not in client.prompts[0]
+        assert "Protocol ABC-123" in client.prompts[0] and "page 30" not in client.prompts[0]
+        assert [c.id for c in result.criteria] == [
+            "inc_001", "inc_002", "inc_003", "exc_001", "exc_002", "exc_003",
+        ]
+        assert [c.source_page for c in result.criteria] == [45, 45, 45, 46, 46, 46]
+        assert result.criteria[1].text == (
+            "Type 2 diabetes diagnosed at least 6 months\n   before screening."
+        )
+        assert result.criteria[4].text == (
+            "eGFR < 30 mL/min/1.73 m2\nNote: measured by the central laboratory."
+        )
+        assert result.criteria[5].text == "Pregnancy or breastfeeding."  # stops at 5.3
+        assert result.criteria[3].source_section == "5.2 Exclusion Criteria"
+        assert result.criteria[4].has_numeric_threshold
+        assert result.protocol_title == "ABC-123"
+        assert result.metadata.extraction_method == "parsed"
+        assert result.metadata.structural_confidence == 1.0
+        assert result.metadata.model_used == settings.fast_llm_model
+        assert result.metadata.chunk_count == 0
+
+    def test_metadata_call_can_be_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "extraction_parse_metadata", False)
+        client = _FakeClient(lambda prompt: {})
+        monkeypatch.setattr(criteria_extractor, "get_client", lambda: client)
+        pages = self._pages()
+
+        result = extract_criteria(_document(pages), pages)
+
+        assert client.prompts == []
+        assert len(result.criteria) == 6 and result.metadata.model_used == "none"
+
+    def test_broken_numbering_falls_back_to_the_model(self, monkeypatch):
+        client = _FakeClient(lambda prompt: {"criteria": _cite_criteria(prompt)})
+        monkeypatch.setattr(criteria_extractor, "get_client", lambda: client)
+        pages = self._pages(self._PAGE_46.replace("5. eGFR", "eGFR"))  # item 5 lost its number
+
+        result = extract_criteria(_document(pages), pages)
+
+        assert all("PROTOCOL SECTION" in prompt for prompt in client.prompts)
+        assert len(client.prompts) == 2
+        assert result.metadata.extraction_method == "llm"
+
+
+class TestParseNumberedList:
+    @staticmethod
+    def _spans(text: str) -> list[tuple[int, str]]:
+        """(criterion number, its text) for each item parsed from *text*."""
+        page = PageText(page_number=1, text=text, char_count=len(text))
+        _, lines, _ = _build_section_text([page])
+        by_number = {line.number: line.text for line in lines}
+        _, items = _parse_numbered_list(lines)
+        return [
+            (n, "\n".join(by_number[k] for k in range(first, last + 1))) for n, first, last in items
+        ]
+
+    def test_short_wrap_after_an_open_line_is_kept(self):
+        spans = self._spans("1. Active infection including\nHIV or Hepatitis B\n2. Pregnancy.")
+        assert spans == [
+            (1, "1. Active infection including\nHIV or Hepatitis B"),
+            (2, "2. Pregnancy."),
+        ]
+
+    def test_category_label_after_a_complete_criterion_is_dropped(self):
+        spans = self._spans("1. Type 1 diabetes.\nHepatic\n2. ALT above 3 x ULN.")
+        assert spans == [(1, "1. Type 1 diabetes."), (2, "2. ALT above 3 x ULN.")]
+
+    def test_wrap_or_label_in_doubt_gives_no_items(self):
+        assert self._spans("1. ALT and AST at or below 2.5 times\nULN\n2. Pregnancy.") == []
+        assert self._spans("1. Age over 18\nMedical conditions\n2. Pregnancy.") == []
+
+    def test_unnumbered_heading_and_its_prose_end_the_list(self):
+        spans = self._spans(
+            "1. Type 1 diabetes.\n2. Pregnancy.\nLifestyle Considerations\n"
+            "Participants should refrain from strenuous exercise."
+        )
+        assert spans == [(1, "1. Type 1 diabetes."), (2, "2. Pregnancy.")]
+
+    def test_numbered_chapter_heading_ends_the_list(self):
+        spans = self._spans(
+            "1. Type 1 diabetes.\n2. Pregnancy.\n3. STUDY INTERVENTION\nThe study drug is oral."
+        )
+        assert [n for n, _ in spans] == [1, 2] and spans[1][1] == "2. Pregnancy."
+
+    def test_numbering_past_a_heading_gives_no_items(self):
+        assert self._spans("1. Type 1 diabetes.\n2. Pregnancy.\nHEPATIC\n3. Cirrhosis.") == []
+
+
+class TestStructuralConfidence:
+    @staticmethod
+    def _items(*numbers: int) -> list[tuple[int, int, int]]:
+        return [(n, i, i) for i, n in enumerate(numbers, 1)]
+
+    def test_continuous_or_restarted_numbering(self):
+        assert _structural_confidence([self._items(1, 2, 3), self._items(4, 5)]) == 1.0
+        assert _structural_confidence([self._items(1, 2, 3), self._items(1, 2)]) == 1.0
+
+    def test_any_gap_or_reset_within_a_list_fails(self):
+        # One stray number among many is not a share to tolerate
+        many = list(range(1, 41))
+        assert _structural_confidence([self._items(*many, 42), self._items(1, 2)]) == 0.0
+        assert _structural_confidence([self._items(*many), self._items(1, 2, 1, 3)]) == 0.0
@@ -0,0 +1,60 @@
+"""Unit tests for the on-disk LRU cache and the ParsedDocument cache built on it."""
+
+import os
+
+from docu_flow.config import settings
+from docu_flow.pipeline.document_cache import load_cached_document, store_cached_document
+from docu_flow.schemas.pdf import PDFType, PageText, ParsedDocument
+from docu_flow.utils.disk_cache import DiskCache
+
+
+class TestDiskCache:
+    def test_round_trip(self, tmp_path):
+        cache = DiskCache(tmp_path, max_bytes=1024)
+        assert cache.get("abc") is None
+        cache.put("abc", b"payload")
+        assert cache.get("abc") == b"payload"
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = DiskCache(tmp_path, max_bytes=250)
+        for i, key in enumerate(["aa1", "bb2", "cc3"]):
+            cache.put(key, b"x" * 100)
+            os.utime(cache.path_for(key), (i, i))
+        # "aa1" is the oldest entry; the third put pushed the cache over budget
+        assert cache.get("aa1") is None
+        assert cache.get("cc3") == b"x" * 100
+
+
+class TestDocumentCache:
+    def test_round_trip_keyed_by_hash(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "results_dir", tmp_path)
+        document = ParsedDocument(
+            source_filename="a.pdf",
+            sha256="f" * 64,
+            pdf_type=PDFType.SCANNED,
+            total_pages=1,
+            pages=[PageText(page_number=1, text="ocr text", char_count=8, ocr_used=True, ocr_dpi=300)],
+        )
+        assert load_cached_document("f" * 64) is None
+
+        store_cached_document("f" * 64, document)
+
+        assert load_cached_document("f" * 64) == document
+        assert load_cached_document("0" * 64) is None
+
+    def test_store_merges_partial_documents(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "results_dir", tmp_path)
+
+        def partial(*numbers: int) -> ParsedDocument:
+            return ParsedDocument(
+                source_filename="a.pdf",
+                pdf_type=PDFType.TEXT,
+                total_pages=5,
+                pages=[PageText(page_number=n, text=f"p{n}", char_count=2) for n in numbers],
+            )
+
+        store_cached_document("e" * 64, partial(1, 2))
+        store_cached_document("e" * 64, partial(4, 2))
+
+        cached = load_cached_document("e" * 64)
+        assert [p.page_number for p in cached.pages] == [1, 2, 4]
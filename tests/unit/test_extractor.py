@@ -0,0 +1,328 @@
+"""Unit tests for the text extractor (PDFs built in memory; Tesseract is never invoked)."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import fitz
+import pytest
+
+from docu_flow.config import settings
+from docu_flow.pipeline import extractor
+from docu_flow.pipeline.extractor import _shard_ranges, extract_text
+from docu_flow.schemas.pdf import PageText, PDFType
+
+
+class TestShardRanges:
+    def test_covers_all_pages_in_order(self):
+        shards = _shard_ranges(10, 3)
+        assert [list(r) for r in shards] == [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]
+
+    def test_more_shards_than_pages(self):
+        assert len(_shard_ranges(2, 8)) == 2
+
+
+class TestPageSubset:
+    def test_extracts_only_requested_pages(self, text_pdf):
+        document = extract_text(text_pdf, pdf_type=PDFType.TEXT, page_numbers=[9, 3, 3, 40])
+
+        assert [p.page_number for p in document.pages] == [3, 9]
+        assert document.total_pages == 12
+
+    def test_reads_outline(self, text_pdf, tmp_path):
+        doc = fitz.open(str(text_pdf))
+        doc.set_toc([[1, "Synopsis", 2], [1, "Study Population", 7], [2, "Inclusion Criteria", 8]])
+        path = tmp_path / "outlined.pdf"
+        doc.save(str(path))
+
+        outline = extract_text(path, pdf_type=PDFType.TEXT, page_numbers=[1]).outline
+
+        assert [(e.level, e.title, e.page_number) for e in outline] == [
+            (1, "Synopsis", 2), (1, "Study Population", 7), (2, "Inclusion Criteria", 8),
+        ]
+
+
+    def test_reads_page_labels(self, text_pdf, tmp_path):
+        doc = fitz.open(str(text_pdf))
+        doc.set_page_labels([
+            {"startpage": 0, "prefix": "", "style": "r", "firstpagenum": 1},
+            {"startpage": 3, "prefix": "", "style": "D", "firstpagenum": 1},
+        ])
+        path = tmp_path / "labelled.pdf"
+        doc.save(str(path))
+
+        labels = extract_text(path, pdf_type=PDFType.TEXT, page_numbers=[]).page_labels
+
+        assert labels["iii"] == 3
+        assert labels["1"] == 4
+        assert labels["9"] == 12
+
+
+class TestParallelExtraction:
+    def test_matches_serial_order(self, text_pdf, monkeypatch):
+        serial = extract_text(text_pdf, pdf_type=PDFType.TEXT)
+
+        monkeypatch.setattr(settings, "extraction_workers", 2)
+        monkeypatch.setattr(settings, "extraction_parallel_min_pages", 1)
+        parallel = extract_text(text_pdf, pdf_type=PDFType.TEXT)
+
+        assert [p.page_number for p in parallel.pages] == list(range(1, 13))
+        assert [p.text for p in parallel.pages] == [p.text for p in serial.pages]
+
+    def test_page_subset_sized_by_its_own_length(self, text_pdf, monkeypatch):
+        monkeypatch.setattr(settings, "extraction_workers", 2)
+        monkeypatch.setattr(settings, "extraction_parallel_min_pages", 6)
+        calls: list[list[int]] = []
+        real_parallel = extractor._extract_parallel
+
+        def spy(pdf_path, page_indices, workers):
+            calls.append(page_indices)
+            return real_parallel(pdf_path, page_indices, workers)
+
+        monkeypatch.setattr(extractor, "_extract_parallel", spy)
+
+        window = extract_text(text_pdf, pdf_type=PDFType.TEXT, page_numbers=[3, 4])
+        subset = extract_text(text_pdf, pdf_type=PDFType.TEXT, page_numbers=range(2, 13))
+
+        assert [p.page_number for p in window.pages] == [3, 4]
+        assert calls == [list(range(1, 12))]  # only the large subset used the pool
+        assert [p.page_number for p in subset.pages] == list(range(2, 13))
+
+
+class TestConcurrentOCR:
+    def test_ocr_pages_merged_in_order(self, make_pdf, monkeypatch):
+        pdf = make_pdf(["Native page " + "text " * 40, "", "", "Native again " + "text " * 40, ""])
+
+        def fake_ocr(image, page_number):
+            text = f"ocr page {page_number}"
+            return PageText(page_number=page_number, text=text, char_count=len(text), ocr_used=True), 0.01
+
+        monkeypatch.setattr(extractor, "_ocr_image", fake_ocr)
+        monkeypatch.setattr(settings, "ocr_triage_enabled", False)  # blank test pages
+        monkeypatch.setattr(settings, "ocr_workers", 2)
+        monkeypatch.setattr(settings, "ocr_max_inflight_pages", 1)
+
+        document = extract_text(pdf, pdf_type=PDFType.HYBRID)
+
+        assert [p.page_number for p in document.pages] == [1, 2, 3, 4, 5]
+        assert [p.ocr_used for p in document.pages] == [False, True, True, False, True]
+        assert document.pages[2].text == "ocr page 3"
+
+    def test_failed_ocr_yields_warning(self, make_pdf, monkeypatch):
+        pdf = make_pdf([""])
+        monkeypatch.setattr(extractor, "_ocr_image", lambda image, page_number: (None, 0.0))
+        monkeypatch.setattr(settings, "ocr_triage_enabled", False)
+
+        document = extract_text(pdf, pdf_type=PDFType.SCANNED)
+
+        assert document.pages[0].text == ""
+        assert document.extraction_warnings == ["Page 1: OCR produced no usable text."]
+
+
+class TestAdaptiveOCR:
+    def test_low_confidence_page_escalates(self, make_pdf, monkeypatch):
+        pdf = make_pdf(["", ""])
+        seen: list[tuple[int, int]] = []
+
+        def fake_ocr(image, page_number):
+            seen.append((page_number, image.width))
+            # Page 2 only reads cleanly at the high-resolution tier
+            confidence = 0.5 if page_number == 2 and image.width < 2000 else 0.95
+            return PageText(
+                page_number=page_number, text="x", char_count=1, ocr_used=True, confidence=confidence
+            ), 0.0
+
+        monkeypatch.setattr(extractor, "_ocr_image", fake_ocr)
+        monkeypatch.setattr(settings, "ocr_triage_enabled", False)
+        monkeypatch.setattr(settings, "ocr_dpi_tiers", [150, 300])
+        monkeypatch.setattr(settings, "ocr_escalation_confidence", 0.8)
+
+        document = extract_text(pdf, pdf_type=PDFType.SCANNED)
+
+        assert [p.ocr_dpi for p in document.pages] == [150, 300]
+        assert len(seen) == 3
+
+
+class TestOCRBackendSelection:
+    def test_default_backend(self, monkeypatch):
+        monkeypatch.setattr(settings, "ocr_backend", "pytesseract")
+        assert extractor.get_ocr_backend().name == "pytesseract"
+
+    def test_unknown_backend_rejected(self, monkeypatch):
+        monkeypatch.setattr(settings, "ocr_backend", "nope")
+        with pytest.raises(ValueError):
+            extractor.get_ocr_backend()
+
+    def test_pytesseract_keeps_lines(self, monkeypatch):
+        import pytesseract
+
+        data = {
+            "text": ["5.1", "Inclusion", "Criteria", "", "1.", "Age"],
+            "conf": [95, 90, 92, -1, 88, 90],
+            "block_num": [1, 1, 1, 1, 1, 1],
+            "par_num": [1, 1, 1, 1, 2, 2],
+            "line_num": [1, 1, 1, 1, 1, 1],
+        }
+        monkeypatch.setattr(pytesseract, "image_to_data", lambda *a, **k: data)
+
+        text, confidence = extractor.PytesseractBackend().recognize(object())
+
+        assert text == "5.1 Inclusion Criteria\n1. Age"
+        assert confidence == pytest.approx(0.91)
+
+    def test_missing_tesserocr_falls_back(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "tesserocr", None)
+        monkeypatch.setattr(settings, "ocr_backend", "tesserocr")
+        assert extractor.get_ocr_backend().name == "pytesseract"
+
+    def test_tesserocr_engines_outlive_ocr_threads(self, monkeypatch):
+        created: list[SimpleNamespace] = []
+
+        def make_api(lang: str) -> SimpleNamespace:
+            api = SimpleNamespace(
+                SetImage=lambda image: None,
+                GetUTF8Text=lambda: "1.  Age\n\n",
+                AllWordConfidences=lambda: [90, -1],
+                End=lambda: ended.append(api),
+            )
+            created.append(api)
+            return api
+
+        ended: list[SimpleNamespace] = []
+        monkeypatch.setitem(sys.modules, "tesserocr", SimpleNamespace(PyTessBaseAPI=make_api))
+        backend = extractor.TesserocrBackend()
+
+        for _ in range(2):  # one short-lived OCR pool per document
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                assert pool.submit(backend.recognize, object()).result() == ("1. Age", 0.9)
+
+        assert len(created) == 1
+        backend.close()
+        assert ended == created
+
+
+class TestOCRPageCache:
+    def test_identical_page_is_ocrd_once(self, make_pdf, monkeypatch):
+        pdf = make_pdf(["", ""])
+        calls: list[int] = []
+
+        def fake_ocr(image, page_number):
+            calls.append(page_number)
+            return PageText(page_number=page_number, text="boilerplate", char_count=11, ocr_used=True), 0.5
+
+        monkeypatch.setattr(extractor, "_ocr_image", fake_ocr)
+        monkeypatch.setattr(settings, "ocr_triage_enabled", False)
+        monkeypatch.setattr(settings, "ocr_workers", 1)
+        monkeypatch.setattr(settings, "ocr_max_inflight_pages", 1)
+        monkeypatch.setattr(settings, "ocr_dpi_tiers", [150])
+
+        document = extract_text(pdf, pdf_type=PDFType.SCANNED)
+
+        assert calls == [1]
+        assert document.pages[1].text == "boilerplate"
+        assert document.pages[1].page_number == 2
+
+
+def _image_page_pdf(tmp_path, fill: int, text_lines: int = 0, figure: bool = False):
+    """One image-only page: a grey field of *fill* with dark 'text' bars or a large figure."""
+    doc = fitz.open()
+    page = doc.new_page()
+    pix = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 612, 792), False)
+    pix.clear_with(fill)
+    for line in range(text_lines):
+        y = 80 + line * 16
+        pix.set_rect(fitz.IRect(72, y, 540, y + 6), (20,))
+    if figure:
+        pix.set_rect(fitz.IRect(40, 40, 572, 700), (60,))
+    page.insert_image(page.rect, pixmap=pix)
+    path = tmp_path / f"image_{fill}_{text_lines}_{figure}.pdf"
+    doc.save(str(path))
+    return path
+
+
+class TestOCRTriage:
+    @pytest.mark.parametrize(
+        ("fill", "figure", "reason"),
+        [(255, False, "blank page"), (230, False, "blank page"), (255, True, "figure page")],
+    )
+    def test_skips_pages_without_text(self, tmp_path, monkeypatch, fill, figure, reason):
+        pdf = _image_page_pdf(tmp_path, fill, figure=figure)
+        monkeypatch.setattr(extractor, "_ocr_image", lambda *a: pytest.fail("OCR should be skipped"))
+
+        document = extract_text(pdf, pdf_type=PDFType.SCANNED)
+
+        assert document.pages[0].ocr_used is False
+        assert document.extraction_warnings == [f"Page 1: OCR skipped ({reason})."]
+
+    def test_text_page_reaches_ocr(self, tmp_path, monkeypatch):
+        pdf = _image_page_pdf(tmp_path, 245, text_lines=30)
+        calls: list[int] = []
+
+        def fake_ocr(image, page_number):
+            calls.append(page_number)
+            return PageText(page_number=page_number, text="t", char_count=1, ocr_used=True), 0.0
+
+        monkeypatch.setattr(extractor, "_ocr_image", fake_ocr)
+        extract_text(pdf, pdf_type=PDFType.SCANNED)
+        assert calls == [1]
+
+
+def _hybrid_page_pdf(tmp_path):
+    """A typed heading and footer around an embedded 'scanned table' image."""
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 60), "Table 2. Exclusion criteria")
+    pix = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 400, 200), False)
+    pix.clear_with(255)
+    for row in range(8):
+        pix.set_rect(fitz.IRect(20, 20 + row * 22, 380, 28 + row * 22), (20,))
+    page.insert_image(fitz.Rect(72, 100, 472, 300), pixmap=pix)
+    page.insert_text((72, 700), "Version 3.0")
+    path = tmp_path / "hybrid.pdf"
+    doc.save(str(path))
+    return path
+
+
+class TestRegionOCR:
+    def test_only_image_block_is_ocrd_and_merged(self, tmp_path, monkeypatch):
+        pdf = _hybrid_page_pdf(tmp_path)
+        sizes: list[tuple[int, int]] = []
+
+        def fake_ocr(image, page_number):
+            sizes.append(image.size)
+            text = "1. Prior chemotherapy"
+            return PageText(
+                page_number=page_number, text=text, char_count=len(text), ocr_used=True, confidence=0.9
+            ), 0.0
+
+        monkeypatch.setattr(extractor, "_ocr_image", fake_ocr)
+        monkeypatch.setattr(settings, "ocr_triage_enabled", False)
+        monkeypatch.setattr(settings, "ocr_dpi_tiers", [144])
+
+        page = extract_text(pdf, pdf_type=PDFType.HYBRID).pages[0]
+
+        assert sizes == [(800, 400)]  # the 400×200 pt block at 2×, not the 1224×1584 page
+        assert page.text.splitlines() == [
+            "Table 2. Exclusion criteria",
+            "1. Prior chemotherapy",
+            "Version 3.0",
+        ]
+        assert page.ocr_used is True
+        assert page.ocr_dpi == 144
+        assert 0.9 < page.confidence < 1.0
+
+    def test_page_sized_image_is_ocrd_whole(self):
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_image(page.rect, pixmap=fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 10, 10), False))
+        page.insert_image(fitz.Rect(0, 0, 10, 10), pixmap=fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 4, 4), False))
+        assert extractor._image_regions(page) == []
+
+    def test_overlapping_blocks_are_merged(self):
+        doc = fitz.open()
+        page = doc.new_page()
+        tile = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 10, 10), False)
+        page.insert_image(fitz.Rect(72, 72, 272, 172), pixmap=tile)
+        page.insert_image(fitz.Rect(72, 160, 272, 260), pixmap=tile)
+        page.insert_image(fitz.Rect(72, 400, 90, 418), pixmap=tile)  # icon — too small
+        assert extractor._image_regions(page) == [fitz.Rect(72, 72, 272, 260)]
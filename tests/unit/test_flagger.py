@@ -0,0 +1,94 @@
+"""Unit tests for the local criterion flagger."""
+
+import pytest
+
+from docu_flow.pipeline.flagger import flag_criteria, flag_text
+from docu_flow.schemas.criteria import CriterionType, EligibilityCriterion
+
+
+class TestFlagText:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Received chemotherapy within 4 weeks prior to the first dose",
+            "Major surgery in the past 6 months",
+            "Disease-free for at least 5 years",
+            "28-day washout of prior therapy",
+        ],
+    )
+    def test_temporal(self, text):
+        assert flag_text(text)["has_temporal_condition"]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Age ≥ 18 years",
+            "eGFR < 30 mL/min/1.73 m2",
+            "HbA1c greater than 10%",
+            "ALT above 2.5 x ULN",
+            "18 years of age or older",
+            "At least 18 years of age",
+            "Aged over 65 years old at screening",
+            "Children under 12 years of age",
+            "Aged 18 to 75 years",
+            "Men and women aged 40–65 years at screening",
+            "Age 18-80 yrs inclusive",
+        ],
+    )
+    def test_numeric(self, text):
+        flags = flag_text(text)
+        assert flags["has_numeric_threshold"]
+        assert not flags["has_temporal_condition"]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "At least 18 years of age",
+            "18-year-old or older at the time of consent",
+            "Patients less than 75 years old",
+        ],
+    )
+    def test_ages_are_not_durations(self, text):
+        assert not flag_text(text)["has_temporal_condition"]
+
+    def test_durations_are_not_thresholds(self):
+        flags = flag_text("Life expectancy of more than 12 weeks")
+        assert flags["has_temporal_condition"]
+        assert not flags["has_numeric_threshold"]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Prior malignancy, unless treated with curative intent",
+            "Contraception required if of childbearing potential",
+            "Any prior therapy, with the exception of hormonal therapy",
+        ],
+    )
+    def test_conditional(self, text):
+        assert flag_text(text)["has_conditional_logic"]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Clinically significant cardiac disease",
+            "Adequate organ function",
+            "Any condition that, in the opinion of the investigator, precludes participation",
+        ],
+    )
+    def test_ambiguous(self, text):
+        assert flag_text(text)["is_ambiguous"]
+
+    def test_plain_criterion_has_no_flags(self):
+        assert not any(flag_text("Known HIV infection").values())
+
+
+def test_flag_criteria_sets_fields_in_place():
+    criterion = EligibilityCriterion(
+        id="exc_001",
+        criterion_type=CriterionType.EXCLUSION,
+        text="Clinically significant bleeding within 3 months",
+        is_ambiguous=False,
+    )
+    flag_criteria([criterion])
+    assert criterion.is_ambiguous and criterion.has_temporal_condition
+    assert not criterion.has_numeric_threshold
@@ -0,0 +1,159 @@
+"""Unit tests for locate-first extraction in the protocol pipeline (LLM steps stubbed)."""
+
+import pytest
+
+from docu_flow.config import settings
+from docu_flow.pipeline import orchestrator
+from docu_flow.schemas.criteria import ExtractedCriteria, ExtractionMetadata
+
+_FILLER = "The study drug is administered as described in the pharmacy manual. " * 3
+
+
+def _protocol_pages(total: int, criteria_page: int, toc_page: int | None) -> list[str]:
+    pages = [f"Section body page {n}. {_FILLER}" for n in range(1, total + 1)]
+    target = toc_page if toc_page is not None else criteria_page
+    pages[1] = (
+        f"Table of Contents\nSynopsis ........ 5\nEligibility Criteria ........ {target}\n{_FILLER}"
+    )
+    items = "\n".join(f"{i}. Patient must satisfy requirement {i}." for i in range(1, 8))
+    pages[criteria_page - 1] = f"5. Eligibility Criteria\n{items}"
+    pages[criteria_page] = f"5.2 Exclusion Criteria\n{items}"
+    pages[criteria_page + 1] = f"6. Study Procedures\n{_FILLER}"
+    return pages
+
+
+@pytest.fixture
+def pipeline_spy(monkeypatch):
+    """Record which pages get extracted and which reach the criteria LLM."""
+    calls: dict[str, list] = {"extracted": [], "section": []}
+    real_extract = orchestrator.extract_text
+
+    def spy_extract(pdf_path, pdf_type=None, session=None, page_numbers=None):
+        document = real_extract(pdf_path, pdf_type=pdf_type, session=session, page_numbers=page_numbers)
+        calls["extracted"].extend(p.page_number for p in document.pages)
+        return document
+
+    def fake_criteria(document, section_pages):
+        calls["section"] = [p.page_number for p in section_pages]
+        return ExtractedCriteria(
+            criteria=[],
+            metadata=ExtractionMetadata(model_used="stub", extraction_confidence=1.0, section_found=True),
+        )
+
+    monkeypatch.setattr(orchestrator, "extract_text", spy_extract)
+    monkeypatch.setattr(orchestrator, "extract_criteria", fake_criteria)
+    monkeypatch.setattr(orchestrator, "rank_disqualifiers", lambda extracted, top_n: extracted)
+    return calls
+
+
+class TestLocateFirst:
+    def test_extracts_only_toc_pages_and_section_window(self, make_pdf, pipeline_spy):
+        pdf = make_pdf(_protocol_pages(60, criteria_page=40, toc_page=None))
+
+        orchestrator.run_protocol_pipeline(pdf)
+
+        extracted = sorted(pipeline_spy["extracted"])
+        assert len(extracted) == len(set(extracted))  # no page extracted twice
+        assert set(extracted) < set(range(1, 61))
+        assert set(range(1, 13)) <= set(extracted)
+        assert pipeline_spy["section"] == [40, 41]
+
+    def test_widens_when_toc_page_is_off(self, make_pdf, pipeline_spy):
+        # Page 46 is past the section: windows 46–60 and 42–60 miss it, 38–60 finds it
+        pdf = make_pdf(_protocol_pages(60, criteria_page=40, toc_page=46))
+
+        orchestrator.run_protocol_pipeline(pdf)
+
+        assert pipeline_spy["section"] == [40, 41]
+        assert sorted(pipeline_spy["extracted"]) == [*range(1, 13), *range(38, 61)]
+
+    def test_bookmarks_skip_toc_pages(self, make_pdf, pipeline_spy, tmp_path):
+        import fitz
+
+        doc = fitz.open(str(make_pdf(_protocol_pages(60, criteria_page=40, toc_page=None))))
+        doc.set_toc([[1, "4 Study Design", 10], [1, "5 Eligibility Criteria", 40], [1, "6 Study Procedures", 42]])
+        pdf = tmp_path / "bookmarked.pdf"
+        doc.save(str(pdf))
+
+        orchestrator.run_protocol_pipeline(pdf)
+
+        assert sorted(pipeline_spy["extracted"]) == [1, 2, 40, 41, 42]  # 1–2 for metadata
+        assert pipeline_spy["section"] == [40, 41, 42]  # up to the next bookmark's page
+
+    def test_bookmark_end_kept_without_stop_heading(self, make_pdf, pipeline_spy, tmp_path):
+        import fitz
+
+        pages = _protocol_pages(60, criteria_page=40, toc_page=None)
+        pages[41] = f"Body page 42. {_FILLER}"  # no "Study Procedures"-style heading follows
+        doc = fitz.open(str(make_pdf(pages)))
+        doc.set_toc([[1, "5 Eligibility Criteria", 40], [1, "6 Study Intervention", 42]])
+        pdf = tmp_path / "bookmarked.pdf"
+        doc.save(str(pdf))
+
+        orchestrator.run_protocol_pipeline(pdf)
+
+        assert sorted(pipeline_spy["extracted"]) == [1, 2, 40, 41, 42]
+        assert pipeline_spy["section"] == [40, 41, 42]
+
+    def test_metadata_pages_skipped_when_not_parsing(
+        self, make_pdf, pipeline_spy, monkeypatch, tmp_path
+    ):
+        import fitz
+
+        monkeypatch.setattr(settings, "extraction_parse_metadata", False)
+        doc = fitz.open(str(make_pdf(_protocol_pages(60, criteria_page=40, toc_page=None))))
+        doc.set_toc([[1, "5 Eligibility Criteria", 40], [1, "6 Study Procedures", 42]])
+        pdf = tmp_path / "bookmarked.pdf"
+        doc.save(str(pdf))
+
+        orchestrator.run_protocol_pipeline(pdf)
+
+        assert sorted(pipeline_spy["extracted"]) == [40, 41, 42]
+
+    def test_falls_back_to_full_extraction(self, make_pdf, pipeline_spy, monkeypatch):
+        pages = [f"Body page {n}. {_FILLER}" for n in range(1, 31)]
+        pdf = make_pdf(pages)
+        monkeypatch.setattr(
+            orchestrator,
+            "locate_eligibility_section",
+            lambda document, llm_fallback=True: orchestrator.SectionLocation(
+                1, document.total_pages, None, 0.1, "full_doc_fallback"
+            ),
+        )
+
+        orchestrator.run_protocol_pipeline(pdf)
+
+        assert sorted(pipeline_spy["extracted"]) == list(range(1, 31))
+
+    def test_disabled_extracts_every_page(self, make_pdf, pipeline_spy, monkeypatch):
+        monkeypatch.setattr(settings, "locate_first", False)
+        pdf = make_pdf(_protocol_pages(30, criteria_page=20, toc_page=None))
+
+        orchestrator.run_protocol_pipeline(pdf)
+
+        assert sorted(pipeline_spy["extracted"]) == list(range(1, 31))
+        assert pipeline_spy["section"] == [20, 21]
+
+
+class TestPartialDocumentCache:
+    def test_rerun_reuses_locate_first_pages(self, make_pdf, pipeline_spy):
+        pdf = make_pdf(_protocol_pages(60, criteria_page=40, toc_page=None))
+        orchestrator.run_protocol_pipeline(pdf)
+        first_run = sorted(pipeline_spy["extracted"])
+        pipeline_spy["extracted"].clear()
+
+        orchestrator.run_protocol_pipeline(pdf)
+
+        assert first_run and pipeline_spy["extracted"] == []
+        assert pipeline_spy["section"] == [40, 41]
+
+    def test_full_run_completes_partial_entry(self, make_pdf, pipeline_spy, monkeypatch):
+        pdf = make_pdf(_protocol_pages(30, criteria_page=20, toc_page=None))
+        orchestrator.run_protocol_pipeline(pdf)
+        first_run = set(pipeline_spy["extracted"])
+        pipeline_spy["extracted"].clear()
+        monkeypatch.setattr(settings, "locate_first", False)
+
+        orchestrator.run_protocol_pipeline(pdf)
+
+        assert set(pipeline_spy["extracted"]) == set(range(1, 31)) - first_run
@@ -0,0 +1,41 @@
+"""Unit tests for the BM25 page index."""
+
+from docu_flow.pipeline.retrieval import BM25Index, page_bm25, tokenize
+from docu_flow.schemas.pdf import PDFType, PageText, ParsedDocument
+
+
+def _pages(texts: list[str]) -> list[PageText]:
+    return [PageText(page_number=i + 1, text=t, char_count=len(t)) for i, t in enumerate(texts)]
+
+
+class TestBM25Index:
+    def test_ranks_by_term_rarity_and_frequency(self):
+        index = BM25Index.build(_pages([
+            "Patients receive the study drug daily.",
+            "Patients who are pregnant are excluded. Pregnant patients withdraw.",
+            "Patients attend weekly visits.",
+        ]))
+        ranked = index.search(tokenize("pregnant patients"))
+        assert ranked[0][0] == 2
+        assert {page for page, _ in ranked} == {1, 2, 3}
+
+    def test_unknown_terms_score_nothing(self):
+        index = BM25Index.build(_pages(["Alpha beta.", "Gamma delta."]))
+        assert index.search(["zeta"]) == []
+
+    def test_tokenize_drops_numbers_and_short_fragments(self):
+        assert tokenize("5.1 Age >= 18 YEARS, of ECOG") == ["age", "years", "ecog"]
+
+
+class TestPageBM25:
+    def test_memoised_and_rebuilt_when_pages_change(self):
+        doc = ParsedDocument(
+            source_filename="t.pdf", pdf_type=PDFType.TEXT, total_pages=3,
+            pages=_pages(["Alpha.", "Beta."]),
+        )
+        index = page_bm25(doc)
+        assert page_bm25(doc) is index
+
+        extended = doc.model_copy(update={"pages": _pages(["Alpha.", "Beta.", "Gamma."])})
+        assert page_bm25(extended).page_numbers == [1, 2, 3]
+        assert "bm25" not in doc.model_dump_json()
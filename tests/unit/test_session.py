@@ -0,0 +1,57 @@
+"""Unit tests for DocumentSession (builds tiny PDFs in memory with PyMuPDF)."""
+
+import fitz
+
+from docu_flow.pipeline.classifier import classify_pdf
+from docu_flow.pipeline.extractor import extract_text
+from docu_flow.pipeline.session import DocumentSession
+from docu_flow.schemas.pdf import PDFType, PageKind
+from docu_flow.utils.pdf_utils import pdf_sha256
+
+
+class TestDocumentSession:
+    def test_sha256_matches_file_hash(self, text_pdf):
+        with DocumentSession.open(text_pdf) as session:
+            assert session.sha256 == pdf_sha256(text_pdf)
+
+    def test_page_text_memoised(self, text_pdf):
+        with DocumentSession.open(text_pdf) as session:
+            first = session.page_text(0)
+            assert "Page 1" in first
+            assert session.page_text(0) is first
+
+    def test_classify_and_extract_share_session(self, text_pdf):
+        with DocumentSession.open(text_pdf) as session:
+            pdf_type = classify_pdf(text_pdf, session=session)
+            sampled = dict(session._page_text)
+            document = extract_text(text_pdf, pdf_type=pdf_type, session=session)
+
+            assert pdf_type == PDFType.TEXT
+            assert document.total_pages == 12
+            # Extraction reused the classifier's text rather than re-extracting it
+            for index, text in sampled.items():
+                assert session.page_text(index) is text
+            # The session is still usable after extraction
+            assert not session.doc.is_closed
+
+
+class TestPageKind:
+    def test_text_and_blank_pages(self, make_pdf):
+        pdf = make_pdf(["Native text " * 20, ""])
+        with DocumentSession.open(pdf) as session:
+            assert [session.page_kind(i) for i in range(2)] == [PageKind.TEXT, PageKind.IMAGE]
+            # Structural classification never pulls page text
+            assert session._page_text == {}
+
+    def test_full_page_image_with_text_is_text(self, tmp_path):
+        doc = fitz.open()
+        page = doc.new_page()
+        pix = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 50, 50), False)
+        pix.clear_with(200)
+        page.insert_image(page.rect, pixmap=pix)
+        page.insert_text((72, 72), "Stamp")
+        path = tmp_path / "mixed.pdf"
+        doc.save(str(path))
+
+        with DocumentSession.open(path) as session:
+            assert session.page_kind(0) == PageKind.TEXT  # its image blocks go to region OCR